@@ -8,12 +8,16 @@ import {IRentableHooks} from "./interfaces/IRentableHooks.sol";
 import {IORentableHooks} from "./interfaces/IORentableHooks.sol";
 import {IWRentableHooks} from "./interfaces/IWRentableHooks.sol";
 import {BaseSecurityInitializable} from "./security/BaseSecurityInitializable.sol";
-import {RentableStorageV1} from "./RentableStorageV1.sol";
+import {RentableStorageV2} from "./RentableStorageV2.sol";
 import {ReentrancyGuardUpgradeable} from "@openzeppelin/contracts-upgradeable/security/ReentrancyGuardUpgradeable.sol";
 
 // Libraries
 import {SafeERC20Upgradeable} from "@openzeppelin/contracts-upgradeable/token/ERC20/utils/SafeERC20Upgradeable.sol";
 import {Address} from "@openzeppelin/contracts/utils/Address.sol";
+import {SafeCastUpgradeable} from "@openzeppelin/contracts-upgradeable/utils/math/SafeCastUpgradeable.sol";
+import {ECDSAUpgradeable} from "@openzeppelin/contracts-upgradeable/utils/cryptography/ECDSAUpgradeable.sol";
+import {SignatureCheckerUpgradeable} from "@openzeppelin/contracts-upgradeable/utils/cryptography/SignatureCheckerUpgradeable.sol";
+import {ERC165CheckerUpgradeable} from "@openzeppelin/contracts-upgradeable/utils/introspection/ERC165CheckerUpgradeable.sol";
 
 // References
 import {IERC721Upgradeable} from "@openzeppelin/contracts-upgradeable/token/ERC721/IERC721Upgradeable.sol";
@@ -21,7 +25,11 @@ import {IERC20Upgradeable} from "@openzeppelin/contracts-upgradeable/token/ERC20
 import {IERC1155Upgradeable} from "@openzeppelin/contracts-upgradeable/token/ERC1155/IERC1155Upgradeable.sol";
 import {IERC721ReadOnlyProxy} from "./interfaces/IERC721ReadOnlyProxy.sol";
 import {IERC721ExistExtension} from "./interfaces/IERC721ExistExtension.sol";
+import {IERC721BatchOwnership} from "./interfaces/IERC721BatchOwnership.sol";
 import {ICollectionLibrary} from "./collections/ICollectionLibrary.sol";
+import {IUserRoleCollectionLibrary} from "./collections/IUserRoleCollectionLibrary.sol";
+import {IBatchCollectionLibrary} from "./collections/IBatchCollectionLibrary.sol";
+import {IERC4907} from "./interfaces/IERC4907.sol";
 
 import {IWalletFactory} from "./wallet/IWalletFactory.sol";
 import {SimpleWallet} from "./wallet/SimpleWallet.sol";
@@ -38,11 +46,12 @@ contract Rentable is
     IWRentableHooks,
     BaseSecurityInitializable,
     ReentrancyGuardUpgradeable,
-    RentableStorageV1
+    RentableStorageV2
 {
     /* ========== LIBRARIES ========== */
 
     using Address for address;
+    using SafeCastUpgradeable for uint256;
     using SafeERC20Upgradeable for IERC20Upgradeable;
 
     /* ========== MODIFIERS ========== */
@@ -86,6 +95,15 @@ contract Rentable is
         _;
     }
 
+    /// @dev Prevents calling a function from anyone except governance or collection factory
+    modifier onlyGovernanceOrCollectionFactory() {
+        require(
+            msg.sender == getGovernance() || msg.sender == _collectionFactory,
+            "Only Governance or Collection Factory"
+        );
+        _;
+    }
+
     /// @dev Prevents calling a library when not set for the respective wrapped token
     /// @param tokenAddress wrapped token address
     // slither-disable-next-line incorrect-modifier
@@ -126,7 +144,11 @@ contract Rentable is
 
     /* ========== SETTERS ========== */
 
-    /// @dev Associate the event hooks library to the specific wrapped token
+    /// @dev Associate the event hooks library to the specific wrapped token.
+    ///      Libraries supporting IUserRoleCollectionLibrary enable
+    ///      user role rentals for the collection, see IERC4907.
+    ///      Libraries supporting IBatchCollectionLibrary get batch hooks
+    ///      in rentBatch and expireRentals
     /// @param tokenAddress wrapped token address
     /// @param libraryAddress library address
     function setLibrary(address tokenAddress, address libraryAddress)
@@ -135,7 +157,29 @@ contract Rentable is
     {
         address previousValue = _libraries[tokenAddress];
 
+        bool userRole = libraryAddress != address(0) &&
+            ERC165CheckerUpgradeable.supportsInterface(
+                libraryAddress,
+                type(IUserRoleCollectionLibrary).interfaceId
+            );
+        if (userRole) {
+            require(
+                ERC165CheckerUpgradeable.supportsInterface(
+                    tokenAddress,
+                    type(IERC4907).interfaceId
+                ),
+                "Collection does not support user role"
+            );
+        }
+
         _libraries[tokenAddress] = libraryAddress;
+        _userRoleCollections[tokenAddress] = userRole;
+        _batchHookCollections[tokenAddress] =
+            libraryAddress != address(0) &&
+            ERC165CheckerUpgradeable.supportsInterface(
+                libraryAddress,
+                type(IBatchCollectionLibrary).interfaceId
+            );
 
         emit LibraryChanged(tokenAddress, previousValue, libraryAddress);
     }
@@ -145,7 +189,7 @@ contract Rentable is
     /// @param oRentable otoken address
     function setORentable(address tokenAddress, address oRentable)
         external
-        onlyGovernance
+        onlyGovernanceOrCollectionFactory
     {
         address previousValue = _orentables[tokenAddress];
 
@@ -159,7 +203,7 @@ contract Rentable is
     /// @param wRentable otoken address
     function setWRentable(address tokenAddress, address wRentable)
         external
-        onlyGovernance
+        onlyGovernanceOrCollectionFactory
     {
         address previousValue = _wrentables[tokenAddress];
 
@@ -180,6 +224,26 @@ contract Rentable is
         emit WalletFactoryChanged(previousWalletFactory, walletFactory);
     }
 
+    /// @dev Set collection factory, allowed to register o/w tokens for new
+    ///      collections along with governance. Libraries and proxy calls run
+    ///      code in Rentable context and stay governance only
+    /// @param collectionFactory collection factory address (0 to disable)
+    function setCollectionFactory(address collectionFactory)
+        external
+        onlyGovernance
+    {
+        address previousCollectionFactory = _collectionFactory;
+
+        // it's ok to set to 0x0, disabling factory
+        // slither-disable-next-line missing-zero-check
+        _collectionFactory = collectionFactory;
+
+        emit CollectionFactoryChanged(
+            previousCollectionFactory,
+            collectionFactory
+        );
+    }
+
     /// @dev Set fee (percentage)
     /// @param newFee fee in 1e4 units (e.g. 100% = 10000)
     function setFee(uint16 newFee) external onlyGovernance {
@@ -252,6 +316,21 @@ contract Rentable is
         );
     }
 
+    /// @dev Toggle accrual mode for a payment token, rental proceeds and fees
+    ///      are credited to internal balances to be claimed later instead of pushed on rent
+    /// @param paymentToken payment token address (0 for Ether)
+    /// @param enabled true to accrue, false to push
+    function setPaymentTokenAccrual(address paymentToken, bool enabled)
+        external
+        onlyGovernance
+    {
+        bool previousStatus = _paymentTokenAccrual[paymentToken];
+
+        _paymentTokenAccrual[paymentToken] = enabled;
+
+        emit PaymentTokenAccrualChanged(paymentToken, previousStatus, enabled);
+    }
+
     /// @dev Toggle o/w token to call on-behalf a selector on the wrapped token
     /// @param caller o/w token address
     /// @param selector selector bytes on the target wrapped token
@@ -273,6 +352,23 @@ contract Rentable is
         );
     }
 
+    /// @dev Apply many admin calls atomically (e.g. setters above), reverting all on the first failure
+    /// @param data encoded calls (selector + arguments) to this contract
+    /// @return results return data of every call, same order as data
+    function multicall(bytes[] calldata data)
+        external
+        onlyGovernance
+        returns (bytes[] memory results)
+    {
+        results = new bytes[](data.length);
+
+        for (uint256 i = 0; i < data.length; i++) {
+            // delegating to itself keeps governance as msg.sender of every call
+            // slither-disable-next-line calls-loop,delegatecall-loop
+            results[i] = address(this).functionDelegateCall(data[i]);
+        }
+    }
+
     /* ========== VIEWS ========== */
 
     /* ---------- Internal ---------- */
@@ -320,6 +416,107 @@ contract Rentable is
         return block.timestamp >= (_expiresAt[tokenAddress][tokenId]);
     }
 
+    /// @dev Get rental conditions, falling back to RentableStorageV1 layout for listings not migrated yet
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @return rc rental conditions see RentableTypes.RentalConditions
+    function _getRentalConditions(address tokenAddress, uint256 tokenId)
+        internal
+        view
+        returns (RentableTypes.RentalConditions memory rc)
+    {
+        RentableTypes.PackedRentalConditions
+            storage prc = _packedRentalConditions[tokenAddress][tokenId];
+
+        // check listing before reading the whole structure
+        if (prc.maxTimeDuration == 0) {
+            RentableTypes.RentalConditions storage legacyRc = _rentalConditions[
+                tokenAddress
+            ][tokenId];
+            if (legacyRc.maxTimeDuration != 0) {
+                return legacyRc;
+            }
+        }
+
+        rc = RentableTypes.RentalConditions({
+            minTimeDuration: prc.minTimeDuration,
+            maxTimeDuration: prc.maxTimeDuration,
+            pricePerSecond: prc.pricePerSecond,
+            paymentTokenId: prc.paymentTokenId,
+            paymentTokenAddress: prc.paymentTokenAddress,
+            privateRenter: prc.privateRenter
+        });
+    }
+
+    /// @dev EIP-712 domain separator, computed on the fly as Rentable is
+    ///      deployed behind a proxy
+    /// @return domain separator
+    function _domainSeparator() internal view returns (bytes32) {
+        return
+            keccak256(
+                abi.encode(
+                    EIP712_DOMAIN_TYPEHASH,
+                    keccak256(bytes(EIP712_NAME)),
+                    keccak256(bytes(EIP712_VERSION)),
+                    block.chainid,
+                    address(this)
+                )
+            );
+    }
+
+    /// @dev EIP-712 digest of a signed rental offer
+    /// @param offer rental offer
+    /// @return digest to be signed by the otoken owner
+    function _hashRentalOffer(RentableTypes.RentalOffer memory offer)
+        internal
+        view
+        returns (bytes32)
+    {
+        RentableTypes.RentalConditions memory rc = offer.conditions;
+        bytes32 conditionsHash = keccak256(
+            abi.encode(
+                RENTAL_CONDITIONS_TYPEHASH,
+                rc.minTimeDuration,
+                rc.maxTimeDuration,
+                rc.pricePerSecond,
+                rc.paymentTokenId,
+                rc.paymentTokenAddress,
+                rc.privateRenter
+            )
+        );
+
+        return
+            ECDSAUpgradeable.toTypedDataHash(
+                _domainSeparator(),
+                keccak256(
+                    abi.encode(
+                        RENTAL_OFFER_TYPEHASH,
+                        offer.tokenAddress,
+                        offer.tokenId,
+                        conditionsHash,
+                        offer.nonce,
+                        offer.deadline
+                    )
+                )
+            );
+    }
+
+    /// @dev Check an expiry queue entry still tracks a running or unsettled rental
+    /// @param entry expiry queue entry
+    /// @return true if not superseded by a newer rental nor already settled
+    // slither-disable-next-line calls-loop
+    function _isQueuedRental(RentableTypes.ExpiryEntry memory entry)
+        internal
+        view
+        returns (bool)
+    {
+        return
+            _expiresAt[entry.tokenAddress][entry.tokenId] == entry.expiresAt &&
+            IERC721ExistExtension(_wrentables[entry.tokenAddress]).exists(
+                entry.tokenId
+            );
+    }
+
     /* ---------- Public ---------- */
 
     /// @notice Get library address for the specific wrapped token
@@ -357,6 +554,12 @@ contract Rentable is
         return _walletFactory;
     }
 
+    /// @notice Get collection factory address
+    /// @return collection factory address
+    function getCollectionFactory() external view returns (address) {
+        return _collectionFactory;
+    }
+
     /// @notice Show current protocol fee
     /// @return protocol fee in 1e4 units, e.g. 100 = 1%
     function getFee() external view returns (uint16) {
@@ -380,6 +583,30 @@ contract Rentable is
         return _paymentTokenAllowlist[paymentTokenAddress];
     }
 
+    /// @notice Show a payment token is in accrual mode
+    /// @param paymentTokenAddress payment token address
+    /// @return true if proceeds are accrued, false if pushed on rent
+    function isPaymentTokenAccrual(address paymentTokenAddress)
+        external
+        view
+        returns (bool)
+    {
+        return _paymentTokenAccrual[paymentTokenAddress];
+    }
+
+    /// @notice Show accrued balance to be claimed
+    /// @param account rentee or fee collector
+    /// @param paymentTokenAddress payment token address
+    /// @param paymentTokenId payment token id (0 for ETH and ERC20)
+    /// @return claimable amount in payment token units
+    function claimable(
+        address account,
+        address paymentTokenAddress,
+        uint256 paymentTokenId
+    ) external view returns (uint256) {
+        return _accruedBalances[account][paymentTokenAddress][paymentTokenId];
+    }
+
     /// @notice Show O/W Token can invoke selector on respective wrapped token
     /// @param caller O/W Token address
     /// @param selector function selector to invoke
@@ -409,7 +636,7 @@ contract Rentable is
         override
         returns (RentableTypes.RentalConditions memory)
     {
-        return _rentalConditions[tokenAddress][tokenId];
+        return _getRentalConditions(tokenAddress, tokenId);
     }
 
     /// @inheritdoc IRentable
@@ -432,6 +659,137 @@ contract Rentable is
         return _isExpired(tokenAddress, tokenId);
     }
 
+    /// @inheritdoc IRentable
+    function isExpiredBatch(address tokenAddress, uint256[] calldata tokenIds)
+        external
+        view
+        override
+        returns (bool[] memory expired)
+    {
+        expired = new bool[](tokenIds.length);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            expired[i] = _isExpired(tokenAddress, tokenIds[i]);
+        }
+    }
+
+    /// @notice Rental snapshot of many tokens of the same collection,
+    ///         e.g. to render an inventory with a single call
+    /// @dev Two external calls in total, to otoken and wtoken
+    /// @param tokenAddress wrapped token address
+    /// @param tokenIds wrapped token ids
+    /// @return states rental state of every token, same order as tokenIds
+    function rentalStates(address tokenAddress, uint256[] calldata tokenIds)
+        external
+        view
+        returns (RentableTypes.RentalState[] memory states)
+    {
+        address[] memory rentees = IERC721BatchOwnership(
+            _getExistingORentable(tokenAddress)
+        ).ownersOf(tokenIds, true);
+        address[] memory renters = IERC721BatchOwnership(
+            _wrentables[tokenAddress]
+        ).ownersOf(tokenIds, true);
+
+        states = new RentableTypes.RentalState[](tokenIds.length);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            RentableTypes.RentalState memory state = states[i];
+            state.conditions = _getRentalConditions(tokenAddress, tokenIds[i]);
+            state.expiresAt = _expiresAt[tokenAddress][tokenIds[i]];
+            state.expired = _isExpired(tokenAddress, tokenIds[i]);
+            state.rentee = rentees[i];
+            // wtoken is burnt lazily, an expired rental has no renter
+            if (!state.expired) {
+                state.renter = renters[i];
+            }
+        }
+    }
+
+    /// @notice Show if rentals of a collection assign the ERC-4907 user role
+    ///         instead of moving the token to the renter wallet
+    /// @param tokenAddress wrapped token address
+    /// @return true for user role rentals
+    function isUserRoleCollection(address tokenAddress)
+        external
+        view
+        returns (bool)
+    {
+        return _userRoleCollections[tokenAddress];
+    }
+
+    /// @notice Page through the expiry queue, oldest bucket first
+    /// @dev Superseded or settled entries are skipped but count towards limit,
+    ///      as empty buckets do
+    /// @param cursor position to start from, 0 for the queue head
+    /// @param limit max queue steps
+    /// @return entries rentals pending settlement, due or not
+    /// @return nextCursor cursor of the next page, 0 at the end of the queue
+    function pendingExpirations(uint256 cursor, uint256 limit)
+        external
+        view
+        returns (RentableTypes.ExpiryEntry[] memory entries, uint256 nextCursor)
+    {
+        // cursor = bucket << 64 | index
+        uint256 bucket = cursor == 0 ? _expiryHeadBucket : cursor >> 64;
+        uint256 index = cursor == 0 ? _expiryHeadIndex : uint64(cursor);
+        uint256 tail = _expiryTailBucket;
+
+        RentableTypes.ExpiryEntry[]
+            memory found = new RentableTypes.ExpiryEntry[](limit);
+        uint256 count;
+
+        for (uint256 steps = 0; steps < limit && bucket <= tail; steps++) {
+            RentableTypes.ExpiryEntry[] storage bucketEntries = _expiryQueue[
+                bucket
+            ];
+            if (index >= bucketEntries.length) {
+                bucket++;
+                index = 0;
+                continue;
+            }
+
+            RentableTypes.ExpiryEntry memory entry = bucketEntries[index++];
+            if (_isQueuedRental(entry)) {
+                found[count++] = entry;
+            }
+        }
+
+        entries = new RentableTypes.ExpiryEntry[](count);
+        for (uint256 i = 0; i < count; i++) {
+            entries[i] = found[i];
+        }
+
+        nextCursor = bucket > tail ? 0 : (bucket << 64) | index;
+    }
+
+    /// @notice Show EIP-712 domain separator used by signed rental offers
+    /// @return domain separator
+    function domainSeparator() external view returns (bytes32) {
+        return _domainSeparator();
+    }
+
+    /// @notice Show EIP-712 digest to sign for a rental offer
+    /// @param offer rental offer
+    /// @return digest
+    function hashRentalOffer(RentableTypes.RentalOffer calldata offer)
+        external
+        view
+        returns (bytes32)
+    {
+        return _hashRentalOffer(offer);
+    }
+
+    /// @notice Show if a rental offer nonce has been cancelled by the signer
+    /// @param signer offer signer (otoken owner)
+    /// @param nonce offer nonce
+    /// @return true when cancelled
+    function isRentalOfferCancelled(address signer, uint256 nonce)
+        external
+        view
+        returns (bool)
+    {
+        return _cancelledRentalOffers[signer][nonce];
+    }
+
     /* ========== MUTATIVE FUNCTIONS ========== */
 
     /* ---------- Internal ---------- */
@@ -538,7 +896,20 @@ contract Rentable is
             "Minimum duration cannot be greater than maximum"
         );
 
-        _rentalConditions[tokenAddress][tokenId] = rc;
+        _packedRentalConditions[tokenAddress][tokenId] = RentableTypes
+            .PackedRentalConditions({
+                paymentTokenAddress: rc.paymentTokenAddress,
+                minTimeDuration: rc.minTimeDuration.toUint64(),
+                privateRenter: rc.privateRenter,
+                maxTimeDuration: rc.maxTimeDuration.toUint64(),
+                pricePerSecond: rc.pricePerSecond.toUint128(),
+                paymentTokenId: rc.paymentTokenId
+            });
+
+        // lazy migration: drop listing stored with RentableStorageV1 layout
+        if (_rentalConditions[tokenAddress][tokenId].maxTimeDuration != 0) {
+            delete _rentalConditions[tokenAddress][tokenId];
+        }
 
         _postList(
             tokenAddress,
@@ -568,7 +939,14 @@ contract Rentable is
         internal
     {
         // save gas instead of dropping all the structure
-        (_rentalConditions[tokenAddress][tokenId]).maxTimeDuration = 0;
+        RentableTypes.PackedRentalConditions
+            storage prc = _packedRentalConditions[tokenAddress][tokenId];
+        if (prc.maxTimeDuration != 0) {
+            prc.maxTimeDuration = 0;
+        } else {
+            // not migrated yet
+            (_rentalConditions[tokenAddress][tokenId]).maxTimeDuration = 0;
+        }
     }
 
     /// @dev Expire explicitely rental and update data structures for a specific wrapped token
@@ -578,7 +956,6 @@ contract Rentable is
     /// @param tokenId wrapped token id
     /// @param skipExistCheck assume or not wtoken id exists (gas optimization)
     /// @return currentlyRented true if rental is not expired
-    // slither-disable-next-line calls-loop
     function _expireRental(
         address currentUserHolder,
         address oTokenOwner,
@@ -586,49 +963,198 @@ contract Rentable is
         uint256 tokenId,
         bool skipExistCheck
     ) internal returns (bool currentlyRented) {
+        address currentRentee;
+        (currentlyRented, currentRentee, ) = _settleRental(
+            currentUserHolder,
+            oTokenOwner,
+            tokenAddress,
+            tokenId,
+            skipExistCheck,
+            false
+        );
+
+        if (currentRentee != address(0)) {
+            // post
+            _postExpireRental(tokenAddress, tokenId, currentRentee);
+            emit RentEnds(tokenAddress, tokenId);
+        }
+    }
+
+    /// @dev Settle an expired rental, library hook excluded, see _expireRental
+    /// @param currentUserHolder (optional) current user holder address
+    /// @param oTokenOwner (optional) otoken owner address
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @param skipExistCheck assume or not wtoken id exists (gas optimization)
+    /// @param deferRecovery leave the recovery from the renter wallet to the caller
+    /// @return currentlyRented true if rental is not expired
+    /// @return currentRentee otoken owner when settled now, 0x0 otw
+    /// @return renterWallet wallet to recover the token from when deferred, 0x0 otw
+    // slither-disable-next-line calls-loop
+    function _settleRental(
+        address currentUserHolder,
+        address oTokenOwner,
+        address tokenAddress,
+        uint256 tokenId,
+        bool skipExistCheck,
+        bool deferRecovery
+    )
+        internal
+        returns (
+            bool currentlyRented,
+            address currentRentee,
+            address payable renterWallet
+        )
+    {
         if (
             skipExistCheck ||
             IERC721ExistExtension(_wrentables[tokenAddress]).exists(tokenId)
         ) {
             if (_isExpired(tokenAddress, tokenId)) {
-                address currentRentee = oTokenOwner == address(0)
+                currentRentee = oTokenOwner == address(0)
                     ? IERC721Upgradeable(_orentables[tokenAddress]).ownerOf(
                         tokenId
                     )
                     : oTokenOwner;
 
-                // recover asset from renter smart wallet to rentable contracts
-                address wRentable = _wrentables[tokenAddress];
-                // cannot be 0x0 because transferFrom avoid it
-                address renter = currentUserHolder == address(0)
-                    ? IERC721ExistExtension(wRentable).ownerOf(tokenId, true)
-                    : currentUserHolder;
-                address payable renterWallet = _wallets[renter];
-                // slither-disable-next-line unused-return
-                SimpleWallet(renterWallet).execute(
-                    tokenAddress,
-                    0,
-                    abi.encodeWithSelector(
-                        IERC721Upgradeable.transferFrom.selector, // we don't want to trigger onERC721Receiver
-                        renterWallet,
-                        address(this),
-                        tokenId
-                    ),
-                    false
-                );
+                // recover asset from renter smart wallet to rentable contracts,
+                // user role rentals keep it here and the role lapses by itself.
+                // Ownership is checked rather than the collection mode
+                // to settle rentals started before a library change
+                if (
+                    IERC721Upgradeable(tokenAddress).ownerOf(tokenId) !=
+                    address(this)
+                ) {
+                    // cannot be 0x0 because transferFrom avoid it
+                    address renter = currentUserHolder == address(0)
+                        ? IERC721ExistExtension(_wrentables[tokenAddress])
+                            .ownerOf(tokenId, true)
+                        : currentUserHolder;
+                    renterWallet = _wallets[renter];
+                    if (!deferRecovery) {
+                        _recoverFromWallet(renterWallet, tokenAddress, tokenId);
+                        renterWallet = payable(address(0));
+                    }
+                }
 
                 // burn
                 IERC721ReadOnlyProxy(_wrentables[tokenAddress]).burn(tokenId);
-
-                // post
-                _postExpireRental(tokenAddress, tokenId, currentRentee);
-                emit RentEnds(tokenAddress, tokenId);
             } else {
                 currentlyRented = true;
             }
         }
 
-        return currentlyRented;
+        return (currentlyRented, currentRentee, renterWallet);
+    }
+
+    /// @dev Move a wrapped token back from a renter wallet
+    /// @param renterWallet renter wallet
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    // slither-disable-next-line calls-loop
+    function _recoverFromWallet(
+        address payable renterWallet,
+        address tokenAddress,
+        uint256 tokenId
+    ) internal {
+        // slither-disable-next-line unused-return
+        SimpleWallet(renterWallet).execute(
+            tokenAddress,
+            0,
+            abi.encodeWithSelector(
+                IERC721Upgradeable.transferFrom.selector, // we don't want to trigger onERC721Receiver
+                renterWallet,
+                address(this),
+                tokenId
+            ),
+            false
+        );
+    }
+
+    /// @dev Move wrapped tokens back from renter wallets,
+    ///      a single wallet call per run of tokens in the same wallet
+    /// @param tokenAddresses wrapped token addresses
+    /// @param tokenIds wrapped token ids
+    /// @param renterWallets wallet holding each token, 0x0 to skip
+    // slither-disable-next-line calls-loop
+    function _recoverFromWallets(
+        address[] calldata tokenAddresses,
+        uint256[] calldata tokenIds,
+        address payable[] memory renterWallets
+    ) internal {
+        uint256 start = 0;
+        while (start < renterWallets.length) {
+            address payable renterWallet = renterWallets[start];
+            uint256 end = start + 1;
+            while (
+                end < renterWallets.length && renterWallets[end] == renterWallet
+            ) {
+                end++;
+            }
+
+            if (renterWallet == address(0)) {
+                // nothing to recover
+            } else if (end - start == 1) {
+                _recoverFromWallet(
+                    renterWallet,
+                    tokenAddresses[start],
+                    tokenIds[start]
+                );
+            } else {
+                uint256 length = end - start;
+                address[] memory to = new address[](length);
+                bytes[] memory data = new bytes[](length);
+                for (uint256 i = 0; i < length; i++) {
+                    to[i] = tokenAddresses[start + i];
+                    data[i] = abi.encodeWithSelector(
+                        IERC721Upgradeable.transferFrom.selector,
+                        renterWallet,
+                        address(this),
+                        tokenIds[start + i]
+                    );
+                }
+
+                // slither-disable-next-line unused-return
+                SimpleWallet(renterWallet).executeBatch(
+                    to,
+                    new uint256[](length),
+                    data,
+                    new bool[](length)
+                );
+            }
+
+            start = end;
+        }
+    }
+
+    /// @dev Schedule a rental in the expiry queue, see expireDue
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @param eta rental expiration
+    function _enqueueExpiry(
+        address tokenAddress,
+        uint256 tokenId,
+        uint256 eta
+    ) internal {
+        uint64 bucket = (eta / EXPIRY_BUCKET_SIZE).toUint64();
+        _expiryQueue[bucket].push(
+            RentableTypes.ExpiryEntry({
+                tokenAddress: tokenAddress,
+                expiresAt: eta.toUint96(),
+                tokenId: tokenId
+            })
+        );
+
+        // first entry ever or earlier than the unprocessed ones,
+        // buckets in between are empty as nothing was due there yet
+        uint64 headBucket = _expiryHeadBucket;
+        if (headBucket == 0 || bucket < headBucket) {
+            _expiryHeadBucket = bucket;
+            _expiryHeadIndex = 0;
+        }
+        if (bucket > _expiryTailBucket) {
+            _expiryTailBucket = bucket;
+        }
     }
 
     /// @dev Execute custom logic after deposit via wrapped token library
@@ -733,43 +1259,564 @@ contract Rentable is
         );
     }
 
-    /* ---------- Public ---------- */
+    /// @dev Execute custom logic after rentals via batch aware library
+    /// @param tokenAddress wrapped token address
+    /// @param tokenIds wrapped token ids, only the first `length` are used
+    /// @param length number of rentals
+    /// @param to renter
+    function _postRentBatch(
+        address tokenAddress,
+        uint256[] memory tokenIds,
+        uint256 length,
+        address to
+    ) internal {
+        uint256[] memory batchTokenIds = new uint256[](length);
+        for (uint256 i = 0; i < length; i++) {
+            batchTokenIds[i] = tokenIds[i];
+        }
 
-    /// @inheritdoc IRentable
-    function createWalletForUser(address user)
-        external
-        override
-        returns (address payable wallet)
-    {
-        require(
-            user != address(0),
-            "Cannot create a smart wallet for the void"
+        // slither-disable-next-line unused-return
+        _libraries[tokenAddress].functionDelegateCall(
+            abi.encodeWithSelector(
+                IBatchCollectionLibrary.postRentBatch.selector,
+                tokenAddress,
+                batchTokenIds,
+                to,
+                _wallets[to]
+            ),
+            ""
         );
-
-        require(_wallets[user] == address(0), "Wallet already existing");
-
-        return _createWalletForUser(user);
     }
 
-    /// @inheritdoc IRentable
-    function onERC721Received(
-        address,
-        address from,
-        uint256 tokenId,
-        bytes calldata data
-    ) external override whenNotPaused nonReentrant returns (bytes4) {
-        if (data.length == 0) {
-            _deposit(msg.sender, tokenId, from);
-        } else {
-            _depositAndList(
-                msg.sender,
-                tokenId,
-                from,
-                abi.decode(data, (RentableTypes.RentalConditions))
-            );
+    /// @dev Execute custom logic after expirations via batch aware library
+    /// @param tokenAddress wrapped token address
+    /// @param tokenIds wrapped token ids, only the first `length` are used
+    /// @param froms rentees, only the first `length` are used
+    /// @param length number of expirations
+    function _postExpireRentalBatch(
+        address tokenAddress,
+        uint256[] memory tokenIds,
+        address[] memory froms,
+        uint256 length
+    ) internal {
+        uint256[] memory batchTokenIds = new uint256[](length);
+        address[] memory batchFroms = new address[](length);
+        for (uint256 i = 0; i < length; i++) {
+            batchTokenIds[i] = tokenIds[i];
+            batchFroms[i] = froms[i];
         }
 
-        return this.onERC721Received.selector;
+        // slither-disable-next-line unused-return
+        _libraries[tokenAddress].functionDelegateCall(
+            abi.encodeWithSelector(
+                IBatchCollectionLibrary.postExpireRentalBatch.selector,
+                tokenAddress,
+                batchTokenIds,
+                batchFroms
+            ),
+            ""
+        );
+    }
+
+    /// @dev Execute custom logic after many rentals expire, see expireRentals
+    /// @param tokenAddresses wrapped token addresses
+    /// @param tokenIds wrapped token ids
+    /// @param rentees rentee of each token settled, 0x0 to skip
+    // slither-disable-next-line calls-loop
+    function _postExpireRentals(
+        address[] calldata tokenAddresses,
+        uint256[] calldata tokenIds,
+        address[] memory rentees
+    ) internal {
+        // expired tokens waiting for a batch hook
+        uint256[] memory hookTokenIds = new uint256[](tokenIds.length);
+        address[] memory hookFroms = new address[](tokenIds.length);
+        uint256 hookLength;
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            address tokenAddress = tokenAddresses[i];
+
+            if (rentees[i] != address(0)) {
+                if (_batchHookCollections[tokenAddress]) {
+                    hookTokenIds[hookLength] = tokenIds[i];
+                    hookFroms[hookLength++] = rentees[i];
+                } else {
+                    _postExpireRental(tokenAddress, tokenIds[i], rentees[i]);
+                }
+                emit RentEnds(tokenAddress, tokenIds[i]);
+            }
+
+            if (
+                hookLength > 0 &&
+                (i + 1 == tokenIds.length ||
+                    tokenAddresses[i + 1] != tokenAddress)
+            ) {
+                _postExpireRentalBatch(
+                    tokenAddress,
+                    hookTokenIds,
+                    hookFroms,
+                    hookLength
+                );
+                hookLength = 0;
+            }
+        }
+    }
+
+    /// @dev Rent under the stored rental conditions, see _startRental
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @param duration rental duration
+    /// @param skipPostRent leave the library hook to the caller
+    /// @return rentee current otoken owner
+    /// @return rcs rental conditions applied
+    function _rent(
+        address tokenAddress,
+        uint256 tokenId,
+        uint256 duration,
+        bool skipPostRent
+    )
+        internal
+        returns (
+            address payable rentee,
+            RentableTypes.RentalConditions memory rcs
+        )
+    {
+        address oRentable = _getExistingORentable(tokenAddress);
+        rentee = payable(IERC721Upgradeable(oRentable).ownerOf(tokenId));
+
+        rcs = _getRentalConditions(tokenAddress, tokenId);
+
+        _startRental(
+            tokenAddress,
+            tokenId,
+            duration,
+            rentee,
+            rcs,
+            skipPostRent
+        );
+    }
+
+    /// @dev Validate rental conditions, then mint wtoken and move the wrapped token
+    ///      to the renter wallet (user role collections: assign the user role).
+    ///      Payment is left to the caller.
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @param duration rental duration
+    /// @param rentee current otoken owner
+    /// @param rcs rental conditions to apply
+    /// @param skipPostRent leave the library hook to the caller
+    function _startRental(
+        address tokenAddress,
+        uint256 tokenId,
+        uint256 duration,
+        address rentee,
+        RentableTypes.RentalConditions memory rcs,
+        bool skipPostRent
+    ) internal {
+        // 1. check token is available for rental
+        require(rcs.maxTimeDuration > 0, "Not available");
+
+        require(
+            !_expireRental(address(0), rentee, tokenAddress, tokenId, false),
+            "Current rent still pending"
+        );
+
+        // 2. validate renter offer with rentee conditions
+        require(duration > 0, "Duration cannot be zero");
+
+        require(
+            duration >= rcs.minTimeDuration,
+            "Duration lower than conditions"
+        );
+
+        require(
+            duration <= rcs.maxTimeDuration,
+            "Duration greater than conditions"
+        );
+
+        require(
+            rcs.privateRenter == address(0) || rcs.privateRenter == msg.sender,
+            "Rental reserved for another user"
+        );
+
+        // 3. mint wtoken
+        uint256 eta = block.timestamp + duration;
+        _expiresAt[tokenAddress][tokenId] = eta;
+        _enqueueExpiry(tokenAddress, tokenId, eta);
+        IERC721ReadOnlyProxy(_wrentables[tokenAddress]).mint(
+            msg.sender,
+            tokenId
+        );
+
+        // 4. transfer token to the renter smart wallet,
+        //    user role collections keep it here and only assign the user
+        address payable renterWallet;
+        if (_userRoleCollections[tokenAddress]) {
+            IERC4907(tokenAddress).setUser(tokenId, msg.sender, eta.toUint64());
+        } else {
+            renterWallet = _getOrCreateWalletForUser(msg.sender);
+            IERC721Upgradeable(tokenAddress).safeTransferFrom(
+                address(this),
+                renterWallet,
+                tokenId,
+                ""
+            );
+        }
+
+        // 5. after rent custom logic
+        if (!skipPostRent) {
+            _postRent(
+                tokenAddress,
+                tokenId,
+                duration,
+                rentee,
+                msg.sender,
+                renterWallet
+            );
+        }
+
+        emit Rent(
+            rentee,
+            msg.sender,
+            tokenAddress,
+            tokenId,
+            rcs.paymentTokenAddress,
+            rcs.paymentTokenId,
+            eta
+        );
+    }
+
+    /// @dev Transfer payment from the renter, Ether is taken from msg.value
+    /// @param paymentTokenAddress payment token address (0 for Ether)
+    /// @param paymentTokenId payment token id (ERC1155 only)
+    /// @param to payee
+    /// @param amount payment token units
+    function _transferPayment(
+        address paymentTokenAddress,
+        uint256 paymentTokenId,
+        address payable to,
+        uint256 amount
+    ) internal {
+        if (paymentTokenAddress == address(0)) {
+            Address.sendValue(to, amount);
+        } else if (_paymentTokenAllowlist[paymentTokenAddress] == ERC20_TOKEN) {
+            IERC20Upgradeable(paymentTokenAddress).safeTransferFrom(
+                msg.sender,
+                to,
+                amount
+            );
+        } else {
+            IERC1155Upgradeable(paymentTokenAddress).safeTransferFrom(
+                msg.sender,
+                to,
+                paymentTokenId,
+                amount,
+                ""
+            );
+        }
+    }
+
+    /// @dev Pull payment from the renter to Rentable, Ether is already received with msg.value
+    /// @param paymentTokenAddress payment token address (0 for Ether)
+    /// @param paymentTokenId payment token id (ERC1155 only)
+    /// @param amount payment token units
+    function _collectPayment(
+        address paymentTokenAddress,
+        uint256 paymentTokenId,
+        uint256 amount
+    ) internal {
+        if (paymentTokenAddress == address(0)) {
+            return;
+        }
+
+        if (_paymentTokenAllowlist[paymentTokenAddress] == ERC20_TOKEN) {
+            IERC20Upgradeable(paymentTokenAddress).safeTransferFrom(
+                msg.sender,
+                address(this),
+                amount
+            );
+        } else {
+            IERC1155Upgradeable(paymentTokenAddress).safeTransferFrom(
+                msg.sender,
+                address(this),
+                paymentTokenId,
+                amount,
+                ""
+            );
+        }
+    }
+
+    /// @dev Credit an account balance, to be claimed later
+    /// @param account rentee or fee collector
+    /// @param paymentTokenAddress payment token address (0 for Ether)
+    /// @param paymentTokenId payment token id (ERC1155 only)
+    /// @param amount payment token units
+    function _accrue(
+        address account,
+        address paymentTokenAddress,
+        uint256 paymentTokenId,
+        uint256 amount
+    ) internal {
+        if (amount > 0) {
+            _accruedBalances[account][paymentTokenAddress][
+                paymentTokenId
+            ] += amount;
+
+            if (
+                paymentTokenAddress != address(0) &&
+                _accruedPaymentTokenTypes[paymentTokenAddress] ==
+                NOT_ALLOWED_TOKEN
+            ) {
+                _accruedPaymentTokenTypes[
+                    paymentTokenAddress
+                ] = _paymentTokenAllowlist[paymentTokenAddress];
+            }
+        }
+    }
+
+    /// @dev Add a settlement, merging it with an existing one for the same payment token and payee
+    /// @param settlements pending settlements
+    /// @param count pending settlements in use
+    /// @param paymentTokenAddress payment token address
+    /// @param paymentTokenId payment token id
+    /// @param payee payee
+    /// @param amount payment token units
+    /// @return pending settlements in use after the add
+    function _addSettlement(
+        RentableTypes.PaymentSettlement[] memory settlements,
+        uint256 count,
+        address paymentTokenAddress,
+        uint256 paymentTokenId,
+        address payable payee,
+        uint256 amount
+    ) internal pure returns (uint256) {
+        if (amount == 0) {
+            return count;
+        }
+
+        for (uint256 i = 0; i < count; i++) {
+            RentableTypes.PaymentSettlement memory settlement = settlements[i];
+            if (
+                settlement.payee == payee &&
+                settlement.paymentTokenAddress == paymentTokenAddress &&
+                settlement.paymentTokenId == paymentTokenId
+            ) {
+                settlement.amount += amount;
+                return count;
+            }
+        }
+
+        settlements[count] = RentableTypes.PaymentSettlement({
+            paymentTokenAddress: paymentTokenAddress,
+            paymentTokenId: paymentTokenId,
+            payee: payee,
+            amount: amount
+        });
+
+        return count + 1;
+    }
+
+    /// @dev Split a rental payment between protocol and rentee into pending settlements.
+    ///      In accrual mode shares are credited and a pull to Rentable (payee) is pending instead.
+    /// @param settlements pending settlements
+    /// @param count pending settlements in use
+    /// @param rcs rental conditions applied
+    /// @param rentee rentee
+    /// @param paymentQty gross due amount
+    /// @return pending settlements in use after the split
+    function _accountPayment(
+        RentableTypes.PaymentSettlement[] memory settlements,
+        uint256 count,
+        RentableTypes.RentalConditions memory rcs,
+        address payable rentee,
+        uint256 paymentQty
+    ) internal returns (uint256) {
+        // fees computed per rental, as in a single rent
+        uint256 feesForFeeCollector = (paymentQty * _fee) / BASE_FEE;
+
+        if (_paymentTokenAccrual[rcs.paymentTokenAddress]) {
+            _accrue(
+                _feeCollector,
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                feesForFeeCollector
+            );
+            _accrue(
+                rentee,
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                paymentQty - feesForFeeCollector
+            );
+
+            return
+                _addSettlement(
+                    settlements,
+                    count,
+                    rcs.paymentTokenAddress,
+                    rcs.paymentTokenId,
+                    payable(address(this)),
+                    paymentQty
+                );
+        }
+
+        count = _addSettlement(
+            settlements,
+            count,
+            rcs.paymentTokenAddress,
+            rcs.paymentTokenId,
+            _feeCollector,
+            feesForFeeCollector
+        );
+
+        return
+            _addSettlement(
+                settlements,
+                count,
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                rentee,
+                paymentQty - feesForFeeCollector
+            );
+    }
+
+    /// @dev Execute pending settlements
+    /// @param settlements pending settlements
+    /// @param count pending settlements in use
+    /// @return ethQty Ether due by the renter
+    function _settlePayments(
+        RentableTypes.PaymentSettlement[] memory settlements,
+        uint256 count
+    ) internal returns (uint256 ethQty) {
+        for (uint256 i = 0; i < count; i++) {
+            if (settlements[i].paymentTokenAddress == address(0)) {
+                ethQty += settlements[i].amount;
+            }
+        }
+
+        require(msg.value >= ethQty, "Not enough funds");
+
+        for (uint256 i = 0; i < count; i++) {
+            if (settlements[i].payee == address(this)) {
+                // slither-disable-next-line calls-loop
+                _collectPayment(
+                    settlements[i].paymentTokenAddress,
+                    settlements[i].paymentTokenId,
+                    settlements[i].amount
+                );
+            } else {
+                // slither-disable-next-line calls-loop
+                _transferPayment(
+                    settlements[i].paymentTokenAddress,
+                    settlements[i].paymentTokenId,
+                    settlements[i].payee,
+                    settlements[i].amount
+                );
+            }
+        }
+    }
+
+    /// @dev Pay a rental under the given conditions, pushing or accruing the shares.
+    ///      Ether is taken from msg.value and the remaining refunded
+    /// @param rentee current otoken owner
+    /// @param rcs rental conditions applied
+    /// @param duration paid duration
+    function _payRental(
+        address payable rentee,
+        RentableTypes.RentalConditions memory rcs,
+        uint256 duration
+    ) internal {
+        // fees distribution
+        // gross due amount
+        uint256 paymentQty = rcs.pricePerSecond * duration;
+        // protocol and rentee fees calc
+        uint256 feesForFeeCollector = (paymentQty * _fee) / BASE_FEE;
+        uint256 feesForRentee = paymentQty - feesForFeeCollector;
+
+        if (rcs.paymentTokenAddress == address(0)) {
+            require(msg.value >= paymentQty, "Not enough funds");
+        }
+
+        if (_paymentTokenAccrual[rcs.paymentTokenAddress]) {
+            // single pull, shares are claimed later
+            _collectPayment(
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                paymentQty
+            );
+
+            _accrue(
+                _feeCollector,
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                feesForFeeCollector
+            );
+            _accrue(
+                rentee,
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                feesForRentee
+            );
+        } else {
+            if (feesForFeeCollector > 0) {
+                _transferPayment(
+                    rcs.paymentTokenAddress,
+                    rcs.paymentTokenId,
+                    _feeCollector,
+                    feesForFeeCollector
+                );
+            }
+
+            _transferPayment(
+                rcs.paymentTokenAddress,
+                rcs.paymentTokenId,
+                rentee,
+                feesForRentee
+            );
+        }
+
+        // refund eventual remaining
+        if (rcs.paymentTokenAddress == address(0) && msg.value > paymentQty) {
+            Address.sendValue(payable(msg.sender), msg.value - paymentQty);
+        }
+    }
+
+    /* ---------- Public ---------- */
+
+    /// @inheritdoc IRentable
+    function createWalletForUser(address user)
+        external
+        override
+        returns (address payable wallet)
+    {
+        require(
+            user != address(0),
+            "Cannot create a smart wallet for the void"
+        );
+
+        require(_wallets[user] == address(0), "Wallet already existing");
+
+        return _createWalletForUser(user);
+    }
+
+    /// @inheritdoc IRentable
+    function onERC721Received(
+        address,
+        address from,
+        uint256 tokenId,
+        bytes calldata data
+    ) external override whenNotPaused nonReentrant returns (bytes4) {
+        if (data.length == 0) {
+            _deposit(msg.sender, tokenId, from);
+        } else {
+            _depositAndList(
+                msg.sender,
+                tokenId,
+                from,
+                abi.decode(data, (RentableTypes.RentalConditions))
+            );
+        }
+
+        return this.onERC721Received.selector;
     }
 
     /// @inheritdoc IRentable
@@ -829,32 +1876,127 @@ contract Rentable is
         uint256 tokenId,
         uint256 duration
     ) external payable override whenNotPaused nonReentrant {
-        // 1. check token is deposited and available for rental
-        address oRentable = _getExistingORentable(tokenAddress);
-        address payable rentee = payable(
-            IERC721Upgradeable(oRentable).ownerOf(tokenId)
-        );
+        (
+            address payable rentee,
+            RentableTypes.RentalConditions memory rcs
+        ) = _rent(tokenAddress, tokenId, duration, false);
 
-        RentableTypes.RentalConditions memory rcs = _rentalConditions[
-            tokenAddress
-        ][tokenId];
-        require(rcs.maxTimeDuration > 0, "Not available");
+        _payRental(rentee, rcs, duration);
+    }
 
+    /// @notice Batch rent, payments are settled once per payment token and payee
+    /// @dev Batch aware libraries (IBatchCollectionLibrary) get a single hook
+    ///      per run of consecutive tokens of the same collection
+    /// @param tokenAddresses array of wrapped token addresses
+    /// @param tokenIds array of wrapped token id
+    /// @param durations array of durations in seconds
+    function rentBatch(
+        address[] calldata tokenAddresses,
+        uint256[] calldata tokenIds,
+        uint256[] calldata durations
+    ) external payable whenNotPaused nonReentrant {
         require(
-            !_expireRental(address(0), rentee, tokenAddress, tokenId, false),
-            "Current rent still pending"
+            tokenAddresses.length == tokenIds.length &&
+                tokenIds.length == durations.length,
+            "Array length mismatch"
         );
 
-        // 2. validate renter offer with rentee conditions
-        require(duration > 0, "Duration cannot be zero");
+        // at most a rentee payout and a protocol fee per item
+        RentableTypes.PaymentSettlement[]
+            memory settlements = new RentableTypes.PaymentSettlement[](
+                tokenIds.length * 2
+            );
+        uint256 settlementsCount;
+
+        // tokens waiting for a batch hook
+        uint256[] memory hookTokenIds = new uint256[](tokenIds.length);
+        uint256 hookLength;
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            bool batchHook = _batchHookCollections[tokenAddresses[i]];
+
+            {
+                (
+                    address payable rentee,
+                    RentableTypes.RentalConditions memory rcs
+                ) = _rent(
+                        tokenAddresses[i],
+                        tokenIds[i],
+                        durations[i],
+                        batchHook
+                    );
+
+                settlementsCount = _accountPayment(
+                    settlements,
+                    settlementsCount,
+                    rcs,
+                    rentee,
+                    rcs.pricePerSecond * durations[i]
+                );
+            }
+
+            if (batchHook) {
+                hookTokenIds[hookLength++] = tokenIds[i];
+                if (
+                    i + 1 == tokenIds.length ||
+                    tokenAddresses[i + 1] != tokenAddresses[i]
+                ) {
+                    _postRentBatch(
+                        tokenAddresses[i],
+                        hookTokenIds,
+                        hookLength,
+                        msg.sender
+                    );
+                    hookLength = 0;
+                }
+            }
+        }
+
+        uint256 ethQty = _settlePayments(settlements, settlementsCount);
+
+        // refund eventual remaining
+        if (msg.value > ethQty) {
+            Address.sendValue(payable(msg.sender), msg.value - ethQty);
+        }
+    }
+
+    /// @notice Extend a running rental in place, paying only the extra time
+    ///         under the current rental conditions
+    /// @dev The wrapped token stays in the renter wallet and wtoken is kept,
+    ///      no library hook is executed
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @param extraDuration extension in seconds
+    function extendRental(
+        address tokenAddress,
+        uint256 tokenId,
+        uint256 extraDuration
+    ) external payable whenNotPaused nonReentrant {
+        address oRentable = _getExistingORentable(tokenAddress);
+        address wRentable = _wrentables[tokenAddress];
 
         require(
-            duration >= rcs.minTimeDuration,
-            "Duration lower than conditions"
+            IERC721ExistExtension(wRentable).exists(tokenId) &&
+                !_isExpired(tokenAddress, tokenId),
+            "Rental not active"
+        );
+        require(
+            IERC721ExistExtension(wRentable).ownerOf(tokenId, true) ==
+                msg.sender,
+            "Only renter can extend"
         );
 
+        RentableTypes.RentalConditions memory rcs = _getRentalConditions(
+            tokenAddress,
+            tokenId
+        );
+        require(rcs.maxTimeDuration > 0, "Not available");
+
+        require(extraDuration > 0, "Duration cannot be zero");
+
+        uint256 eta = _expiresAt[tokenAddress][tokenId] + extraDuration;
         require(
-            duration <= rcs.maxTimeDuration,
+            eta - block.timestamp <= rcs.maxTimeDuration,
             "Duration greater than conditions"
         );
 
@@ -863,97 +2005,155 @@ contract Rentable is
             "Rental reserved for another user"
         );
 
-        // 3. mint wtoken
-        uint256 eta = block.timestamp + duration;
         _expiresAt[tokenAddress][tokenId] = eta;
-        IERC721ReadOnlyProxy(_wrentables[tokenAddress]).mint(
-            msg.sender,
-            tokenId
+        _enqueueExpiry(tokenAddress, tokenId, eta);
+        // user role rental, the wrapped token never left
+        if (
+            IERC721Upgradeable(tokenAddress).ownerOf(tokenId) == address(this)
+        ) {
+            IERC4907(tokenAddress).setUser(tokenId, msg.sender, eta.toUint64());
+        }
+
+        address payable rentee = payable(
+            IERC721Upgradeable(oRentable).ownerOf(tokenId)
         );
 
-        // 4. transfer token to the renter smart wallet
-        address renterWallet = _getOrCreateWalletForUser(msg.sender);
-        IERC721Upgradeable(tokenAddress).safeTransferFrom(
-            address(this),
-            renterWallet,
+        emit RentalExtended(
+            rentee,
+            msg.sender,
+            tokenAddress,
             tokenId,
-            ""
+            extraDuration,
+            eta
         );
 
-        // 5. fees distribution
-        // gross due amount
-        uint256 paymentQty = rcs.pricePerSecond * duration;
-        // protocol and rentee fees calc
-        uint256 feesForFeeCollector = (paymentQty * _fee) / BASE_FEE;
-        uint256 feesForRentee = paymentQty - feesForFeeCollector;
+        _payRental(rentee, rcs, extraDuration);
+    }
 
-        if (rcs.paymentTokenAddress == address(0)) {
-            require(msg.value >= paymentQty, "Not enough funds");
-            if (feesForFeeCollector > 0) {
-                Address.sendValue(_feeCollector, feesForFeeCollector);
-            }
+    /// @notice Rent under rental conditions signed off-chain by the otoken owner
+    /// @dev The offer works as a listing: it can be used for many rentals
+    ///      until its deadline, cancellation or an otoken transfer
+    /// @param offer rental offer, see RentableTypes.RentalOffer
+    /// @param signature EIP-712 signature of the offer (EIP-1271 for contracts)
+    /// @param duration rental duration in seconds
+    function rentWithOffer(
+        RentableTypes.RentalOffer calldata offer,
+        bytes calldata signature,
+        uint256 duration
+    ) external payable whenNotPaused nonReentrant {
+        require(block.timestamp <= offer.deadline, "Offer expired");
 
-            Address.sendValue(rentee, feesForRentee);
+        address oRentable = _getExistingORentable(offer.tokenAddress);
+        address payable rentee = payable(
+            IERC721Upgradeable(oRentable).ownerOf(offer.tokenId)
+        );
 
-            // refund eventual remaining
-            if (msg.value > paymentQty) {
-                Address.sendValue(payable(msg.sender), msg.value - paymentQty);
-            }
-        } else if (
-            _paymentTokenAllowlist[rcs.paymentTokenAddress] == ERC20_TOKEN
-        ) {
-            if (feesForFeeCollector > 0) {
-                IERC20Upgradeable(rcs.paymentTokenAddress).safeTransferFrom(
-                    msg.sender,
-                    _feeCollector,
-                    feesForFeeCollector
-                );
+        require(
+            !_cancelledRentalOffers[rentee][offer.nonce],
+            "Offer cancelled"
+        );
+        require(
+            SignatureCheckerUpgradeable.isValidSignatureNow(
+                rentee,
+                _hashRentalOffer(offer),
+                signature
+            ),
+            "Invalid offer signature"
+        );
+
+        RentableTypes.RentalConditions memory rc = offer.conditions;
+        require(
+            _paymentTokenAllowlist[rc.paymentTokenAddress] != NOT_ALLOWED_TOKEN,
+            "Not supported payment token"
+        );
+
+        _startRental(
+            offer.tokenAddress,
+            offer.tokenId,
+            duration,
+            rentee,
+            rc,
+            false
+        );
+
+        _payRental(rentee, rc, duration);
+    }
+
+    /// @notice Cancel signed rental offers
+    /// @param nonces nonces of the offers to cancel
+    function cancelRentalOffers(uint256[] calldata nonces) external {
+        for (uint256 i = 0; i < nonces.length; i++) {
+            _cancelledRentalOffers[msg.sender][nonces[i]] = true;
+            emit RentalOfferCancelled(msg.sender, nonces[i]);
+        }
+    }
+
+    /// @notice Claim balances accrued as rentee or fee collector
+    /// @param paymentTokens array of payment token addresses (0 for Ether)
+    /// @param paymentTokenIds array of payment token ids (0 for Ether and ERC20)
+    function claim(
+        address[] calldata paymentTokens,
+        uint256[] calldata paymentTokenIds
+    ) external whenNotPaused nonReentrant {
+        require(
+            paymentTokens.length == paymentTokenIds.length,
+            "Array length mismatch"
+        );
+
+        for (uint256 i = 0; i < paymentTokens.length; i++) {
+            address paymentTokenAddress = paymentTokens[i];
+            uint256 paymentTokenId = paymentTokenIds[i];
+
+            uint256 amount = _accruedBalances[msg.sender][paymentTokenAddress][
+                paymentTokenId
+            ];
+            if (amount == 0) {
+                continue;
             }
 
-            IERC20Upgradeable(rcs.paymentTokenAddress).safeTransferFrom(
-                msg.sender,
-                rentee,
-                feesForRentee
-            );
-        } else {
-            if (feesForFeeCollector > 0) {
-                IERC1155Upgradeable(rcs.paymentTokenAddress).safeTransferFrom(
+            _accruedBalances[msg.sender][paymentTokenAddress][
+                paymentTokenId
+            ] = 0;
+
+            if (paymentTokenAddress == address(0)) {
+                // slither-disable-next-line calls-loop
+                Address.sendValue(payable(msg.sender), amount);
+            } else if (
+                _accruedPaymentTokenTypes[paymentTokenAddress] == ERC1155_TOKEN
+            ) {
+                // slither-disable-next-line calls-loop
+                IERC1155Upgradeable(paymentTokenAddress).safeTransferFrom(
+                    address(this),
                     msg.sender,
-                    _feeCollector,
-                    rcs.paymentTokenId,
-                    feesForFeeCollector,
+                    paymentTokenId,
+                    amount,
                     ""
                 );
+            } else {
+                // slither-disable-next-line calls-loop
+                IERC20Upgradeable(paymentTokenAddress).safeTransfer(
+                    msg.sender,
+                    amount
+                );
             }
 
-            IERC1155Upgradeable(rcs.paymentTokenAddress).safeTransferFrom(
-                msg.sender,
-                rentee,
-                rcs.paymentTokenId,
-                feesForRentee,
-                ""
-            );
+            emit Claim(msg.sender, paymentTokenAddress, paymentTokenId, amount);
         }
+    }
 
-        // 6. after rent custom logic
-        _postRent(
-            tokenAddress,
-            tokenId,
-            duration,
-            rentee,
-            msg.sender,
-            renterWallet
-        );
+    /// @notice Accept ERC1155 payments pulled by Rentable in accrual mode
+    /// @param operator transfer operator, must be Rentable itself
+    /// @return ERC1155 receiver selector
+    function onERC1155Received(
+        address operator,
+        address,
+        uint256,
+        uint256,
+        bytes calldata
+    ) external view returns (bytes4) {
+        require(operator == address(this), "Only Rentable can transfer");
 
-        emit Rent(
-            rentee,
-            msg.sender,
-            tokenAddress,
-            tokenId,
-            rcs.paymentTokenAddress,
-            rcs.paymentTokenId,
-            eta
-        );
+        return this.onERC1155Received.selector;
     }
 
     /// @inheritdoc IRentable
@@ -968,21 +2168,110 @@ contract Rentable is
     }
 
     /// @notice Batch expireRental
+    /// @dev Tokens are recovered with a single call per run of consecutive
+    ///      tokens in the same renter wallet. Batch aware libraries
+    ///      (IBatchCollectionLibrary) get a single hook per run of consecutive
+    ///      tokens of the same collection
     /// @param tokenAddresses array of wrapped token addresses
     /// @param tokenIds array of wrapped token id
     function expireRentals(
         address[] calldata tokenAddresses,
         uint256[] calldata tokenIds
     ) external whenNotPaused {
-        for (uint256 i = 0; i < tokenAddresses.length; i++) {
-            _expireRental(
+        require(
+            tokenAddresses.length == tokenIds.length,
+            "Array length mismatch"
+        );
+
+        address[] memory rentees = new address[](tokenIds.length);
+        address payable[] memory renterWallets = new address payable[](
+            tokenIds.length
+        );
+
+        // 1. burn wtokens, recovery from renter wallets is deferred
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            (, rentees[i], renterWallets[i]) = _settleRental(
                 address(0),
                 address(0),
                 tokenAddresses[i],
                 tokenIds[i],
-                false
+                false,
+                true
             );
         }
+
+        // 2. recover tokens
+        _recoverFromWallets(tokenAddresses, tokenIds, renterWallets);
+
+        // 3. after expire custom logic
+        _postExpireRentals(tokenAddresses, tokenIds, rentees);
+    }
+
+    /// @notice Settle the oldest due rentals from the on-chain expiry queue
+    /// @dev maxCount bounds the queue steps, superseded or settled entries
+    ///      and empty buckets count too. Rentals failing to settle are skipped
+    ///      by the queue and left to expireRental, unless they ran out of gas:
+    ///      the call reverts then, otw callers could skip entries by gas limit
+    /// @param maxCount max queue steps
+    /// @return expired number of rentals settled
+    function expireDue(uint256 maxCount)
+        external
+        whenNotPaused
+        returns (uint256 expired)
+    {
+        uint256 bucket = _expiryHeadBucket;
+        if (bucket == 0) {
+            return 0;
+        }
+
+        uint256 index = _expiryHeadIndex;
+        uint256 headIndex = index;
+        uint256 currentBucket = block.timestamp / EXPIRY_BUCKET_SIZE;
+        uint256 tail = _expiryTailBucket;
+        bool pending;
+
+        for (uint256 steps = 0; steps < maxCount; steps++) {
+            RentableTypes.ExpiryEntry[] storage entries = _expiryQueue[bucket];
+            if (index >= entries.length) {
+                // current bucket can still receive rentals
+                if (bucket >= currentBucket) {
+                    break;
+                }
+                // nothing queued after the tail, new rentals expire from now on
+                bucket = bucket < tail ? bucket + 1 : currentBucket;
+                index = 0;
+                headIndex = 0;
+                continue;
+            }
+
+            RentableTypes.ExpiryEntry memory entry = entries[index++];
+            if (_isQueuedRental(entry)) {
+                if (entry.expiresAt > block.timestamp) {
+                    // not due yet, only in the current bucket
+                    pending = true;
+                } else {
+                    uint256 gasBefore = gasleft();
+                    // slither-disable-next-line calls-loop
+                    try
+                        this.expireRental(entry.tokenAddress, entry.tokenId)
+                    returns (bool) {
+                        expired++;
+                    } catch {
+                        // only 1/64 of the gas left means the forwarded gas
+                        // was exhausted, otw left to expireRental
+                        require(gasleft() > gasBefore / 64, "Not enough gas");
+                    }
+                }
+            }
+
+            // head stops at the first entry not due
+            if (!pending) {
+                headIndex = index;
+            }
+        }
+
+        _expiryHeadBucket = bucket.toUint64();
+        _expiryHeadIndex = headIndex.toUint64();
     }
 
     /* ---------- Public Permissioned ---------- */
@@ -1046,20 +2335,32 @@ contract Rentable is
         );
 
         if (currentlyRented) {
-            // move to the recipient smart wallet
-            address payable fromWallet = _wallets[from];
-            // slither-disable-next-line unused-return
-            SimpleWallet(fromWallet).execute(
-                tokenAddress,
-                0,
-                abi.encodeWithSignature(
-                    "safeTransferFrom(address,address,uint256)",
-                    fromWallet,
-                    _getOrCreateWalletForUser(to),
-                    tokenId
-                ),
-                false
-            );
+            if (
+                IERC721Upgradeable(tokenAddress).ownerOf(tokenId) ==
+                address(this)
+            ) {
+                // user role rental, hand over the role until expiration
+                IERC4907(tokenAddress).setUser(
+                    tokenId,
+                    to,
+                    _expiresAt[tokenAddress][tokenId].toUint64()
+                );
+            } else {
+                // move to the recipient smart wallet
+                address payable fromWallet = _wallets[from];
+                // slither-disable-next-line unused-return
+                SimpleWallet(fromWallet).execute(
+                    tokenAddress,
+                    0,
+                    abi.encodeWithSignature(
+                        "safeTransferFrom(address,address,uint256)",
+                        fromWallet,
+                        _getOrCreateWalletForUser(to),
+                        tokenId
+                    ),
+                    false
+                );
+            }
 
             // execute lib code
             address lib = _libraries[tokenAddress];
@@ -0,0 +1,90 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {RentableStorageV1} from "./RentableStorageV1.sol";
+
+// References
+import {RentableTypes} from "./RentableTypes.sol";
+
+/// @title Rentable Storage contract (V2)
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Append-only extension of RentableStorageV1
+contract RentableStorageV2 is RentableStorageV1 {
+    /* ========== CONSTANTS ========== */
+
+    // expiry queue bucket width, rentals expiring in the same hour share a bucket
+    uint256 internal constant EXPIRY_BUCKET_SIZE = 1 hours;
+
+    // EIP-712 signed rental offers, see Rentable-rentWithOffer
+    string internal constant EIP712_NAME = "Rentable";
+    string internal constant EIP712_VERSION = "1";
+    bytes32 internal constant EIP712_DOMAIN_TYPEHASH =
+        keccak256(
+            "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+        );
+    bytes32 internal constant RENTAL_CONDITIONS_TYPEHASH =
+        keccak256(
+            "RentalConditions(uint256 minTimeDuration,uint256 maxTimeDuration,uint256 pricePerSecond,uint256 paymentTokenId,address paymentTokenAddress,address privateRenter)"
+        );
+    bytes32 internal constant RENTAL_OFFER_TYPEHASH =
+        keccak256(
+            "RentalOffer(address tokenAddress,uint256 tokenId,RentalConditions conditions,uint256 nonce,uint256 deadline)RentalConditions(uint256 minTimeDuration,uint256 maxTimeDuration,uint256 pricePerSecond,uint256 paymentTokenId,address paymentTokenAddress,address privateRenter)"
+        );
+
+    /* ========== STATE VARIABLES ========== */
+
+    // (token address, token id) => packed rental conditions mapping
+    // supersedes RentableStorageV1 _rentalConditions,
+    // listings stored there are migrated lazily on the next write
+    // slither-disable-next-line naming-convention
+    mapping(address => mapping(uint256 => RentableTypes.PackedRentalConditions))
+        internal _packedRentalConditions;
+
+    // payment token => accrual mode, see Rentable-setPaymentTokenAccrual
+    // slither-disable-next-line naming-convention
+    mapping(address => bool) internal _paymentTokenAccrual;
+
+    // (account, payment token address, payment token id) => claimable amount
+    // slither-disable-next-line naming-convention
+    mapping(address => mapping(address => mapping(uint256 => uint256)))
+        internal _accruedBalances;
+
+    // factory allowed to register new collections, see Rentable-setCollectionFactory
+    // slither-disable-next-line naming-convention
+    address internal _collectionFactory;
+
+    // (expiresAt / EXPIRY_BUCKET_SIZE) => rentals expiring in the bucket,
+    // entries superseded or settled elsewhere are skipped lazily
+    // slither-disable-next-line naming-convention
+    mapping(uint256 => RentableTypes.ExpiryEntry[]) internal _expiryQueue;
+
+    // first bucket and entry not yet processed by Rentable-expireDue
+    // slither-disable-next-line naming-convention
+    uint64 internal _expiryHeadBucket;
+    // slither-disable-next-line naming-convention
+    uint64 internal _expiryHeadIndex;
+    // last bucket with entries
+    // slither-disable-next-line naming-convention
+    uint64 internal _expiryTailBucket;
+
+    // (signer, nonce) => cancelled, see Rentable-cancelRentalOffers
+    // slither-disable-next-line naming-convention
+    mapping(address => mapping(uint256 => bool))
+        internal _cancelledRentalOffers;
+
+    // collection => user role rentals, see Rentable-setLibrary
+    // slither-disable-next-line naming-convention
+    mapping(address => bool) internal _userRoleCollections;
+
+    // collection => library batch hooks, see Rentable-setLibrary
+    // slither-disable-next-line naming-convention
+    mapping(address => bool) internal _batchHookCollections;
+
+    // payment token => type (ERC20_TOKEN, ERC1155_TOKEN) when first accrued,
+    // claims keep the payout path even if the token is disabled later
+    // slither-disable-next-line naming-convention
+    mapping(address => uint8) internal _accruedPaymentTokenTypes;
+}
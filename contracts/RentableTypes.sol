@@ -13,4 +13,47 @@ library RentableTypes {
         address paymentTokenAddress; // payment token address allowed for the rental
         address privateRenter; // restrict rent only to this address
     }
+
+    // storage layout of RentalConditions (see RentableStorageV2), 4 slots instead of 6
+    struct PackedRentalConditions {
+        address paymentTokenAddress; // slot 0
+        uint64 minTimeDuration; // slot 0
+        address privateRenter; // slot 1
+        uint64 maxTimeDuration; // slot 1
+        uint128 pricePerSecond; // slot 2
+        uint256 paymentTokenId; // slot 3
+    }
+
+    // payment to execute, used to aggregate transfers in batch operations
+    struct PaymentSettlement {
+        address paymentTokenAddress; // payment token address (0 for Ether)
+        uint256 paymentTokenId; // payment token id (ERC1155 only)
+        address payable payee; // receiver
+        uint256 amount; // payment token units
+    }
+
+    // rental scheduled for settlement, see Rentable-expireDue
+    struct ExpiryEntry {
+        address tokenAddress; // slot 0
+        uint96 expiresAt; // slot 0, expiration of the rental when queued
+        uint256 tokenId; // slot 1
+    }
+
+    // rental snapshot of a token, see Rentable-rentalStates
+    struct RentalState {
+        RentalConditions conditions; // current listing, empty when not listed
+        uint256 expiresAt; // expiration of the last rental
+        bool expired; // true when no rental is in place
+        address rentee; // otoken owner, 0x0 when not deposited
+        address renter; // wtoken owner, 0x0 when not rented
+    }
+
+    // rental conditions signed off-chain by the otoken owner, see Rentable-rentWithOffer
+    struct RentalOffer {
+        address tokenAddress; // wrapped token address
+        uint256 tokenId; // wrapped token id
+        RentalConditions conditions; // rental conditions offered
+        uint256 nonce; // signer chosen id, used for cancellation
+        uint256 deadline; // offer valid until this timestamp
+    }
 }
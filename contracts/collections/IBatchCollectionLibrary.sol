@@ -0,0 +1,39 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {ICollectionLibrary} from "./ICollectionLibrary.sol";
+
+/// @title Batch collection library interface
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Libraries advertising this interface via ERC165 get a single hook
+///         for tokens of the same collection rented or expired in a batch
+///         (see Rentable-rentBatch and Rentable-expireRentals)
+///         instead of a postRent/postExpireRental per token
+interface IBatchCollectionLibrary is ICollectionLibrary {
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    /// @notice Called after a batch of rentals of the same renter
+    /// @param tokenAddress wrapped token address
+    /// @param tokenIds wrapped token ids
+    /// @param to renter
+    /// @param toWallet renter wallet
+    function postRentBatch(
+        address tokenAddress,
+        uint256[] calldata tokenIds,
+        address to,
+        address payable toWallet
+    ) external payable;
+
+    /// @notice Called after a batch of expiration settlements on-chain
+    /// @param tokenAddress wrapped token address
+    /// @param tokenIds wrapped token ids
+    /// @param froms rentees, one per token id
+    function postExpireRentalBatch(
+        address tokenAddress,
+        uint256[] calldata tokenIds,
+        address[] calldata froms
+    ) external payable;
+}
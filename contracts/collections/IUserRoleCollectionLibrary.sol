@@ -0,0 +1,20 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {ICollectionLibrary} from "./ICollectionLibrary.sol";
+
+/// @title User role collection library interface
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Libraries advertising this interface via ERC165 enable user role
+///         rentals: Rentable keeps the token and assigns the ERC-4907 user
+///         role to the renter until expiration, no renter wallet is involved
+interface IUserRoleCollectionLibrary is ICollectionLibrary {
+    /* ========== VIEWS ========== */
+
+    /// @notice Marker of user role rentals
+    /// @return true
+    function isUserRoleLibrary() external pure returns (bool);
+}
@@ -4,6 +4,8 @@ pragma solidity >=0.8.7;
 
 // Inheritance
 import {ICollectionLibrary} from "../ICollectionLibrary.sol";
+import {IBatchCollectionLibrary} from "../IBatchCollectionLibrary.sol";
+import {ERC165} from "@openzeppelin/contracts/utils/introspection/ERC165.sol";
 
 // References
 import {ILandRegistry} from "./ILandRegistry.sol";
@@ -14,7 +16,22 @@ import {SimpleWallet} from "../../wallet/SimpleWallet.sol";
 /// @author Rentable Team <hello@rentable.world>
 /// @custom:security Rentable Security Team <security@rentable.world>
 /// @notice Implement dedicated logic for LAND rentals
-contract DecentralandCollectionLibrary is ICollectionLibrary {
+contract DecentralandCollectionLibrary is IBatchCollectionLibrary, ERC165 {
+    /* ========== VIEWS ========== */
+
+    /// @inheritdoc ERC165
+    function supportsInterface(bytes4 interfaceId)
+        public
+        view
+        virtual
+        override
+        returns (bool)
+    {
+        return
+            interfaceId == type(IBatchCollectionLibrary).interfaceId ||
+            super.supportsInterface(interfaceId);
+    }
+
     /* ========== MUTATIVE FUNCTIONS ========== */
 
     /// @inheritdoc ICollectionLibrary
@@ -72,6 +89,60 @@ contract DecentralandCollectionLibrary is ICollectionLibrary {
         ILandRegistry(tokenAddress).setUpdateOperator(tokenId, from);
     }
 
+    /// @inheritdoc IBatchCollectionLibrary
+    // slither-disable-next-line locked-ether
+    function postRentBatch(
+        address tokenAddress,
+        uint256[] calldata tokenIds,
+        address to,
+        address payable toWallet
+    ) external payable override {
+        // Set renter as land operator of all the lands at once
+        // slither-disable-next-line unused-return
+        SimpleWallet(toWallet).execute(
+            tokenAddress,
+            0,
+            abi.encodeWithSelector(
+                ILandRegistry.setManyUpdateOperator.selector,
+                tokenIds,
+                to
+            ),
+            false
+        );
+    }
+
+    /// @inheritdoc IBatchCollectionLibrary
+    // slither-disable-next-line locked-ether
+    function postExpireRentalBatch(
+        address tokenAddress,
+        uint256[] calldata tokenIds,
+        address[] calldata froms
+    ) external payable override {
+        // Restore current otoken owners as land operators,
+        // one update per run of lands of the same owner
+        uint256 start = 0;
+        for (uint256 i = 1; i <= tokenIds.length; i++) {
+            if (i < tokenIds.length && froms[i] == froms[start]) continue;
+
+            if (i - start == 1) {
+                ILandRegistry(tokenAddress).setUpdateOperator(
+                    tokenIds[start],
+                    froms[start]
+                );
+            } else {
+                uint256[] memory assetIds = new uint256[](i - start);
+                for (uint256 j = start; j < i; j++) {
+                    assetIds[j - start] = tokenIds[j];
+                }
+                ILandRegistry(tokenAddress).setManyUpdateOperator(
+                    assetIds,
+                    froms[start]
+                );
+            }
+            start = i;
+        }
+    }
+
     /// @inheritdoc ICollectionLibrary
     function postWTokenTransfer(
         address tokenAddress,
@@ -21,4 +21,12 @@ interface ILandRegistry {
     /// @param assetId land identifier
     /// @param operator operator address
     function setUpdateOperator(uint256 assetId, address operator) external;
+
+    /// @notice Update the land operator of many lands at once
+    /// @param assetIds land identifiers
+    /// @param operator operator address
+    function setManyUpdateOperator(
+        uint256[] calldata assetIds,
+        address operator
+    ) external;
 }
@@ -0,0 +1,92 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {ICollectionLibrary} from "../ICollectionLibrary.sol";
+import {IUserRoleCollectionLibrary} from "../IUserRoleCollectionLibrary.sol";
+import {ERC165} from "@openzeppelin/contracts/utils/introspection/ERC165.sol";
+
+/// @title ERC-4907 collection library
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Enable user role rentals for ERC-4907 collections.
+///         The user role is managed by Rentable core, hooks are no-ops
+contract ERC4907CollectionLibrary is IUserRoleCollectionLibrary, ERC165 {
+    /* ========== VIEWS ========== */
+
+    /// @inheritdoc ERC165
+    function supportsInterface(bytes4 interfaceId)
+        public
+        view
+        virtual
+        override
+        returns (bool)
+    {
+        return
+            interfaceId == type(IUserRoleCollectionLibrary).interfaceId ||
+            super.supportsInterface(interfaceId);
+    }
+
+    /// @inheritdoc IUserRoleCollectionLibrary
+    function isUserRoleLibrary() external pure override returns (bool) {
+        return true;
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    /// @inheritdoc ICollectionLibrary
+    function postDeposit(
+        address,
+        uint256,
+        address
+    ) external override {}
+
+    /// @inheritdoc ICollectionLibrary
+    function postList(
+        address,
+        uint256,
+        address,
+        uint256,
+        uint256,
+        uint256
+    ) external override {}
+
+    /// @inheritdoc ICollectionLibrary
+    // slither-disable-next-line locked-ether
+    function postRent(
+        address,
+        uint256,
+        uint256,
+        address,
+        address,
+        address payable
+    ) external payable override {}
+
+    /// @inheritdoc ICollectionLibrary
+    // slither-disable-next-line locked-ether
+    function postExpireRental(
+        address,
+        uint256,
+        address
+    ) external payable override {}
+
+    /// @inheritdoc ICollectionLibrary
+    function postWTokenTransfer(
+        address,
+        uint256,
+        address,
+        address,
+        address payable
+    ) external override {}
+
+    /// @inheritdoc ICollectionLibrary
+    function postOTokenTransfer(
+        address,
+        uint256,
+        address,
+        address,
+        address payable,
+        bool
+    ) external override {}
+}
@@ -0,0 +1,43 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+/// @title ERC-4907 rental NFT, user extension of EIP-721
+/// @notice See https://eips.ethereum.org/EIPS/eip-4907
+interface IERC4907 {
+    /* ========== EVENTS ========== */
+
+    /// @notice Emitted when the user of an NFT or its expiration is changed
+    /// @param tokenId token id
+    /// @param user new user (0 for none)
+    /// @param expires unix timestamp, the user role is valid until then
+    event UpdateUser(
+        uint256 indexed tokenId,
+        address indexed user,
+        uint64 expires
+    );
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    /// @notice Set the user and expires of an NFT
+    /// @param tokenId token id
+    /// @param user new user (0 for none)
+    /// @param expires unix timestamp, the user role is valid until then
+    function setUser(
+        uint256 tokenId,
+        address user,
+        uint64 expires
+    ) external;
+
+    /* ========== VIEWS ========== */
+
+    /// @notice Get the user of an NFT
+    /// @param tokenId token id
+    /// @return user address, 0 when not set or expired
+    function userOf(uint256 tokenId) external view returns (address);
+
+    /// @notice Get the user expires of an NFT
+    /// @param tokenId token id
+    /// @return user expiration timestamp
+    function userExpires(uint256 tokenId) external view returns (uint256);
+}
@@ -0,0 +1,19 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+/// @title ERC721 extension reading many owners at once
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+interface IERC721BatchOwnership {
+    /* ========== VIEWS ========== */
+
+    /// @notice Check ownership of many tokens eventually skipping expire check
+    /// @param tokenIds token ids
+    /// @param skipExpirationCheck when true, return current owners skipping expire check
+    /// @return owners owner addresses, 0x0 for non existing or expired tokens
+    function ownersOf(uint256[] calldata tokenIds, bool skipExpirationCheck)
+        external
+        view
+        returns (address[] memory owners);
+}
@@ -47,6 +47,15 @@ interface IRentable is IRentableEvents, IERC721ReceiverUpgradeable {
         view
         returns (bool);
 
+    /// @dev Show rental validity of many tokens of the same collection
+    /// @param tokenAddress wrapped token address
+    /// @param tokenIds wrapped token ids
+    /// @return expired true if is expired, false otw, one per token id
+    function isExpiredBatch(address tokenAddress, uint256[] calldata tokenIds)
+        external
+        view
+        returns (bool[] memory expired);
+
     /* ========== MUTATIVE FUNCTIONS ========== */
 
     /// @notice Create user wallet address
@@ -73,6 +82,7 @@ interface IRentable is IRentableEvents, IERC721ReceiverUpgradeable {
     function withdraw(address tokenAddress, uint256 tokenId) external;
 
     /// @notice Manage rental conditions and listing
+    /// @dev durations must fit in uint64 and price in uint128, see RentableTypes.PackedRentalConditions
     /// @param tokenAddress wrapped token address
     /// @param tokenId wrapped token id
     /// @param rc rental conditions see RentableTypes.RentalConditions
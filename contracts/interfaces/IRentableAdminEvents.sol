@@ -46,6 +46,14 @@ interface IRentableAdminEvents {
         address indexed newWalletFactory
     );
 
+    /// @notice Emitted on collection factory change
+    /// @param previousCollectionFactory previous collection factory address
+    /// @param newCollectionFactory new collection factory address
+    event CollectionFactoryChanged(
+        address indexed previousCollectionFactory,
+        address indexed newCollectionFactory
+    );
+
     /// @notice Emitted on fee change
     /// @param previousFee previous fee
     /// @param newFee new fee
@@ -69,6 +77,16 @@ interface IRentableAdminEvents {
         uint8 indexed newStatus
     );
 
+    /// @notice Emitted on payment token accrual mode change
+    /// @param paymentToken payment token address
+    /// @param previousStatus previous accrual mode
+    /// @param newStatus new accrual mode
+    event PaymentTokenAccrualChanged(
+        address indexed paymentToken,
+        bool previousStatus,
+        bool newStatus
+    );
+
     /// @notice Emitted on proxy call allowlist change
     /// @param caller o/w token address
     /// @param selector selector bytes on the target wrapped token
@@ -65,8 +65,41 @@ interface IRentableEvents {
         uint256 expiresAt
     );
 
+    /// @notice Emitted on a rental extended by the current renter
+    /// @param from rentee
+    /// @param to renter
+    /// @param tokenAddress wrapped token address
+    /// @param tokenId wrapped token id
+    /// @param extraDuration paid extension in seconds
+    /// @param expiresAt new rental expiration time
+    event RentalExtended(
+        address from,
+        address indexed to,
+        address indexed tokenAddress,
+        uint256 indexed tokenId,
+        uint256 extraDuration,
+        uint256 expiresAt
+    );
+
+    /// @notice Emitted on signed rental offer cancellation
+    /// @param signer offer signer (otoken owner)
+    /// @param nonce cancelled offer nonce
+    event RentalOfferCancelled(address indexed signer, uint256 indexed nonce);
+
     /// @notice Emitted on expiration settlement on-chain
     /// @param tokenAddress wrapped token address
     /// @param tokenId wrapped token id
     event RentEnds(address indexed tokenAddress, uint256 indexed tokenId);
+
+    /// @notice Emitted on accrued balance claimed
+    /// @param account claimer (rentee or fee collector)
+    /// @param paymentTokenAddress payment token address (0 for ETH)
+    /// @param paymentTokenId payment token id (0 for ETH and ERC20)
+    /// @param amount claimed amount in payment token units
+    event Claim(
+        address indexed account,
+        address indexed paymentTokenAddress,
+        uint256 paymentTokenId,
+        uint256 amount
+    );
 }
@@ -0,0 +1,135 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {DSTest} from "ds-test/test.sol";
+import {Vm} from "forge-std/Vm.sol";
+
+import {TestHelper} from "./TestHelper.t.sol";
+
+import {SimpleWallet} from "../wallet/SimpleWallet.sol";
+import {DeterministicWalletFactory} from "../wallet/DeterministicWalletFactory.sol";
+import {WalletFactory} from "../wallet/WalletFactory.sol";
+import {TestImplLogicV1} from "./mocks/TestImplLogicV1.sol";
+
+import {UpgradeableBeacon} from "@openzeppelin/contracts/proxy/beacon/UpgradeableBeacon.sol";
+
+contract DeterministicWalletFactoryTest is DSTest, TestHelper {
+    Vm public constant vm = Vm(HEVM_ADDRESS);
+
+    address owner;
+    address user;
+
+    SimpleWallet simpleWalletLogic;
+    UpgradeableBeacon simpleWalletBeacon;
+    DeterministicWalletFactory walletFactory;
+
+    function setUp() public {
+        owner = getNewAddress();
+        user = getNewAddress();
+
+        vm.startPrank(owner);
+
+        simpleWalletLogic = new SimpleWallet(owner, user);
+        simpleWalletBeacon = new UpgradeableBeacon(address(simpleWalletLogic));
+        walletFactory = new DeterministicWalletFactory(
+            address(simpleWalletBeacon)
+        );
+    }
+
+    function testGetBeacon() public {
+        assertEq(walletFactory.getBeacon(), address(simpleWalletBeacon));
+    }
+
+    function testCannotUseBeaconWithoutImplementation() public {
+        vm.expectRevert();
+        new DeterministicWalletFactory(getNewAddress());
+    }
+
+    function testCreateWallet() public {
+        address walletOwner = getNewAddress();
+        address walletUser = getNewAddress();
+
+        address payable predicted = walletFactory.predictWallet(
+            walletOwner,
+            walletUser
+        );
+        assertEq(predicted.code.length, 0);
+
+        address payable newWallet = walletFactory.createWallet(
+            walletOwner,
+            walletUser
+        );
+
+        assertEq(newWallet, predicted);
+
+        // owner
+        assertEq(walletOwner, SimpleWallet(newWallet).owner());
+
+        // user
+        assertEq(walletUser, SimpleWallet(newWallet).getUser());
+
+        // cannot be initialized again
+        vm.expectRevert(
+            bytes("Initializable: contract is already initialized")
+        );
+        SimpleWallet(newWallet).initialize(getNewAddress(), getNewAddress());
+    }
+
+    function testCreateWalletIsIdempotent() public {
+        address walletOwner = getNewAddress();
+        address walletUser = getNewAddress();
+
+        address payable newWallet = walletFactory.createWallet(
+            walletOwner,
+            walletUser
+        );
+
+        // anyone can deploy it, same result
+        switchUser(getNewAddress());
+        assertEq(walletFactory.createWallet(walletOwner, walletUser), newWallet);
+        assertEq(walletOwner, SimpleWallet(newWallet).owner());
+    }
+
+    function testWalletsDependOnOwner() public {
+        address walletUser = getNewAddress();
+
+        assertTrue(
+            walletFactory.predictWallet(getNewAddress(), walletUser) !=
+                walletFactory.predictWallet(getNewAddress(), walletUser)
+        );
+    }
+
+    function testWalletFollowsBeacon() public {
+        address payable newWallet = walletFactory.createWallet(
+            getNewAddress(),
+            getNewAddress()
+        );
+
+        vm.expectRevert();
+        TestImplLogicV1(newWallet).getTestNumber();
+
+        simpleWalletBeacon.upgradeTo(address(new TestImplLogicV1()));
+
+        TestImplLogicV1(newWallet).getTestNumber();
+    }
+
+    function testBenchmarkCreateWallet() public {
+        WalletFactory beaconProxyFactory = new WalletFactory(
+            address(simpleWalletBeacon)
+        );
+
+        address walletOwner = getNewAddress();
+
+        uint256 beaconProxyGas = gasleft();
+        beaconProxyFactory.createWallet(walletOwner, getNewAddress());
+        beaconProxyGas -= gasleft();
+
+        uint256 cloneGas = gasleft();
+        walletFactory.createWallet(walletOwner, getNewAddress());
+        cloneGas -= gasleft();
+
+        emit log_named_uint("BeaconProxy wallet", beaconProxyGas);
+        emit log_named_uint("Clone wallet", cloneGas);
+        assertLt(cloneGas, beaconProxyGas);
+    }
+}
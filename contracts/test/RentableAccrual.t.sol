@@ -0,0 +1,286 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableAccrual is SharedSetup {
+    uint256 rentalDuration = 80;
+
+    function _enableAccrual(address _paymentTokenAddress) internal {
+        vm.stopPrank();
+        vm.prank(governance);
+        rentable.setPaymentTokenAccrual(_paymentTokenAddress, true);
+        vm.startPrank(user);
+    }
+
+    function _rentOne(uint256 value) internal {
+        switchUser(renter);
+        depositAndApprove(renter, value, paymentTokenAddress, paymentTokenId);
+
+        rentable.rent{value: paymentTokenAddress == address(0) ? value : 0}(
+            address(testNFT),
+            tokenId,
+            rentalDuration
+        );
+
+        switchUser(user);
+    }
+
+    function _claim(address account, uint256 expectedAmount) internal {
+        address[] memory tokens = new address[](1);
+        tokens[0] = paymentTokenAddress;
+        uint256[] memory ids = new uint256[](1);
+        ids[0] = paymentTokenId;
+
+        switchUser(account);
+        if (expectedAmount > 0) {
+            vm.expectEmit(true, true, true, true);
+            emit Claim(
+                account,
+                paymentTokenAddress,
+                paymentTokenId,
+                expectedAmount
+            );
+        }
+        rentable.claim(tokens, ids);
+        switchUser(user);
+    }
+
+    function testRentAccrual()
+        public
+        payable
+        protocolFeeCoverage
+        paymentTokensCoverage
+        executeByUser(user)
+    {
+        _enableAccrual(paymentTokenAddress);
+        _prepareRent();
+
+        uint256 value = rentalDuration * pricePerSecond;
+        uint256 fees = (value * rentable.getFee()) / 10_000;
+
+        uint256 preBalanceUser = getBalance(
+            user,
+            paymentTokenAddress,
+            paymentTokenId
+        );
+        uint256 preBalanceFeeCollector = getBalance(
+            feeCollector,
+            paymentTokenAddress,
+            paymentTokenId
+        );
+
+        _rentOne(value);
+
+        // nothing pushed on rent
+        assertEq(
+            getBalance(user, paymentTokenAddress, paymentTokenId),
+            preBalanceUser
+        );
+        assertEq(
+            getBalance(feeCollector, paymentTokenAddress, paymentTokenId),
+            preBalanceFeeCollector
+        );
+        assertEq(
+            getBalance(address(rentable), paymentTokenAddress, paymentTokenId),
+            value
+        );
+
+        assertEq(
+            rentable.claimable(user, paymentTokenAddress, paymentTokenId),
+            value - fees
+        );
+        assertEq(
+            rentable.claimable(
+                feeCollector,
+                paymentTokenAddress,
+                paymentTokenId
+            ),
+            fees
+        );
+
+        _claim(user, value - fees);
+        _claim(feeCollector, fees);
+
+        assertEq(
+            getBalance(user, paymentTokenAddress, paymentTokenId) -
+                preBalanceUser,
+            value - fees
+        );
+        assertEq(
+            getBalance(feeCollector, paymentTokenAddress, paymentTokenId) -
+                preBalanceFeeCollector,
+            fees
+        );
+        assertEq(
+            getBalance(address(rentable), paymentTokenAddress, paymentTokenId),
+            0
+        );
+        assertEq(
+            rentable.claimable(user, paymentTokenAddress, paymentTokenId),
+            0
+        );
+
+        // disable for next coverage runs
+        vm.stopPrank();
+        vm.prank(governance);
+        rentable.setPaymentTokenAccrual(paymentTokenAddress, false);
+        vm.startPrank(user);
+    }
+
+    function testRentBatchAccrual() public payable executeByUser(user) {
+        vm.stopPrank();
+        vm.startPrank(governance);
+        rentable.setFee(250);
+        rentable.setPaymentTokenAccrual(address(weth), true);
+        vm.stopPrank();
+        vm.startPrank(user);
+
+        paymentTokenAddress = address(weth);
+        pricePerSecond = 0.001 ether;
+
+        uint256 count = 3;
+        address[] memory tokenAddresses = new address[](count);
+        uint256[] memory tokenIds = new uint256[](count);
+        uint256[] memory durations = new uint256[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            prepareTestDeposit();
+            testNFT.safeTransferFrom(
+                user,
+                address(rentable),
+                tokenId,
+                abi.encode(
+                    RentableTypes.RentalConditions({
+                        minTimeDuration: 0,
+                        maxTimeDuration: 10 days,
+                        pricePerSecond: pricePerSecond,
+                        paymentTokenId: 0,
+                        paymentTokenAddress: paymentTokenAddress,
+                        privateRenter: address(0)
+                    })
+                )
+            );
+            tokenAddresses[i] = address(testNFT);
+            tokenIds[i] = tokenId;
+            durations[i] = rentalDuration;
+        }
+
+        uint256 itemPayment = rentalDuration * pricePerSecond;
+        uint256 itemFees = (itemPayment * 250) / 10_000;
+
+        renter = getNewAddress();
+        switchUser(renter);
+        depositAndApprove(renter, itemPayment * count, address(weth), 0);
+        rentable.rentBatch(tokenAddresses, tokenIds, durations);
+        switchUser(user);
+
+        assertEq(weth.balanceOf(address(rentable)), itemPayment * count);
+        assertEq(
+            rentable.claimable(user, address(weth), 0),
+            (itemPayment - itemFees) * count
+        );
+        assertEq(
+            rentable.claimable(feeCollector, address(weth), 0),
+            itemFees * count
+        );
+    }
+
+    function testFeeCollectorSweep() public payable executeByUser(user) {
+        vm.stopPrank();
+        vm.startPrank(governance);
+        rentable.setFee(500);
+        rentable.setPaymentTokenAccrual(address(0), true);
+        rentable.setPaymentTokenAccrual(address(weth), true);
+        rentable.setPaymentTokenAccrual(address(dummy1155), true);
+        vm.stopPrank();
+        vm.startPrank(user);
+
+        uint256 value = rentalDuration * 0.001 ether;
+        uint256 fees = (value * 500) / 10_000;
+
+        address[] memory tokens = new address[](3);
+        tokens[0] = address(0);
+        tokens[1] = address(weth);
+        tokens[2] = address(dummy1155);
+
+        for (uint256 i = 0; i < tokens.length; i++) {
+            paymentTokenAddress = tokens[i];
+            _prepareRent();
+            _rentOne(value);
+        }
+
+        uint256 preBalance = feeCollector.balance;
+
+        switchUser(feeCollector);
+        rentable.claim(tokens, new uint256[](3));
+        switchUser(user);
+
+        assertEq(feeCollector.balance - preBalance, fees);
+        assertEq(weth.balanceOf(feeCollector), fees);
+        assertEq(dummy1155.balanceOf(feeCollector, 0), fees);
+
+        for (uint256 i = 0; i < tokens.length; i++) {
+            assertEq(rentable.claimable(feeCollector, tokens[i], 0), 0);
+        }
+    }
+
+    function testClaimAfterPaymentTokenDisabled()
+        public
+        payable
+        executeByUser(user)
+    {
+        _enableAccrual(address(dummy1155));
+        paymentTokenAddress = address(dummy1155);
+        paymentTokenId = 0;
+        _prepareRent();
+
+        uint256 value = rentalDuration * pricePerSecond;
+        uint256 fees = (value * rentable.getFee()) / 10_000;
+        _rentOne(value);
+
+        vm.stopPrank();
+        vm.prank(governance);
+        rentable.disablePaymentToken(address(dummy1155));
+        vm.startPrank(user);
+
+        // paid out as ERC1155, the type it accrued with
+        _claim(user, value - fees);
+        assertEq(dummy1155.balanceOf(user, 0), value - fees);
+        assertEq(dummy1155.balanceOf(address(rentable), 0), fees);
+    }
+
+    function testPushStillAvailable() public payable executeByUser(user) {
+        _enableAccrual(address(weth));
+
+        // Ether stays in push mode
+        paymentTokenAddress = address(0);
+        _prepareRent();
+
+        uint256 value = rentalDuration * pricePerSecond;
+        uint256 preBalanceUser = user.balance;
+
+        _rentOne(value);
+
+        assertEq(user.balance - preBalanceUser, value);
+        assertEq(rentable.claimable(user, address(0), 0), 0);
+    }
+
+    function testCannotReceiveUnsolicitedERC1155()
+        public
+        executeByUser(user)
+    {
+        vm.deal(user, 1 ether);
+        dummy1155.deposit{value: 1 ether}(0);
+
+        vm.expectRevert(bytes("Only Rentable can transfer"));
+        dummy1155.safeTransferFrom(user, address(rentable), 0, 1 ether, "");
+    }
+
+    function testCannotClaimWithMismatchingArrays() public executeByUser(user) {
+        vm.expectRevert(bytes("Array length mismatch"));
+        rentable.claim(new address[](1), new uint256[](2));
+    }
+}
@@ -0,0 +1,135 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableBatchViews is SharedSetup {
+    uint256 rentalDuration = 1 days;
+
+    uint256 rentedId;
+    uint256 expiredId;
+    uint256 listedId;
+    uint256 notDepositedId;
+
+    function setUp() public override {
+        super.setUp();
+
+        vm.startPrank(user);
+
+        _prepareRent();
+        expiredId = tokenId;
+        _rent(expiredId, 1 hours);
+
+        vm.warp(block.timestamp + 1 hours);
+
+        _prepareRent(renter);
+        rentedId = tokenId;
+        _rent(rentedId, rentalDuration);
+
+        _prepareRent(renter);
+        listedId = tokenId;
+
+        notDepositedId = tokenId + 1;
+
+        vm.stopPrank();
+    }
+
+    function _rent(uint256 _tokenId, uint256 duration) internal {
+        uint256 value = duration * pricePerSecond;
+        switchUser(renter);
+        depositAndApprove(renter, value, address(0), 0);
+        rentable.rent{value: value}(address(testNFT), _tokenId, duration);
+        switchUser(user);
+    }
+
+    function _tokenIds() internal view returns (uint256[] memory tokenIds) {
+        tokenIds = new uint256[](4);
+        tokenIds[0] = rentedId;
+        tokenIds[1] = expiredId;
+        tokenIds[2] = listedId;
+        tokenIds[3] = notDepositedId;
+    }
+
+    function testWRentableOwnersOf() public {
+        uint256[] memory tokenIds = _tokenIds();
+
+        address[] memory owners = wrentable.ownersOf(tokenIds, false);
+        assertEq(owners[0], renter);
+        assertEq(owners[1], address(0));
+        assertEq(owners[2], address(0));
+        assertEq(owners[3], address(0));
+
+        for (uint256 i = 0; i < 2; i++) {
+            assertEq(owners[i], wrentable.ownerOf(tokenIds[i]));
+        }
+
+        // expired but not yet settled
+        owners = wrentable.ownersOf(tokenIds, true);
+        assertEq(owners[1], renter);
+        assertEq(owners[1], wrentable.ownerOf(expiredId, true));
+    }
+
+    function testORentableOwnersOf() public {
+        address[] memory owners = orentable.ownersOf(_tokenIds(), false);
+
+        assertEq(owners[0], user);
+        assertEq(owners[1], user);
+        assertEq(owners[2], user);
+        assertEq(owners[3], address(0));
+    }
+
+    function testIsExpiredBatch() public {
+        uint256[] memory tokenIds = _tokenIds();
+
+        bool[] memory expired = rentable.isExpiredBatch(
+            address(testNFT),
+            tokenIds
+        );
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            assertTrue(
+                expired[i] == rentable.isExpired(address(testNFT), tokenIds[i])
+            );
+        }
+    }
+
+    function testRentalStates() public {
+        RentableTypes.RentalState[] memory states = rentable.rentalStates(
+            address(testNFT),
+            _tokenIds()
+        );
+
+        assertEq(states.length, 4);
+
+        // rented
+        assertEq(states[0].conditions.pricePerSecond, pricePerSecond);
+        assertEq(states[0].expiresAt, block.timestamp + rentalDuration);
+        assertTrue(!states[0].expired);
+        assertEq(states[0].rentee, user);
+        assertEq(states[0].renter, renter);
+
+        // expired, not settled
+        assertEq(states[1].expiresAt, block.timestamp);
+        assertTrue(states[1].expired);
+        assertEq(states[1].rentee, user);
+        assertEq(states[1].renter, address(0));
+
+        // listed only
+        assertEq(states[2].conditions.maxTimeDuration, maxTimeDuration);
+        assertEq(states[2].expiresAt, 0);
+        assertTrue(states[2].expired);
+        assertEq(states[2].renter, address(0));
+
+        // not deposited
+        assertEq(states[3].conditions.maxTimeDuration, 0);
+        assertEq(states[3].rentee, address(0));
+        assertEq(states[3].renter, address(0));
+    }
+
+    function testCannotGetRentalStatesNotSupported() public {
+        vm.expectRevert(bytes("Token currently not supported"));
+        rentable.rentalStates(getNewAddress(), _tokenIds());
+    }
+}
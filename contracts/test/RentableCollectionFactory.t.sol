@@ -0,0 +1,102 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {TestNFT} from "./mocks/TestNFT.sol";
+import {ORentable} from "../tokenization/ORentable.sol";
+import {WRentable} from "../tokenization/WRentable.sol";
+import {RentableCollectionFactory} from "../tokenization/RentableCollectionFactory.sol";
+
+contract RentableCollectionFactoryTest is SharedSetup {
+    RentableCollectionFactory collectionFactory;
+
+    function setUp() public override {
+        super.setUp();
+
+        vm.startPrank(governance);
+        collectionFactory = new RentableCollectionFactory(
+            address(rentable),
+            address(proxyAdmin)
+        );
+        rentable.setCollectionFactory(address(collectionFactory));
+        vm.stopPrank();
+    }
+
+    function _collection(address tokenAddress)
+        internal
+        view
+        returns (RentableCollectionFactory.Collection memory collection)
+    {
+        collection.tokenAddress = tokenAddress;
+        collection.oBeacon = address(obeacon);
+        collection.wBeacon = address(wbeacon);
+    }
+
+    function testOnboard() public executeByUser(governance) {
+        TestNFT newNFT = new TestNFT();
+
+        (address o, address w) = collectionFactory.onboard(
+            _collection(address(newNFT))
+        );
+
+        assertEq(rentable.getORentable(address(newNFT)), o);
+        assertEq(rentable.getWRentable(address(newNFT)), w);
+        // library and proxy calls are left to governance
+        assertEq(rentable.getLibrary(address(newNFT)), address(0));
+        assertTrue(!rentable.isEnabledProxyCall(o, testNFT.approve.selector));
+
+        assertEq(ORentable(o).getWrapped(), address(newNFT));
+        assertEq(ORentable(o).getRentable(), address(rentable));
+        assertEq(ORentable(o).owner(), governance);
+        assertEq(WRentable(w).getWrapped(), address(newNFT));
+        assertEq(WRentable(w).getRentable(), address(rentable));
+        assertEq(WRentable(w).owner(), governance);
+
+        // onboarded collection is ready to be used
+        switchUser(user);
+        newNFT.mint(user, tokenId);
+        newNFT.safeTransferFrom(user, address(rentable), tokenId);
+        assertEq(ORentable(o).ownerOf(tokenId), user);
+    }
+
+    function testOnboardMany() public executeByUser(governance) {
+        RentableCollectionFactory.Collection[]
+            memory collections = new RentableCollectionFactory.Collection[](3);
+        for (uint256 i = 0; i < collections.length; i++) {
+            collections[i] = _collection(address(new TestNFT()));
+        }
+
+        (address[] memory os, address[] memory ws) = collectionFactory
+            .onboardMany(collections);
+
+        for (uint256 i = 0; i < collections.length; i++) {
+            assertEq(rentable.getORentable(collections[i].tokenAddress), os[i]);
+            assertEq(rentable.getWRentable(collections[i].tokenAddress), ws[i]);
+        }
+    }
+
+    function testCannotOnboardTwice() public executeByUser(governance) {
+        vm.expectRevert(bytes("Collection already onboarded"));
+        collectionFactory.onboard(_collection(address(testNFT)));
+    }
+
+    function testCannotOnboardIfNotOwner() public executeByUser(user) {
+        TestNFT newNFT = new TestNFT();
+
+        vm.expectRevert(bytes("Ownable: caller is not the owner"));
+        collectionFactory.onboard(_collection(address(newNFT)));
+    }
+
+    function testCannotOnboardIfFactoryDisabled()
+        public
+        executeByUser(governance)
+    {
+        rentable.setCollectionFactory(address(0));
+
+        TestNFT newNFT = new TestNFT();
+
+        vm.expectRevert(bytes("Only Governance or Collection Factory"));
+        collectionFactory.onboard(_collection(address(newNFT)));
+    }
+}
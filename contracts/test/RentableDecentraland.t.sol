@@ -240,4 +240,108 @@ contract RentableDecentraland is SharedSetup {
         wrentable.safeTransferFrom(renter, newRenter, tokenId);
         assertEq(testLand.updateOperator(tokenId), orentable.ownerOf(tokenId));
     }
+
+    function _listLands(address owner, uint256 count)
+        internal
+        returns (address[] memory tokenAddresses, uint256[] memory tokenIds)
+    {
+        tokenAddresses = new address[](count);
+        tokenIds = new uint256[](count);
+
+        vm.startPrank(owner);
+        for (uint256 i = 0; i < count; i++) {
+            tokenAddresses[i] = address(testLand);
+            tokenIds[i] = ++tokenId;
+
+            testLand.mint(owner, tokenId);
+            testLand.safeTransferFrom(
+                owner,
+                address(rentable),
+                tokenId,
+                abi.encode(
+                    RentableTypes.RentalConditions({
+                        minTimeDuration: 0,
+                        maxTimeDuration: 10 days,
+                        pricePerSecond: 1,
+                        paymentTokenId: 0,
+                        paymentTokenAddress: address(0),
+                        privateRenter: address(0)
+                    })
+                )
+            );
+        }
+        vm.stopPrank();
+    }
+
+    function _rentBatch(
+        address[] memory tokenAddresses,
+        uint256[] memory tokenIds,
+        uint256 duration
+    ) internal {
+        uint256[] memory durations = new uint256[](tokenIds.length);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            durations[i] = duration;
+        }
+
+        uint256 value = duration * tokenIds.length;
+        vm.deal(renter, value);
+        vm.prank(renter);
+        rentable.rentBatch{value: value}(tokenAddresses, tokenIds, durations);
+    }
+
+    function testRentBatchSetsManyOperators() public {
+        renter = getNewAddress();
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds
+        ) = _listLands(user, 5);
+
+        _rentBatch(tokenAddresses, tokenIds, 1 days);
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            assertEq(testLand.ownerOf(tokenIds[i]), rentable.userWallet(renter));
+            assertEq(testLand.updateOperator(tokenIds[i]), renter);
+        }
+    }
+
+    function testExpireRentalsRestoresManyOperators() public {
+        renter = getNewAddress();
+        address otherOwner = getNewAddress();
+
+        // two runs of lands with different owners
+        (address[] memory first, uint256[] memory firstIds) = _listLands(
+            user,
+            3
+        );
+        (address[] memory second, uint256[] memory secondIds) = _listLands(
+            otherOwner,
+            2
+        );
+
+        address[] memory tokenAddresses = new address[](5);
+        uint256[] memory tokenIds = new uint256[](5);
+        for (uint256 i = 0; i < 5; i++) {
+            tokenAddresses[i] = i < 3 ? first[i] : second[i - 3];
+            tokenIds[i] = i < 3 ? firstIds[i] : secondIds[i - 3];
+        }
+
+        _rentBatch(tokenAddresses, tokenIds, 1 days);
+
+        vm.warp(block.timestamp + 1 days);
+
+        vm.expectEmit(true, true, true, true);
+        emit RentEnds(address(testLand), tokenIds[0]);
+        rentable.expireRentals(tokenAddresses, tokenIds);
+
+        for (uint256 i = 0; i < 5; i++) {
+            assertEq(testLand.ownerOf(tokenIds[i]), address(rentable));
+            assertEq(
+                testLand.updateOperator(tokenIds[i]),
+                i < 3 ? user : otherOwner
+            );
+        }
+
+        // already settled, no hook
+        rentable.expireRentals(tokenAddresses, tokenIds);
+    }
 }
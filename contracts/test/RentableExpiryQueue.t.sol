@@ -0,0 +1,189 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableExpiryQueue is SharedSetup {
+    function setUp() public override {
+        super.setUp();
+
+        // start from a bucket boundary
+        vm.warp(100 hours);
+    }
+
+    function _rentFor(uint256 duration) internal returns (uint256) {
+        _prepareRent(renter == address(0) ? getNewAddress() : renter);
+
+        uint256 value = duration * pricePerSecond;
+        switchUser(renter);
+        depositAndApprove(renter, value, address(0), 0);
+        rentable.rent{value: value}(address(testNFT), tokenId, duration);
+        switchUser(user);
+
+        return tokenId;
+    }
+
+    function _pendingCount() internal view returns (uint256 count) {
+        uint256 cursor;
+        do {
+            (
+                RentableTypes.ExpiryEntry[] memory entries,
+                uint256 nextCursor
+            ) = rentable.pendingExpirations(cursor, 2);
+            count += entries.length;
+            cursor = nextCursor;
+        } while (cursor != 0);
+    }
+
+    function testExpireDue() public executeByUser(user) {
+        uint256 first = _rentFor(2 hours);
+        uint256 second = _rentFor(1 hours);
+        uint256 third = _rentFor(3 hours);
+
+        assertEq(_pendingCount(), 3);
+
+        // nothing due yet
+        assertEq(rentable.expireDue(100), 0);
+
+        vm.warp(block.timestamp + 2 hours);
+
+        assertEq(rentable.expireDue(100), 2);
+        assertEq(testNFT.ownerOf(first), address(rentable));
+        assertEq(testNFT.ownerOf(second), address(rentable));
+        assertEq(testNFT.ownerOf(third), rentable.userWallet(renter));
+
+        (RentableTypes.ExpiryEntry[] memory entries, ) = rentable
+            .pendingExpirations(0, 100);
+        assertEq(entries.length, 1);
+        assertEq(entries[0].tokenAddress, address(testNFT));
+        assertEq(entries[0].tokenId, third);
+        assertEq(
+            entries[0].expiresAt,
+            rentable.expiresAt(address(testNFT), third)
+        );
+
+        vm.warp(block.timestamp + 1 hours);
+
+        assertEq(rentable.expireDue(100), 1);
+        assertEq(testNFT.ownerOf(third), address(rentable));
+        assertEq(_pendingCount(), 0);
+    }
+
+    function testExpireDueWithinCurrentBucket() public executeByUser(user) {
+        _rentFor(30 minutes);
+        uint256 later = _rentFor(50 minutes);
+
+        vm.warp(block.timestamp + 30 minutes);
+
+        assertEq(rentable.expireDue(100), 1);
+        // not due entries are kept at the head
+        assertEq(rentable.expireDue(100), 0);
+
+        vm.warp(block.timestamp + 20 minutes);
+
+        assertEq(rentable.expireDue(100), 1);
+        assertEq(testNFT.ownerOf(later), address(rentable));
+    }
+
+    function testExpireDueMaxCount() public executeByUser(user) {
+        for (uint256 i = 0; i < 5; i++) {
+            _rentFor(1 hours);
+        }
+
+        vm.warp(block.timestamp + 1 hours);
+
+        assertEq(rentable.expireDue(2), 2);
+        assertEq(rentable.expireDue(2), 2);
+        assertEq(rentable.expireDue(10), 1);
+        assertEq(rentable.expireDue(10), 0);
+    }
+
+    function testExpireDueSkipsSettled() public executeByUser(user) {
+        uint256 settled = _rentFor(1 hours);
+        _rentFor(1 hours);
+
+        vm.warp(block.timestamp + 1 hours);
+
+        rentable.expireRental(address(testNFT), settled);
+
+        assertEq(_pendingCount(), 1);
+        assertEq(rentable.expireDue(10), 1);
+    }
+
+    function testExpireDueSkipsSuperseded() public executeByUser(user) {
+        uint256 rented = _rentFor(1 hours);
+
+        vm.warp(block.timestamp + 1 hours);
+
+        // rent again, the previous rental is settled inline
+        uint256 duration = 3 hours;
+        uint256 value = duration * pricePerSecond;
+        switchUser(renter);
+        depositAndApprove(renter, value, address(0), 0);
+        rentable.rent{value: value}(address(testNFT), rented, duration);
+        switchUser(user);
+
+        assertEq(_pendingCount(), 1);
+        assertEq(rentable.expireDue(10), 0);
+
+        vm.warp(block.timestamp + duration);
+
+        assertEq(rentable.expireDue(10), 1);
+        assertEq(testNFT.ownerOf(rented), address(rentable));
+    }
+
+    function testExpireDueSkipsIdleBuckets() public executeByUser(user) {
+        _rentFor(1 hours);
+
+        // far after the last queued rental
+        vm.warp(block.timestamp + 1000 hours);
+
+        assertEq(rentable.expireDue(2), 1);
+
+        // idle buckets were jumped, not walked
+        uint256 rented = _rentFor(1 hours);
+        vm.warp(block.timestamp + 1 hours);
+
+        assertEq(rentable.expireDue(2), 1);
+        assertEq(testNFT.ownerOf(rented), address(rentable));
+    }
+
+    function testExpireDueOutOfGas() public executeByUser(user) {
+        uint256 rented = _rentFor(1 hours);
+
+        vm.warp(block.timestamp + 1 hours);
+
+        // a gas limit too low to settle must not skip the entry
+        bool settled;
+        for (uint256 gas = 30_000; !settled && gas < 1_000_000; gas += 2_000) {
+            (bool success, ) = address(rentable).call{gas: gas}(
+                abi.encodeWithSelector(rentable.expireDue.selector, 10)
+            );
+            if (success) {
+                settled = testNFT.ownerOf(rented) == address(rentable);
+                assertTrue(settled || _pendingCount() == 1);
+            }
+        }
+
+        assertTrue(settled);
+    }
+
+    function testExpireDueEmptyQueue() public {
+        assertEq(rentable.expireDue(10), 0);
+
+        (RentableTypes.ExpiryEntry[] memory entries, uint256 cursor) = rentable
+            .pendingExpirations(0, 10);
+        assertEq(entries.length, 0);
+        assertEq(cursor, 0);
+    }
+
+    function testExpireDueWhenPaused() public {
+        vm.prank(operator);
+        rentable.SCRAM();
+
+        vm.expectRevert(bytes("Pausable: paused"));
+        rentable.expireDue(10);
+    }
+}
@@ -0,0 +1,224 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableExtendRental is SharedSetup {
+    uint256 rentalDuration = 1 days;
+
+    function _rentCurrent() internal {
+        uint256 value = rentalDuration * pricePerSecond;
+
+        switchUser(renter);
+        depositAndApprove(renter, value, paymentTokenAddress, paymentTokenId);
+        rentable.rent{value: paymentTokenAddress == address(0) ? value : 0}(
+            address(testNFT),
+            tokenId,
+            rentalDuration
+        );
+        switchUser(user);
+    }
+
+    function _extend(uint256 extraDuration) internal {
+        uint256 value = extraDuration * pricePerSecond;
+
+        switchUser(renter);
+        depositAndApprove(renter, value, paymentTokenAddress, paymentTokenId);
+        rentable.extendRental{
+            value: paymentTokenAddress == address(0) ? value : 0
+        }(address(testNFT), tokenId, extraDuration);
+        switchUser(user);
+    }
+
+    function testExtendRental()
+        public
+        payable
+        protocolFeeCoverage
+        paymentTokensCoverage
+        executeByUser(user)
+    {
+        _prepareRent();
+        _rentCurrent();
+
+        uint256 extraDuration = 2 days;
+        uint256 value = extraDuration * pricePerSecond;
+        uint256 eta = rentable.expiresAt(address(testNFT), tokenId) +
+            extraDuration;
+
+        uint256 preBalanceUser = getBalance(
+            user,
+            paymentTokenAddress,
+            paymentTokenId
+        );
+        uint256 preBalanceFeeCollector = getBalance(
+            feeCollector,
+            paymentTokenAddress,
+            paymentTokenId
+        );
+
+        switchUser(renter);
+        depositAndApprove(renter, value, paymentTokenAddress, paymentTokenId);
+
+        vm.expectEmit(true, true, true, true);
+        emit RentalExtended(
+            user,
+            renter,
+            address(testNFT),
+            tokenId,
+            extraDuration,
+            eta
+        );
+
+        rentable.extendRental{
+            value: paymentTokenAddress == address(0) ? value : 0
+        }(address(testNFT), tokenId, extraDuration);
+        switchUser(user);
+
+        assertEq(rentable.expiresAt(address(testNFT), tokenId), eta);
+        assertEq(getBalance(renter, paymentTokenAddress, paymentTokenId), 0);
+
+        uint256 totalFeesToPay = (value * rentable.getFee()) / 10_000;
+        assertEq(
+            getBalance(feeCollector, paymentTokenAddress, paymentTokenId) -
+                preBalanceFeeCollector,
+            totalFeesToPay
+        );
+        assertEq(
+            getBalance(user, paymentTokenAddress, paymentTokenId) -
+                preBalanceUser,
+            value - totalFeesToPay
+        );
+
+        // no burn, re-mint or transfer
+        assertEq(wrentable.ownerOf(tokenId), renter);
+        assertEq(testNFT.ownerOf(tokenId), rentable.userWallet(renter));
+
+        vm.warp(block.timestamp + rentalDuration + 1);
+        assertTrue(!rentable.isExpired(address(testNFT), tokenId));
+
+        vm.warp(eta);
+        rentable.expireRental(address(testNFT), tokenId);
+        assertEq(testNFT.ownerOf(tokenId), address(rentable));
+    }
+
+    function testExtendRentalUsesCurrentConditions() public executeByUser(user) {
+        _prepareRent();
+        _rentCurrent();
+
+        pricePerSecond = 0.002 ether;
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            tokenId,
+            RentableTypes.RentalConditions({
+                minTimeDuration: 0,
+                maxTimeDuration: maxTimeDuration,
+                pricePerSecond: pricePerSecond,
+                paymentTokenId: paymentTokenId,
+                paymentTokenAddress: paymentTokenAddress,
+                privateRenter: address(0)
+            })
+        );
+
+        uint256 preBalanceUser = user.balance;
+        _extend(1 days);
+
+        assertEq(user.balance - preBalanceUser, 1 days * pricePerSecond);
+    }
+
+    function testCannotExtendMoreThanAllowed() public executeByUser(user) {
+        _prepareRent();
+        _rentCurrent();
+
+        uint256 extraDuration = maxTimeDuration - rentalDuration + 1;
+        uint256 value = extraDuration * pricePerSecond;
+
+        switchUser(renter);
+        vm.deal(renter, value);
+        vm.expectRevert(bytes("Duration greater than conditions"));
+        rentable.extendRental{value: value}(
+            address(testNFT),
+            tokenId,
+            extraDuration
+        );
+    }
+
+    function testCannotExtendForZeroSeconds() public executeByUser(user) {
+        _prepareRent();
+        _rentCurrent();
+
+        switchUser(renter);
+        vm.expectRevert(bytes("Duration cannot be zero"));
+        rentable.extendRental(address(testNFT), tokenId, 0);
+    }
+
+    function testCannotExtendOthersRental() public executeByUser(user) {
+        _prepareRent();
+        _rentCurrent();
+
+        address other = getNewAddress();
+        switchUser(other);
+        vm.deal(other, 1 ether);
+        vm.expectRevert(bytes("Only renter can extend"));
+        rentable.extendRental{value: 1 ether}(address(testNFT), tokenId, 1);
+    }
+
+    function testCannotExtendExpiredRental() public executeByUser(user) {
+        _prepareRent();
+        _rentCurrent();
+
+        vm.warp(block.timestamp + rentalDuration);
+
+        switchUser(renter);
+        vm.deal(renter, 1 ether);
+        vm.expectRevert(bytes("Rental not active"));
+        rentable.extendRental{value: 1 ether}(address(testNFT), tokenId, 1);
+    }
+
+    function testCannotExtendNotRented() public executeByUser(user) {
+        _prepareRent();
+
+        switchUser(renter);
+        vm.expectRevert(bytes("Rental not active"));
+        rentable.extendRental(address(testNFT), tokenId, 1);
+    }
+
+    function testCannotExtendWhenDelisted() public executeByUser(user) {
+        _prepareRent();
+        _rentCurrent();
+
+        rentable.deleteRentalConditions(address(testNFT), tokenId);
+
+        switchUser(renter);
+        vm.deal(renter, 1 ether);
+        vm.expectRevert(bytes("Not available"));
+        rentable.extendRental{value: 1 ether}(address(testNFT), tokenId, 1);
+    }
+
+    function testCannotExtendWhenReservedForAnotherUser()
+        public
+        executeByUser(user)
+    {
+        _prepareRent();
+        _rentCurrent();
+
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            tokenId,
+            RentableTypes.RentalConditions({
+                minTimeDuration: 0,
+                maxTimeDuration: maxTimeDuration,
+                pricePerSecond: pricePerSecond,
+                paymentTokenId: paymentTokenId,
+                paymentTokenAddress: paymentTokenAddress,
+                privateRenter: getNewAddress()
+            })
+        );
+
+        switchUser(renter);
+        vm.deal(renter, 1 ether);
+        vm.expectRevert(bytes("Rental reserved for another user"));
+        rentable.extendRental{value: 1 ether}(address(testNFT), tokenId, 1);
+    }
+}
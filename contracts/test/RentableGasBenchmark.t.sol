@@ -0,0 +1,521 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {TestLand} from "./mocks/TestLand.sol";
+import {TestERC4907} from "./mocks/TestERC4907.sol";
+import {RentableExpiryQueueHarness} from "./mocks/RentableExpiryQueueHarness.sol";
+
+import {DecentralandCollectionLibrary} from "../collections/decentraland/DecentralandCollectionLibrary.sol";
+import {OLandRegistry} from "../collections/decentraland/OLandRegistry.sol";
+import {ILandRegistry} from "../collections/decentraland/ILandRegistry.sol";
+import {ERC4907CollectionLibrary} from "../collections/erc4907/ERC4907CollectionLibrary.sol";
+import {ORentable} from "../tokenization/ORentable.sol";
+import {WRentable} from "../tokenization/WRentable.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+import {Strings} from "@openzeppelin/contracts/utils/Strings.sol";
+
+/// Fixed scenarios measuring the gas of every protocol flow.
+/// Every measure is logged as `gas/<flow>: <gas>` and collected by
+/// scripts/gas_benchmark.py, do not rename flows without resetting the history.
+/// Setup runs in the same transaction as the measure, so slots touched during
+/// setup are warm: numbers are meant to be compared across commits.
+contract RentableGasBenchmark is SharedSetup {
+    uint256 constant RENTAL_DURATION = 1 days;
+
+    TestLand testLand;
+    OLandRegistry oLand;
+    WRentable wLand;
+
+    TestERC4907 testUserNFT;
+
+    uint256 gasStart;
+
+    function setUp() public override {
+        super.setUp();
+
+        vm.startPrank(governance);
+
+        testLand = new TestLand();
+
+        oLand = new OLandRegistry(
+            address(testLand),
+            governance,
+            address(rentable)
+        );
+        rentable.setORentable(address(testLand), address(oLand));
+
+        wLand = new WRentable(address(testLand), governance, address(rentable));
+        rentable.setWRentable(address(testLand), address(wLand));
+
+        rentable.setLibrary(
+            address(testLand),
+            address(new DecentralandCollectionLibrary())
+        );
+        rentable.enableProxyCall(
+            address(oLand),
+            ILandRegistry.setUpdateOperator.selector,
+            true
+        );
+
+        testUserNFT = new TestERC4907();
+        rentable.setORentable(
+            address(testUserNFT),
+            address(
+                new ORentable(
+                    address(testUserNFT),
+                    governance,
+                    address(rentable)
+                )
+            )
+        );
+        rentable.setWRentable(
+            address(testUserNFT),
+            address(
+                new WRentable(
+                    address(testUserNFT),
+                    governance,
+                    address(rentable)
+                )
+            )
+        );
+        rentable.setLibrary(
+            address(testUserNFT),
+            address(new ERC4907CollectionLibrary())
+        );
+
+        rentable.setFee(250);
+
+        vm.stopPrank();
+
+        pricePerSecond = 0.001 ether;
+        renter = getNewAddress();
+    }
+
+    /* ---------- Helpers ---------- */
+
+    function _start() internal {
+        gasStart = gasleft();
+    }
+
+    function _stop(string memory flow) internal {
+        uint256 gasUsed = gasStart - gasleft();
+        emit log_named_uint(string(abi.encodePacked("gas/", flow)), gasUsed);
+    }
+
+    function _rc(address _paymentTokenAddress)
+        internal
+        view
+        returns (bytes memory)
+    {
+        return
+            abi.encode(
+                RentableTypes.RentalConditions({
+                    minTimeDuration: 0,
+                    maxTimeDuration: 10 days,
+                    pricePerSecond: pricePerSecond,
+                    paymentTokenId: 0,
+                    paymentTokenAddress: _paymentTokenAddress,
+                    privateRenter: address(0)
+                })
+            );
+    }
+
+    function _list(address _paymentTokenAddress) internal returns (uint256) {
+        switchUser(user);
+        prepareTestDeposit();
+        testNFT.safeTransferFrom(
+            user,
+            address(rentable),
+            tokenId,
+            _rc(_paymentTokenAddress)
+        );
+        return tokenId;
+    }
+
+    function _listLand() internal returns (uint256) {
+        switchUser(user);
+        testLand.mint(user, ++tokenId);
+        testLand.safeTransferFrom(
+            user,
+            address(rentable),
+            tokenId,
+            _rc(address(0))
+        );
+        return tokenId;
+    }
+
+    function _listUserNFT() internal returns (uint256) {
+        switchUser(user);
+        testUserNFT.mint(user, ++tokenId);
+        testUserNFT.safeTransferFrom(
+            user,
+            address(rentable),
+            tokenId,
+            _rc(address(0))
+        );
+        return tokenId;
+    }
+
+    function _fundRenter(address _paymentTokenAddress, uint256 value) internal {
+        switchUser(renter);
+        depositAndApprove(renter, value, _paymentTokenAddress, 0);
+    }
+
+    function _benchmarkRent(
+        string memory flow,
+        address _paymentTokenAddress,
+        bool existingWallet
+    ) internal {
+        uint256 listedTokenId = _list(_paymentTokenAddress);
+
+        if (existingWallet) {
+            rentable.createWalletForUser(renter);
+        }
+
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        _fundRenter(_paymentTokenAddress, value);
+
+        _start();
+        rentable.rent{value: _paymentTokenAddress == address(0) ? value : 0}(
+            address(testNFT),
+            listedTokenId,
+            RENTAL_DURATION
+        );
+        _stop(flow);
+    }
+
+    function _rentMany(address _tokenAddress, uint256 count)
+        internal
+        returns (address[] memory tokenAddresses, uint256[] memory tokenIds)
+    {
+        tokenAddresses = new address[](count);
+        tokenIds = new uint256[](count);
+
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        rentable.createWalletForUser(renter);
+
+        for (uint256 i = 0; i < count; i++) {
+            tokenAddresses[i] = _tokenAddress;
+            tokenIds[i] = _tokenAddress == address(testUserNFT)
+                ? _listUserNFT()
+                : _list(address(0));
+
+            _fundRenter(address(0), value);
+            rentable.rent{value: value}(
+                _tokenAddress,
+                tokenIds[i],
+                RENTAL_DURATION
+            );
+        }
+
+        vm.warp(block.timestamp + RENTAL_DURATION + 1);
+    }
+
+    function _benchmarkExpireRentals(
+        string memory flow,
+        address _tokenAddress,
+        uint256 count
+    ) internal {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds
+        ) = _rentMany(_tokenAddress, count);
+
+        _start();
+        rentable.expireRentals(tokenAddresses, tokenIds);
+        _stop(flow);
+    }
+
+    function _benchmarkExpireDue(string memory flow, uint256 count) internal {
+        _rentMany(address(testNFT), count);
+
+        _start();
+        rentable.expireDue(count);
+        _stop(flow);
+    }
+
+    /* ---------- Deposit ---------- */
+
+    function testBenchmarkDeposit() public executeByUser(user) {
+        prepareTestDeposit();
+
+        _start();
+        testNFT.safeTransferFrom(user, address(rentable), tokenId);
+        _stop("deposit");
+    }
+
+    function testBenchmarkDepositAndList() public executeByUser(user) {
+        prepareTestDeposit();
+        bytes memory data = _rc(address(0));
+
+        _start();
+        testNFT.safeTransferFrom(user, address(rentable), tokenId, data);
+        _stop("depositAndList");
+    }
+
+    /* ---------- Rent ---------- */
+
+    function testBenchmarkRentEther() public executeByUser(user) {
+        _benchmarkRent("rent/ether", address(0), true);
+    }
+
+    function testBenchmarkRentERC20() public executeByUser(user) {
+        _benchmarkRent("rent/erc20", address(weth), true);
+    }
+
+    function testBenchmarkRentERC1155() public executeByUser(user) {
+        _benchmarkRent("rent/erc1155", address(dummy1155), true);
+    }
+
+    function testBenchmarkRentNewWallet() public executeByUser(user) {
+        _benchmarkRent("rent/newWallet", address(0), false);
+    }
+
+    function testBenchmarkRentSharedExpiryBucket() public executeByUser(user) {
+        // expiry queue bucket already allocated by another renter
+        uint256 listedTokenId = _list(address(0));
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        rentable.createWalletForUser(renter);
+        _fundRenter(address(0), value);
+        rentable.rent{value: value}(
+            address(testNFT),
+            listedTokenId,
+            RENTAL_DURATION
+        );
+
+        // fresh renter with an existing wallet, same as rent/ether
+        renter = getNewAddress();
+        _benchmarkRent("rent/sharedExpiryBucket", address(0), true);
+    }
+
+    function testBenchmarkExpiryQueueOverhead() public executeByUser(user) {
+        // expiry queue share of rent/ether and extendRental,
+        // rent before the queue = rent/ether - expiryQueue/enqueue
+        RentableExpiryQueueHarness harness = new RentableExpiryQueueHarness(
+            governance,
+            operator
+        );
+        uint256 eta = block.timestamp + RENTAL_DURATION;
+
+        _start();
+        harness.enqueueExpiry(address(testNFT), tokenId, eta);
+        _stop("expiryQueue/enqueue");
+
+        _start();
+        harness.enqueueExpiry(address(testNFT), tokenId + 1, eta);
+        _stop("expiryQueue/enqueueSharedBucket");
+    }
+
+    function testBenchmarkExtendRental() public executeByUser(user) {
+        uint256 listedTokenId = _list(address(0));
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        rentable.createWalletForUser(renter);
+        _fundRenter(address(0), value);
+        rentable.rent{value: value}(
+            address(testNFT),
+            listedTokenId,
+            RENTAL_DURATION
+        );
+
+        _fundRenter(address(0), value);
+
+        _start();
+        rentable.extendRental{value: value}(
+            address(testNFT),
+            listedTokenId,
+            RENTAL_DURATION
+        );
+        _stop("extendRental");
+    }
+
+    /* ---------- Expire ---------- */
+
+    function testBenchmarkExpireRentals1() public executeByUser(user) {
+        _benchmarkExpireRentals("expireRentals/1", address(testNFT), 1);
+    }
+
+    function testBenchmarkExpireRentals10() public executeByUser(user) {
+        _benchmarkExpireRentals("expireRentals/10", address(testNFT), 10);
+    }
+
+    function testBenchmarkExpireRentals100() public executeByUser(user) {
+        _benchmarkExpireRentals("expireRentals/100", address(testNFT), 100);
+    }
+
+    function testBenchmarkExpireDue10() public executeByUser(user) {
+        _benchmarkExpireDue("expireDue/10", 10);
+    }
+
+    function testBenchmarkExpireDue100() public executeByUser(user) {
+        _benchmarkExpireDue("expireDue/100", 100);
+    }
+
+    /* ---------- Hooks ---------- */
+
+    function testBenchmarkAfterOTokenTransfer() public executeByUser(user) {
+        uint256 listedTokenId = _list(address(0));
+        address receiver = getNewAddress();
+
+        _start();
+        orentable.transferFrom(user, receiver, listedTokenId);
+        _stop("afterOTokenTransfer");
+    }
+
+    function testBenchmarkDecentralandDepositAndList()
+        public
+        executeByUser(user)
+    {
+        testLand.mint(user, ++tokenId);
+        bytes memory data = _rc(address(0));
+
+        _start();
+        testLand.safeTransferFrom(user, address(rentable), tokenId, data);
+        _stop("decentraland/depositAndList");
+    }
+
+    function testBenchmarkDecentralandRent() public executeByUser(user) {
+        uint256 landId = _listLand();
+        rentable.createWalletForUser(renter);
+
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        _fundRenter(address(0), value);
+
+        _start();
+        rentable.rent{value: value}(address(testLand), landId, RENTAL_DURATION);
+        _stop("decentraland/rent");
+    }
+
+    function testBenchmarkDecentralandExpireRental()
+        public
+        executeByUser(user)
+    {
+        uint256 landId = _listLand();
+        rentable.createWalletForUser(renter);
+
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        _fundRenter(address(0), value);
+        rentable.rent{value: value}(address(testLand), landId, RENTAL_DURATION);
+
+        vm.warp(block.timestamp + RENTAL_DURATION + 1);
+
+        _start();
+        rentable.expireRental(address(testLand), landId);
+        _stop("decentraland/expireRental");
+    }
+
+    function _rentLands(uint256 count)
+        internal
+        returns (address[] memory tokenAddresses, uint256[] memory tokenIds)
+    {
+        tokenAddresses = new address[](count);
+        tokenIds = new uint256[](count);
+        uint256[] memory durations = new uint256[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            tokenAddresses[i] = address(testLand);
+            tokenIds[i] = _listLand();
+            durations[i] = RENTAL_DURATION;
+        }
+
+        rentable.createWalletForUser(renter);
+        uint256 value = RENTAL_DURATION * pricePerSecond * count;
+        _fundRenter(address(0), value);
+
+        _start();
+        rentable.rentBatch{value: value}(tokenAddresses, tokenIds, durations);
+        _stop(
+            string(
+                abi.encodePacked(
+                    "decentraland/rentBatch/",
+                    Strings.toString(count)
+                )
+            )
+        );
+    }
+
+    function _benchmarkDecentralandExpireRentals(uint256 count) internal {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds
+        ) = _rentLands(count);
+
+        vm.warp(block.timestamp + RENTAL_DURATION + 1);
+
+        _start();
+        rentable.expireRentals(tokenAddresses, tokenIds);
+        _stop(
+            string(
+                abi.encodePacked(
+                    "decentraland/expireRentals/",
+                    Strings.toString(count)
+                )
+            )
+        );
+    }
+
+    function testBenchmarkDecentralandBatch1() public executeByUser(user) {
+        _benchmarkDecentralandExpireRentals(1);
+    }
+
+    function testBenchmarkDecentralandBatch10() public executeByUser(user) {
+        _benchmarkDecentralandExpireRentals(10);
+    }
+
+    function testBenchmarkDecentralandBatch50() public executeByUser(user) {
+        _benchmarkDecentralandExpireRentals(50);
+    }
+
+    /* ---------- User role (ERC-4907) ---------- */
+
+    // compare with rent/ether and expireRentals/*, the wrapped token
+    // is kept by Rentable and only the user role is assigned
+
+    function testBenchmarkUserRoleRent() public executeByUser(user) {
+        uint256 listedTokenId = _listUserNFT();
+
+        uint256 value = RENTAL_DURATION * pricePerSecond;
+        _fundRenter(address(0), value);
+
+        _start();
+        rentable.rent{value: value}(
+            address(testUserNFT),
+            listedTokenId,
+            RENTAL_DURATION
+        );
+        _stop("userRole/rent");
+    }
+
+    function testBenchmarkUserRoleExpireRentals1() public executeByUser(user) {
+        _benchmarkExpireRentals(
+            "userRole/expireRentals/1",
+            address(testUserNFT),
+            1
+        );
+    }
+
+    function testBenchmarkUserRoleExpireRentals10()
+        public
+        executeByUser(user)
+    {
+        _benchmarkExpireRentals(
+            "userRole/expireRentals/10",
+            address(testUserNFT),
+            10
+        );
+    }
+
+    function testBenchmarkUserRoleExpireRentals100()
+        public
+        executeByUser(user)
+    {
+        _benchmarkExpireRentals(
+            "userRole/expireRentals/100",
+            address(testUserNFT),
+            100
+        );
+    }
+}
@@ -0,0 +1,89 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {IERC721ExistExtension} from "../interfaces/IERC721ExistExtension.sol";
+import {RentableMulticall} from "../utils/RentableMulticall.sol";
+
+contract RentableMulticallTest is SharedSetup {
+    RentableMulticall multicall;
+
+    function setUp() public override {
+        super.setUp();
+
+        multicall = new RentableMulticall();
+    }
+
+    function testAggregate() public payable executeByUser(user) {
+        _prepareRent();
+
+        uint256 rentalDuration = 80;
+        uint256 value = 0.08 ether;
+
+        switchUser(renter);
+        depositAndApprove(renter, value, paymentTokenAddress, paymentTokenId);
+
+        rentable.rent{value: value}(address(testNFT), tokenId, rentalDuration);
+
+        RentableMulticall.Call[] memory calls = new RentableMulticall.Call[](5);
+        calls[0] = RentableMulticall.Call(
+            address(rentable),
+            abi.encodeWithSelector(
+                rentable.expiresAt.selector,
+                address(testNFT),
+                tokenId
+            )
+        );
+        calls[1] = RentableMulticall.Call(
+            address(rentable),
+            abi.encodeWithSelector(
+                rentable.isExpired.selector,
+                address(testNFT),
+                tokenId
+            )
+        );
+        calls[2] = RentableMulticall.Call(
+            address(orentable),
+            abi.encodeWithSelector(orentable.ownerOf.selector, tokenId)
+        );
+        calls[3] = RentableMulticall.Call(
+            address(wrentable),
+            abi.encodeWithSelector(
+                IERC721ExistExtension.ownerOf.selector,
+                tokenId,
+                true
+            )
+        );
+        // not existing token
+        calls[4] = RentableMulticall.Call(
+            address(orentable),
+            abi.encodeWithSelector(orentable.ownerOf.selector, tokenId + 1)
+        );
+
+        (
+            uint256 blockNumber,
+            RentableMulticall.Result[] memory results
+        ) = multicall.aggregate(calls);
+
+        assertEq(blockNumber, block.number);
+        assertEq(results.length, calls.length);
+
+        assertTrue(results[0].success);
+        assertEq(
+            abi.decode(results[0].returnData, (uint256)),
+            block.timestamp + rentalDuration
+        );
+
+        assertTrue(results[1].success);
+        assertTrue(!abi.decode(results[1].returnData, (bool)));
+
+        assertTrue(results[2].success);
+        assertEq(abi.decode(results[2].returnData, (address)), user);
+
+        assertTrue(results[3].success);
+        assertEq(abi.decode(results[3].returnData, (address)), renter);
+
+        assertTrue(!results[4].success);
+    }
+}
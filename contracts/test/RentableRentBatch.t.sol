@@ -0,0 +1,340 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableRentBatch is SharedSetup {
+    uint256 constant BENCHMARK_SIZE = 10;
+
+    uint256 rentalDuration = 80;
+
+    function _listMany(uint256 count, address _paymentTokenAddress)
+        internal
+        returns (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        )
+    {
+        pricePerSecond = 0.001 ether;
+
+        tokenAddresses = new address[](count);
+        tokenIds = new uint256[](count);
+        durations = new uint256[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            prepareTestDeposit();
+
+            testNFT.safeTransferFrom(
+                user,
+                address(rentable),
+                tokenId,
+                abi.encode(
+                    RentableTypes.RentalConditions({
+                        minTimeDuration: 0,
+                        maxTimeDuration: 10 days,
+                        pricePerSecond: pricePerSecond,
+                        paymentTokenId: paymentTokenId,
+                        paymentTokenAddress: _paymentTokenAddress,
+                        privateRenter: address(0)
+                    })
+                )
+            );
+
+            tokenAddresses[i] = address(testNFT);
+            tokenIds[i] = tokenId;
+            durations[i] = rentalDuration;
+        }
+    }
+
+    function testRentBatch()
+        public
+        payable
+        protocolFeeCoverage
+        paymentTokensCoverage
+        executeByUser(user)
+    {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        ) = _listMany(3, paymentTokenAddress);
+
+        renter = getNewAddress();
+
+        uint256 itemPayment = rentalDuration * pricePerSecond;
+        uint256 value = itemPayment * tokenIds.length;
+
+        switchUser(renter);
+        depositAndApprove(renter, value, paymentTokenAddress, paymentTokenId);
+
+        uint256 preBalanceUser = getBalance(
+            user,
+            paymentTokenAddress,
+            paymentTokenId
+        );
+        uint256 preBalanceFeeCollector = getBalance(
+            feeCollector,
+            paymentTokenAddress,
+            paymentTokenId
+        );
+
+        // per item events are the same of a single rent
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            vm.expectEmit(true, true, true, true);
+            emit Rent(
+                user,
+                renter,
+                address(testNFT),
+                tokenIds[i],
+                paymentTokenAddress,
+                paymentTokenId,
+                block.timestamp + rentalDuration
+            );
+        }
+
+        rentable.rentBatch{
+            value: paymentTokenAddress == address(0) ? value : 0
+        }(tokenAddresses, tokenIds, durations);
+
+        switchUser(user);
+
+        assertEq(getBalance(renter, paymentTokenAddress, paymentTokenId), 0);
+
+        // fees are rounded per item as in a single rent
+        uint256 totalFeesToPay = ((itemPayment * rentable.getFee()) /
+            10_000) * tokenIds.length;
+
+        assertEq(
+            getBalance(feeCollector, paymentTokenAddress, paymentTokenId) -
+                preBalanceFeeCollector,
+            totalFeesToPay
+        );
+        assertEq(
+            getBalance(user, paymentTokenAddress, paymentTokenId) -
+                preBalanceUser,
+            value - totalFeesToPay
+        );
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            assertEq(wrentable.ownerOf(tokenIds[i]), renter);
+            assertEq(
+                testNFT.ownerOf(tokenIds[i]),
+                rentable.userWallet(renter)
+            );
+            assertEq(
+                rentable.expiresAt(address(testNFT), tokenIds[i]),
+                block.timestamp + rentalDuration
+            );
+        }
+    }
+
+    function testRentBatchMixedPaymentTokens()
+        public
+        payable
+        executeByUser(user)
+    {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        ) = _listMany(2, address(0));
+        (, uint256[] memory wethTokenIds, ) = _listMany(1, address(weth));
+
+        uint256[] memory allTokenIds = new uint256[](3);
+        allTokenIds[0] = tokenIds[0];
+        allTokenIds[1] = wethTokenIds[0];
+        allTokenIds[2] = tokenIds[1];
+        address[] memory allTokenAddresses = new address[](3);
+        uint256[] memory allDurations = new uint256[](3);
+        for (uint256 i = 0; i < 3; i++) {
+            allTokenAddresses[i] = tokenAddresses[0];
+            allDurations[i] = durations[0];
+        }
+
+        renter = getNewAddress();
+
+        uint256 itemPayment = rentalDuration * pricePerSecond;
+
+        switchUser(renter);
+        depositAndApprove(renter, itemPayment, address(weth), 0);
+        vm.deal(renter, itemPayment * 2);
+
+        uint256 preBalanceUser = user.balance;
+
+        rentable.rentBatch{value: itemPayment * 2}(
+            allTokenAddresses,
+            allTokenIds,
+            allDurations
+        );
+
+        assertEq(renter.balance, 0);
+        assertEq(weth.balanceOf(renter), 0);
+        assertEq(user.balance - preBalanceUser, itemPayment * 2);
+        assertEq(weth.balanceOf(user), itemPayment);
+
+        for (uint256 i = 0; i < 3; i++) {
+            assertEq(wrentable.ownerOf(allTokenIds[i]), renter);
+        }
+    }
+
+    function testRentBatchRefund() public payable executeByUser(user) {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        ) = _listMany(2, address(0));
+
+        renter = getNewAddress();
+
+        uint256 value = rentalDuration * pricePerSecond * tokenIds.length;
+        uint256 exceeding = 1 ether;
+
+        switchUser(renter);
+        vm.deal(renter, value + exceeding);
+
+        rentable.rentBatch{value: value + exceeding}(
+            tokenAddresses,
+            tokenIds,
+            durations
+        );
+
+        assertEq(renter.balance, exceeding);
+    }
+
+    function testCannotRentBatchWithoutFunds()
+        public
+        payable
+        executeByUser(user)
+    {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        ) = _listMany(2, address(0));
+
+        renter = getNewAddress();
+
+        uint256 value = rentalDuration * pricePerSecond * tokenIds.length;
+
+        switchUser(renter);
+        vm.deal(renter, value);
+
+        vm.expectRevert(bytes("Not enough funds"));
+        rentable.rentBatch{value: value - 1}(
+            tokenAddresses,
+            tokenIds,
+            durations
+        );
+    }
+
+    function testCannotRentBatchWithMismatchingArrays()
+        public
+        payable
+        executeByUser(user)
+    {
+        (address[] memory tokenAddresses, uint256[] memory tokenIds, ) = _listMany(
+            2,
+            address(0)
+        );
+
+        vm.expectRevert(bytes("Array length mismatch"));
+        rentable.rentBatch(tokenAddresses, tokenIds, new uint256[](1));
+    }
+
+    function testBenchmarkRentBatch() public payable executeByUser(user) {
+        vm.stopPrank();
+        vm.prank(governance);
+        rentable.setFee(250);
+        vm.startPrank(user);
+
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        ) = _listMany(BENCHMARK_SIZE, address(weth));
+        (, uint256[] memory batchTokenIds, ) = _listMany(
+            BENCHMARK_SIZE,
+            address(weth)
+        );
+
+        uint256 value = rentalDuration * pricePerSecond * BENCHMARK_SIZE;
+
+        address singleRenter = getNewAddress();
+        address batchRenter = getNewAddress();
+        // wallet creation is not part of the comparison
+        rentable.createWalletForUser(singleRenter);
+        rentable.createWalletForUser(batchRenter);
+
+        switchUser(batchRenter);
+        depositAndApprove(batchRenter, value, address(weth), 0);
+
+        // batch measured first, single rents benefit from already warm slots
+        uint256 batchGas = gasleft();
+        rentable.rentBatch(tokenAddresses, batchTokenIds, durations);
+        batchGas -= gasleft();
+
+        switchUser(singleRenter);
+        depositAndApprove(singleRenter, value, address(weth), 0);
+
+        uint256 singleGas = gasleft();
+        for (uint256 i = 0; i < BENCHMARK_SIZE; i++) {
+            rentable.rent(tokenAddresses[i], tokenIds[i], durations[i]);
+        }
+        singleGas -= gasleft();
+
+        emit log_named_uint("N", BENCHMARK_SIZE);
+        emit log_named_uint("N x rent", singleGas);
+        emit log_named_uint("rentBatch", batchGas);
+        assertLt(batchGas, singleGas);
+    }
+
+    function testExpireRentalsGroupsByRenterWallet()
+        public
+        executeByUser(user)
+    {
+        (
+            address[] memory tokenAddresses,
+            uint256[] memory tokenIds,
+            uint256[] memory durations
+        ) = _listMany(4, address(0));
+
+        // first two tokens to a renter, last two to another one
+        address[] memory renters = new address[](2);
+        uint256 value = rentalDuration * pricePerSecond;
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            if (i % 2 == 0) renters[i / 2] = getNewAddress();
+            switchUser(renters[i / 2]);
+            depositAndApprove(renters[i / 2], value, address(0), 0);
+            rentable.rent{value: value}(
+                tokenAddresses[i],
+                tokenIds[i],
+                durations[i]
+            );
+        }
+        switchUser(user);
+
+        vm.warp(block.timestamp + rentalDuration);
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            vm.expectEmit(true, true, true, true);
+            emit RentEnds(address(testNFT), tokenIds[i]);
+        }
+        rentable.expireRentals(tokenAddresses, tokenIds);
+
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            assertEq(testNFT.ownerOf(tokenIds[i]), address(rentable));
+            assertTrue(!wrentable.exists(tokenIds[i]));
+        }
+
+        // already settled
+        rentable.expireRentals(tokenAddresses, tokenIds);
+    }
+
+    function testCannotExpireRentalsLengthMismatch() public {
+        vm.expectRevert(bytes("Array length mismatch"));
+        rentable.expireRentals(new address[](2), new uint256[](1));
+    }
+}
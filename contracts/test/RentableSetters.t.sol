@@ -7,6 +7,9 @@ import {Address} from "@openzeppelin/contracts/utils/Address.sol";
 contract RentableSetters is SharedSetup {
     using Address for address;
 
+    string constant ONLY_GOVERNANCE_OR_FACTORY =
+        "Only Governance or Collection Factory";
+
     function testSetLibrary() public {
         address lib = getNewAddress();
         _onlyGovernance(
@@ -51,6 +54,23 @@ contract RentableSetters is SharedSetup {
         assertEq(rentable.getPaymentTokenAllowlist(token), 0);
     }
 
+    function testSetPaymentTokenAccrual() public {
+        address token = getNewAddress();
+        _onlyGovernance(
+            rentable.setPaymentTokenAccrual.selector,
+            abi.encode(token, true)
+        );
+
+        assertTrue(rentable.isPaymentTokenAccrual(token));
+
+        _onlyGovernance(
+            rentable.setPaymentTokenAccrual.selector,
+            abi.encode(token, false)
+        );
+
+        assertTrue(!rentable.isPaymentTokenAccrual(token));
+    }
+
     function testEnableDisableProxyCall() public {
         address token = getNewAddress();
         _onlyGovernance(
@@ -72,6 +92,41 @@ contract RentableSetters is SharedSetup {
         );
     }
 
+    function testSetCollectionFactory() public {
+        address factory = getNewAddress();
+        _onlyGovernance(
+            rentable.setCollectionFactory.selector,
+            abi.encode(factory)
+        );
+
+        assertEq(rentable.getCollectionFactory(), factory);
+
+        // collection factory can register collections
+        address token = getNewAddress();
+        address orentableAddress = getNewAddress();
+        vm.prank(factory);
+        rentable.setORentable(token, orentableAddress);
+        assertEq(rentable.getORentable(token), orentableAddress);
+
+        // but cannot change other settings
+        vm.prank(factory);
+        vm.expectRevert(bytes("Only Governance"));
+        rentable.setFee(100);
+
+        // nor run code in Rentable context
+        vm.prank(factory);
+        vm.expectRevert(bytes("Only Governance"));
+        rentable.setLibrary(token, getNewAddress());
+
+        vm.prank(factory);
+        vm.expectRevert(bytes("Only Governance"));
+        rentable.enableProxyCall(
+            orentableAddress,
+            testNFT.approve.selector,
+            true
+        );
+    }
+
     function testSetFeeCollector() public {
         address token = getNewAddress();
         _onlyGovernance(rentable.setFeeCollector.selector, abi.encode(token));
@@ -95,7 +150,8 @@ contract RentableSetters is SharedSetup {
         address token = getNewAddress();
         _onlyGovernance(
             rentable.setORentable.selector,
-            abi.encode(testNFT, token)
+            abi.encode(testNFT, token),
+            ONLY_GOVERNANCE_OR_FACTORY
         );
         assertEq(rentable.getORentable(address(testNFT)), token);
     }
@@ -104,15 +160,73 @@ contract RentableSetters is SharedSetup {
         address token = getNewAddress();
         _onlyGovernance(
             rentable.setWRentable.selector,
-            abi.encode(testNFT, token)
+            abi.encode(testNFT, token),
+            ONLY_GOVERNANCE_OR_FACTORY
         );
         assertEq(rentable.getWRentable(address(testNFT)), token);
     }
 
-    function _onlyGovernance(bytes4 selector, bytes memory data)
-        internal
-        executeByUser(governance)
-    {
+    function testMulticall() public {
+        address token = getNewAddress();
+        address lib = getNewAddress();
+
+        bytes[] memory data = new bytes[](3);
+        data[0] = abi.encodeWithSelector(
+            rentable.enablePaymentToken.selector,
+            token
+        );
+        data[1] = abi.encodeWithSelector(
+            rentable.setLibrary.selector,
+            address(testNFT),
+            lib
+        );
+        data[2] = abi.encodeWithSelector(
+            rentable.enableProxyCall.selector,
+            address(orentable),
+            testNFT.approve.selector,
+            true
+        );
+
+        _onlyGovernance(rentable.multicall.selector, abi.encode(data));
+
+        assertEq(rentable.getPaymentTokenAllowlist(token), 1);
+        assertEq(rentable.getLibrary(address(testNFT)), lib);
+        assertTrue(
+            rentable.isEnabledProxyCall(
+                address(orentable),
+                testNFT.approve.selector
+            )
+        );
+    }
+
+    function testMulticallIsAtomic() public executeByUser(governance) {
+        address token = getNewAddress();
+
+        bytes[] memory data = new bytes[](2);
+        data[0] = abi.encodeWithSelector(
+            rentable.enablePaymentToken.selector,
+            token
+        );
+        data[1] = abi.encodeWithSelector(
+            rentable.setFee.selector,
+            10_000 + 1
+        );
+
+        vm.expectRevert(bytes("Fee greater than max value"));
+        rentable.multicall(data);
+
+        assertEq(rentable.getPaymentTokenAllowlist(token), 0);
+    }
+
+    function _onlyGovernance(bytes4 selector, bytes memory data) internal {
+        _onlyGovernance(selector, data, "Only Governance");
+    }
+
+    function _onlyGovernance(
+        bytes4 selector,
+        bytes memory data,
+        string memory revertMessage
+    ) internal executeByUser(governance) {
         address(rentable).functionCallWithValue(
             bytes.concat(selector, data),
             0,
@@ -121,7 +235,7 @@ contract RentableSetters is SharedSetup {
 
         switchUser(getNewAddress());
 
-        vm.expectRevert(bytes("Only Governance"));
+        vm.expectRevert(bytes(revertMessage));
         address(rentable).functionCallWithValue(
             bytes.concat(selector, data),
             0,
@@ -0,0 +1,197 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableSignedOffer is SharedSetup {
+    uint256 renteeKey = 0xA11CE;
+    address rentee;
+
+    uint256 rentalDuration = 1 days;
+
+    function setUp() public override {
+        super.setUp();
+
+        rentee = vm.addr(renteeKey);
+        renter = getNewAddress();
+        pricePerSecond = 0.001 ether;
+
+        // deposit without listing
+        vm.startPrank(rentee);
+        testNFT.mint(rentee, tokenId);
+        testNFT.safeTransferFrom(rentee, address(rentable), tokenId);
+        vm.stopPrank();
+    }
+
+    function _offer(uint256 nonce)
+        internal
+        view
+        returns (RentableTypes.RentalOffer memory)
+    {
+        return
+            RentableTypes.RentalOffer({
+                tokenAddress: address(testNFT),
+                tokenId: tokenId,
+                conditions: RentableTypes.RentalConditions({
+                    minTimeDuration: 0,
+                    maxTimeDuration: 10 days,
+                    pricePerSecond: pricePerSecond,
+                    paymentTokenId: 0,
+                    paymentTokenAddress: address(0),
+                    privateRenter: address(0)
+                }),
+                nonce: nonce,
+                deadline: block.timestamp + 30 days
+            });
+    }
+
+    function _sign(uint256 key, RentableTypes.RentalOffer memory offer)
+        internal
+        returns (bytes memory)
+    {
+        (uint8 v, bytes32 r, bytes32 s) = vm.sign(
+            key,
+            rentable.hashRentalOffer(offer)
+        );
+        return abi.encodePacked(r, s, v);
+    }
+
+    function _rentWithOffer(
+        RentableTypes.RentalOffer memory offer,
+        bytes memory signature
+    ) internal {
+        uint256 value = rentalDuration * offer.conditions.pricePerSecond;
+        vm.deal(renter, value);
+        vm.prank(renter);
+        rentable.rentWithOffer{value: value}(offer, signature, rentalDuration);
+    }
+
+    function _expectRentRevert(
+        RentableTypes.RentalOffer memory offer,
+        bytes memory signature,
+        string memory reason
+    ) internal {
+        uint256 value = rentalDuration * offer.conditions.pricePerSecond;
+        vm.deal(renter, value);
+
+        vm.startPrank(renter);
+        vm.expectRevert(bytes(reason));
+        rentable.rentWithOffer{value: value}(offer, signature, rentalDuration);
+        vm.stopPrank();
+    }
+
+    function testRentWithOffer() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        uint256 preBalanceRentee = rentee.balance;
+        uint256 value = rentalDuration * pricePerSecond;
+        vm.deal(renter, value);
+
+        vm.startPrank(renter);
+        vm.expectEmit(true, true, true, true);
+        emit Rent(
+            rentee,
+            renter,
+            address(testNFT),
+            tokenId,
+            address(0),
+            0,
+            block.timestamp + rentalDuration
+        );
+        rentable.rentWithOffer{value: value}(offer, signature, rentalDuration);
+        vm.stopPrank();
+
+        assertEq(wrentable.ownerOf(tokenId), renter);
+        assertEq(testNFT.ownerOf(tokenId), rentable.userWallet(renter));
+        assertEq(rentee.balance - preBalanceRentee, value);
+
+        // no listing written on-chain
+        RentableTypes.RentalConditions memory listed = rentable
+            .rentalConditions(address(testNFT), tokenId);
+        assertEq(listed.maxTimeDuration, 0);
+
+        // the offer works as a listing, reusable once the rental ends
+        vm.warp(block.timestamp + rentalDuration);
+        renter = getNewAddress();
+        _rentWithOffer(offer, signature);
+
+        assertEq(wrentable.ownerOf(tokenId), renter);
+    }
+
+    function testCannotRentWithCancelledOffer() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        uint256[] memory nonces = new uint256[](1);
+        nonces[0] = 1;
+
+        vm.expectEmit(true, true, true, true);
+        emit RentalOfferCancelled(rentee, 1);
+
+        vm.prank(rentee);
+        rentable.cancelRentalOffers(nonces);
+
+        assertTrue(rentable.isRentalOfferCancelled(rentee, 1));
+
+        _expectRentRevert(offer, signature, "Offer cancelled");
+    }
+
+    function testCannotRentWithExpiredOffer() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        vm.warp(offer.deadline + 1);
+
+        _expectRentRevert(offer, signature, "Offer expired");
+    }
+
+    function testCannotRentWithTamperedOffer() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        offer.conditions.pricePerSecond = 1;
+
+        _expectRentRevert(offer, signature, "Invalid offer signature");
+    }
+
+    function testCannotRentWithOfferOfPreviousOwner() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        address newOwner = getNewAddress();
+        vm.prank(rentee);
+        orentable.transferFrom(rentee, newOwner, tokenId);
+
+        _expectRentRevert(offer, signature, "Invalid offer signature");
+    }
+
+    function testCannotRentWithOfferSignedByOthers() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(0xB0B, offer);
+
+        _expectRentRevert(offer, signature, "Invalid offer signature");
+    }
+
+    function testCannotRentWithOfferOnRent() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        _rentWithOffer(offer, signature);
+
+        renter = getNewAddress();
+        _expectRentRevert(offer, signature, "Current rent still pending");
+    }
+
+    function testCannotRentWithOfferDisabledPaymentToken() public {
+        RentableTypes.RentalOffer memory offer = _offer(1);
+        bytes memory signature = _sign(renteeKey, offer);
+
+        vm.prank(governance);
+        rentable.disablePaymentToken(address(0));
+
+        _expectRentRevert(offer, signature, "Not supported payment token");
+    }
+}
@@ -6,6 +6,7 @@ import {SharedSetup} from "./SharedSetup.t.sol";
 import {SimpleWallet} from "../wallet/SimpleWallet.sol";
 
 import {IWalletFactory} from "../wallet/IWalletFactory.sol";
+import {DeterministicWalletFactory} from "../wallet/DeterministicWalletFactory.sol";
 import {ProxyAdmin, TransparentUpgradeableProxy} from "@openzeppelin/contracts/proxy/transparent/ProxyAdmin.sol";
 
 contract RentableSimpleWallet is SharedSetup {
@@ -22,6 +23,33 @@ contract RentableSimpleWallet is SharedSetup {
         assertEq(newWallet.owner(), address(rentable));
     }
 
+    function testDeterministicWalletFactory() public {
+        DeterministicWalletFactory deterministicWalletFactory = new DeterministicWalletFactory(
+                address(simpleWalletBeacon)
+            );
+
+        vm.prank(governance);
+        rentable.setWalletFactory(address(deterministicWalletFactory));
+
+        address aUser = getNewAddress();
+        address payable predicted = deterministicWalletFactory.predictWallet(
+            address(rentable),
+            aUser
+        );
+
+        // wallet pre-deployed by someone else is picked up
+        deterministicWalletFactory.createWallet(address(rentable), aUser);
+
+        SimpleWallet newWallet = SimpleWallet(
+            rentable.createWalletForUser(aUser)
+        );
+
+        assertEq(address(newWallet), predicted);
+        assertEq(rentable.userWallet(aUser), predicted);
+        assertEq(newWallet.getUser(), aUser);
+        assertEq(newWallet.owner(), address(rentable));
+    }
+
     function testWalletCannotCreateMultipleTimesSameUser() public {
         address aUser = getNewAddress();
 
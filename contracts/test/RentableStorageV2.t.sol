@@ -0,0 +1,264 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {RentableV1StorageMock} from "./mocks/RentableV1StorageMock.sol";
+import {RentableTypes} from "./../RentableTypes.sol";
+
+import {TransparentUpgradeableProxy} from "@openzeppelin/contracts/proxy/transparent/ProxyAdmin.sol";
+
+contract RentableStorageV2Test is SharedSetup {
+    RentableV1StorageMock rentableV1;
+
+    // token listed with RentableStorageV1 layout
+    uint256 legacyTokenId;
+    // token listed with RentableStorageV2 layout
+    uint256 packedTokenId;
+    // token used to warm up slots shared by both layouts
+    uint256 warmupTokenId;
+
+    function setUp() public override {
+        super.setUp();
+
+        vm.startPrank(governance);
+        proxyAdmin.upgrade(
+            TransparentUpgradeableProxy(payable(address(rentable))),
+            address(new RentableV1StorageMock(governance, address(0)))
+        );
+        vm.stopPrank();
+
+        rentableV1 = RentableV1StorageMock(address(rentable));
+
+        vm.startPrank(user);
+        prepareTestDeposit();
+        legacyTokenId = tokenId;
+        testNFT.safeTransferFrom(user, address(rentable), legacyTokenId);
+        prepareTestDeposit();
+        packedTokenId = tokenId;
+        testNFT.safeTransferFrom(user, address(rentable), packedTokenId);
+        prepareTestDeposit();
+        warmupTokenId = tokenId;
+        testNFT.safeTransferFrom(user, address(rentable), warmupTokenId);
+        vm.stopPrank();
+    }
+
+    function _rc(uint256 _pricePerSecond)
+        internal
+        pure
+        returns (RentableTypes.RentalConditions memory)
+    {
+        return
+            RentableTypes.RentalConditions({
+                minTimeDuration: 1 hours,
+                maxTimeDuration: 10 days,
+                pricePerSecond: _pricePerSecond,
+                paymentTokenId: 0,
+                paymentTokenAddress: address(0),
+                privateRenter: address(0)
+            });
+    }
+
+    function _listBoth(uint256 _pricePerSecond)
+        internal
+        returns (uint256 gasV1, uint256 gasV2)
+    {
+        RentableTypes.RentalConditions memory rc = _rc(_pricePerSecond);
+
+        // only storage of the single listing must differ between measures
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            warmupTokenId,
+            rc
+        );
+
+        gasV2 = gasleft();
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            packedTokenId,
+            rc
+        );
+        gasV2 -= gasleft();
+
+        gasV1 = gasleft();
+        rentableV1.createOrUpdateRentalConditionsV1(
+            address(testNFT),
+            legacyTokenId,
+            rc
+        );
+        gasV1 -= gasleft();
+    }
+
+    function _assertRentalConditions(
+        RentableTypes.RentalConditions memory rc,
+        RentableTypes.RentalConditions memory expected
+    ) internal {
+        assertEq(rc.minTimeDuration, expected.minTimeDuration);
+        assertEq(rc.maxTimeDuration, expected.maxTimeDuration);
+        assertEq(rc.pricePerSecond, expected.pricePerSecond);
+        assertEq(rc.paymentTokenId, expected.paymentTokenId);
+        assertEq(rc.paymentTokenAddress, expected.paymentTokenAddress);
+        assertEq(rc.privateRenter, expected.privateRenter);
+    }
+
+    function testGasList() public executeByUser(user) {
+        (uint256 gasV1, uint256 gasV2) = _listBoth(0.001 ether);
+
+        emit log_named_uint("list V1", gasV1);
+        emit log_named_uint("list V2", gasV2);
+        assertLt(gasV2, gasV1);
+    }
+
+    function testGasUpdate() public executeByUser(user) {
+        _listBoth(0.001 ether);
+
+        (uint256 gasV1, uint256 gasV2) = _listBoth(0.002 ether);
+
+        emit log_named_uint("update V1", gasV1);
+        emit log_named_uint("update V2", gasV2);
+        assertLt(gasV2, gasV1);
+    }
+
+    function testGasRent() public payable executeByUser(user) {
+        _listBoth(0.001 ether);
+
+        uint256 rentalDuration = 1 days;
+        uint256 value = rentalDuration * 0.001 ether;
+
+        renter = getNewAddress();
+        switchUser(renter);
+        depositAndApprove(renter, value * 3, address(0), 0);
+        // wallet creation and cold shared slots are not part of the comparison
+        rentable.rent{value: value}(
+            address(testNFT),
+            warmupTokenId,
+            rentalDuration
+        );
+
+        uint256 gasV2 = gasleft();
+        rentable.rent{value: value}(
+            address(testNFT),
+            packedTokenId,
+            rentalDuration
+        );
+        gasV2 -= gasleft();
+
+        uint256 gasV1 = gasleft();
+        rentable.rent{value: value}(
+            address(testNFT),
+            legacyTokenId,
+            rentalDuration
+        );
+        gasV1 -= gasleft();
+
+        emit log_named_uint("rent V1", gasV1);
+        emit log_named_uint("rent V2", gasV2);
+        assertLt(gasV2, gasV1);
+    }
+
+    function testGasDelete() public executeByUser(user) {
+        _listBoth(0.001 ether);
+
+        uint256 gasV2 = gasleft();
+        rentable.deleteRentalConditions(address(testNFT), packedTokenId);
+        gasV2 -= gasleft();
+
+        uint256 gasV1 = gasleft();
+        rentableV1.deleteRentalConditionsV1(address(testNFT), legacyTokenId);
+        gasV1 -= gasleft();
+
+        // both clear a single slot, refunds are not visible to gasleft
+        emit log_named_uint("delete V1", gasV1);
+        emit log_named_uint("delete V2", gasV2);
+    }
+
+    function testLazyMigration() public payable executeByUser(user) {
+        RentableTypes.RentalConditions memory rc = _rc(0.001 ether);
+
+        rentableV1.createOrUpdateRentalConditionsV1(
+            address(testNFT),
+            legacyTokenId,
+            rc
+        );
+
+        // legacy listing is visible and rentable
+        _assertRentalConditions(
+            rentable.rentalConditions(address(testNFT), legacyTokenId),
+            rc
+        );
+
+        // update migrates to the packed layout
+        rc.pricePerSecond = 0.002 ether;
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            legacyTokenId,
+            rc
+        );
+        _assertRentalConditions(
+            rentable.rentalConditions(address(testNFT), legacyTokenId),
+            rc
+        );
+        assertEq(
+            rentableV1
+                .legacyRentalConditions(address(testNFT), legacyTokenId)
+                .maxTimeDuration,
+            0
+        );
+
+        // delete a legacy listing
+        rentableV1.createOrUpdateRentalConditionsV1(
+            address(testNFT),
+            packedTokenId,
+            rc
+        );
+        rentable.deleteRentalConditions(address(testNFT), packedTokenId);
+        assertEq(
+            rentable
+                .rentalConditions(address(testNFT), packedTokenId)
+                .maxTimeDuration,
+            0
+        );
+
+        uint256 rentalDuration = 1 days;
+        uint256 value = rentalDuration * rc.pricePerSecond;
+
+        renter = getNewAddress();
+        switchUser(renter);
+        depositAndApprove(renter, value, address(0), 0);
+
+        vm.expectRevert(bytes("Not available"));
+        rentable.rent{value: value}(
+            address(testNFT),
+            packedTokenId,
+            rentalDuration
+        );
+
+        rentable.rent{value: value}(
+            address(testNFT),
+            legacyTokenId,
+            rentalDuration
+        );
+        assertEq(wrentable.ownerOf(legacyTokenId), renter);
+    }
+
+    function testCannotListOverflowingConditions() public executeByUser(user) {
+        RentableTypes.RentalConditions memory rc = _rc(0.001 ether);
+
+        rc.maxTimeDuration = uint256(type(uint64).max) + 1;
+        vm.expectRevert(bytes("SafeCast: value doesn't fit in 64 bits"));
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            packedTokenId,
+            rc
+        );
+
+        rc.maxTimeDuration = 10 days;
+        rc.pricePerSecond = uint256(type(uint128).max) + 1;
+        vm.expectRevert(bytes("SafeCast: value doesn't fit in 128 bits"));
+        rentable.createOrUpdateRentalConditions(
+            address(testNFT),
+            packedTokenId,
+            rc
+        );
+    }
+}
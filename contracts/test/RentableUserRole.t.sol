@@ -0,0 +1,225 @@
+// SPDX-License-Identifier: AGPL-3.0-only
+pragma solidity >=0.8.7;
+
+import {SharedSetup} from "./SharedSetup.t.sol";
+
+import {TestERC4907} from "./mocks/TestERC4907.sol";
+
+import {ERC4907CollectionLibrary} from "../collections/erc4907/ERC4907CollectionLibrary.sol";
+import {ORentable} from "../tokenization/ORentable.sol";
+import {WRentable} from "../tokenization/WRentable.sol";
+
+import {RentableTypes} from "./../RentableTypes.sol";
+
+contract RentableUserRole is SharedSetup {
+    uint256 rentalDuration = 1 days;
+
+    TestERC4907 testUserNFT;
+    ORentable oUserNFT;
+    WRentable wUserNFT;
+    ERC4907CollectionLibrary userRoleLib;
+
+    function setUp() public override {
+        super.setUp();
+
+        vm.startPrank(governance);
+
+        testUserNFT = new TestERC4907();
+
+        oUserNFT = new ORentable(
+            address(testUserNFT),
+            governance,
+            address(rentable)
+        );
+        rentable.setORentable(address(testUserNFT), address(oUserNFT));
+
+        wUserNFT = new WRentable(
+            address(testUserNFT),
+            governance,
+            address(rentable)
+        );
+        rentable.setWRentable(address(testUserNFT), address(wUserNFT));
+
+        userRoleLib = new ERC4907CollectionLibrary();
+        rentable.setLibrary(address(testUserNFT), address(userRoleLib));
+
+        vm.stopPrank();
+
+        pricePerSecond = 0.001 ether;
+        renter = getNewAddress();
+    }
+
+    function _list() internal {
+        vm.startPrank(user);
+        testUserNFT.mint(user, ++tokenId);
+        testUserNFT.safeTransferFrom(
+            user,
+            address(rentable),
+            tokenId,
+            abi.encode(
+                RentableTypes.RentalConditions({
+                    minTimeDuration: 0,
+                    maxTimeDuration: 10 days,
+                    pricePerSecond: pricePerSecond,
+                    paymentTokenId: 0,
+                    paymentTokenAddress: address(0),
+                    privateRenter: address(0)
+                })
+            )
+        );
+        vm.stopPrank();
+    }
+
+    function _rentUserNFT() internal {
+        uint256 value = rentalDuration * pricePerSecond;
+        vm.deal(renter, value);
+        vm.prank(renter);
+        rentable.rent{value: value}(
+            address(testUserNFT),
+            tokenId,
+            rentalDuration
+        );
+    }
+
+    function testSetUserRoleLibrary() public {
+        assertTrue(rentable.isUserRoleCollection(address(testUserNFT)));
+        assertTrue(!rentable.isUserRoleCollection(address(testNFT)));
+
+        // back to wallet based rentals
+        vm.prank(governance);
+        rentable.setLibrary(address(testUserNFT), address(0));
+
+        assertTrue(!rentable.isUserRoleCollection(address(testUserNFT)));
+    }
+
+    function testCannotSetUserRoleLibraryWithoutERC4907() public {
+        vm.prank(governance);
+        vm.expectRevert(bytes("Collection does not support user role"));
+        rentable.setLibrary(address(testNFT), address(userRoleLib));
+    }
+
+    function testRent() public {
+        _list();
+
+        uint256 eta = block.timestamp + rentalDuration;
+        uint256 value = rentalDuration * pricePerSecond;
+        vm.deal(renter, value);
+
+        vm.startPrank(renter);
+        vm.expectEmit(true, true, true, true);
+        emit Rent(
+            user,
+            renter,
+            address(testUserNFT),
+            tokenId,
+            address(0),
+            0,
+            eta
+        );
+        rentable.rent{value: value}(
+            address(testUserNFT),
+            tokenId,
+            rentalDuration
+        );
+        vm.stopPrank();
+
+        // token kept, no renter wallet involved
+        assertEq(testUserNFT.ownerOf(tokenId), address(rentable));
+        assertEq(rentable.userWallet(renter), address(0));
+
+        assertEq(testUserNFT.userOf(tokenId), renter);
+        assertEq(testUserNFT.userExpires(tokenId), eta);
+        assertEq(wUserNFT.ownerOf(tokenId), renter);
+    }
+
+    function testExpireRental() public {
+        _list();
+        _rentUserNFT();
+
+        vm.warp(block.timestamp + rentalDuration + 1);
+
+        // the role lapses without settlement
+        assertEq(testUserNFT.userOf(tokenId), address(0));
+
+        vm.expectEmit(true, true, true, true);
+        emit RentEnds(address(testUserNFT), tokenId);
+        rentable.expireRental(address(testUserNFT), tokenId);
+
+        assertTrue(!wUserNFT.exists(tokenId));
+        assertEq(testUserNFT.ownerOf(tokenId), address(rentable));
+
+        // available again
+        renter = getNewAddress();
+        _rentUserNFT();
+        assertEq(testUserNFT.userOf(tokenId), renter);
+    }
+
+    function testWTokenTransfer() public {
+        _list();
+        _rentUserNFT();
+
+        address receiver = getNewAddress();
+        vm.prank(renter);
+        wUserNFT.transferFrom(renter, receiver, tokenId);
+
+        assertEq(testUserNFT.userOf(tokenId), receiver);
+        assertEq(
+            testUserNFT.userExpires(tokenId),
+            rentable.expiresAt(address(testUserNFT), tokenId)
+        );
+        assertEq(testUserNFT.ownerOf(tokenId), address(rentable));
+    }
+
+    function testExtendRental() public {
+        _list();
+        _rentUserNFT();
+
+        uint256 extraDuration = 1 days;
+        uint256 value = extraDuration * pricePerSecond;
+        vm.deal(renter, value);
+        vm.prank(renter);
+        rentable.extendRental{value: value}(
+            address(testUserNFT),
+            tokenId,
+            extraDuration
+        );
+
+        assertEq(
+            testUserNFT.userExpires(tokenId),
+            rentable.expiresAt(address(testUserNFT), tokenId)
+        );
+        assertEq(testUserNFT.userOf(tokenId), renter);
+    }
+
+    function testWithdrawAfterExpiry() public {
+        _list();
+        _rentUserNFT();
+
+        vm.warp(block.timestamp + rentalDuration);
+
+        vm.prank(user);
+        rentable.withdraw(address(testUserNFT), tokenId);
+
+        assertEq(testUserNFT.ownerOf(tokenId), user);
+        assertEq(testUserNFT.userOf(tokenId), address(0));
+    }
+
+    function testExpireAfterLibraryChange() public {
+        _list();
+        _rentUserNFT();
+
+        vm.prank(governance);
+        rentable.setLibrary(address(testUserNFT), address(0));
+
+        vm.warp(block.timestamp + rentalDuration);
+        rentable.expireRental(address(testUserNFT), tokenId);
+
+        assertTrue(!wUserNFT.exists(tokenId));
+        assertEq(testUserNFT.ownerOf(tokenId), address(rentable));
+
+        // next rentals use the renter wallet
+        renter = getNewAddress();
+        _rentUserNFT();
+        assertEq(testUserNFT.ownerOf(tokenId), rentable.userWallet(renter));
+    }
+}
@@ -201,6 +201,75 @@ contract SimpleWalletTest is DSTest, TestHelper {
         assertEq(value, dummy.balance);
     }
 
+    function testExecuteBatch() public {
+        address dummy = address(new DummyContract());
+
+        address[] memory to = new address[](3);
+        uint256[] memory values = new uint256[](3);
+        bytes[] memory data = new bytes[](3);
+        bool[] memory isDelegateCall = new bool[](3);
+
+        for (uint256 i = 0; i < 3; i++) {
+            to[i] = dummy;
+            data[i] = abi.encodeWithSignature("anyFunct(uint256)", i);
+        }
+        values[1] = 0.1 ether;
+        isDelegateCall[2] = true;
+
+        switchUser(user);
+        vm.expectRevert(bytes("Ownable: caller is not the owner"));
+        simpleWalletLogic.executeBatch(to, values, data, isDelegateCall);
+
+        switchUser(owner);
+        vm.deal(owner, values[1]);
+        for (uint256 i = 0; i < 3; i++) {
+            vm.expectCall(dummy, data[i]);
+        }
+        bytes[] memory results = simpleWalletLogic.executeBatch{
+            value: values[1]
+        }(to, values, data, isDelegateCall);
+
+        assertEq(results.length, 3);
+        assertEq(dummy.balance, values[1]);
+    }
+
+    function testExecuteBatchTransfersERC721() public {
+        address sender = getNewAddress();
+
+        address[] memory to = new address[](2);
+        uint256[] memory values = new uint256[](2);
+        bytes[] memory data = new bytes[](2);
+        bool[] memory isDelegateCall = new bool[](2);
+
+        for (uint256 i = 0; i < 2; i++) {
+            testNFT.mint(address(simpleWalletLogic), 123 + i);
+            to[i] = address(testNFT);
+            data[i] = abi.encodeWithSelector(
+                testNFT.transferFrom.selector,
+                address(simpleWalletLogic),
+                sender,
+                123 + i
+            );
+        }
+
+        switchUser(owner);
+        simpleWalletLogic.executeBatch(to, values, data, isDelegateCall);
+
+        assertEq(testNFT.ownerOf(123), sender);
+        assertEq(testNFT.ownerOf(124), sender);
+    }
+
+    function testCannotExecuteBatchLengthMismatch() public {
+        switchUser(owner);
+        vm.expectRevert(bytes("Array length mismatch"));
+        simpleWalletLogic.executeBatch(
+            new address[](2),
+            new uint256[](2),
+            new bytes[](1),
+            new bool[](2)
+        );
+    }
+
     function testReceiveERC721() public {
         address sender = getNewAddress();
         uint256 tokenId = 123;
@@ -0,0 +1,19 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+import {Rentable} from "../../Rentable.sol";
+
+contract RentableExpiryQueueHarness is Rentable {
+    constructor(address governance, address operator)
+        Rentable(governance, operator)
+    {}
+
+    function enqueueExpiry(
+        address tokenAddress,
+        uint256 tokenId,
+        uint256 eta
+    ) external {
+        _enqueueExpiry(tokenAddress, tokenId, eta);
+    }
+}
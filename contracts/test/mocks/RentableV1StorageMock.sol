@@ -0,0 +1,67 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+import {Rentable} from "../../Rentable.sol";
+import {RentableTypes} from "../../RentableTypes.sol";
+
+/// @dev Rentable exposing the RentableStorageV1 listing write paths,
+/// to simulate listings created before the upgrade to RentableStorageV2
+contract RentableV1StorageMock is Rentable {
+    constructor(address governance, address operator)
+        Rentable(governance, operator)
+    {}
+
+    function createOrUpdateRentalConditionsV1(
+        address tokenAddress,
+        uint256 tokenId,
+        RentableTypes.RentalConditions calldata rc
+    ) external onlyOTokenOwner(tokenAddress, tokenId) {
+        require(
+            _paymentTokenAllowlist[rc.paymentTokenAddress] != NOT_ALLOWED_TOKEN,
+            "Not supported payment token"
+        );
+
+        require(
+            rc.minTimeDuration <= rc.maxTimeDuration,
+            "Minimum duration cannot be greater than maximum"
+        );
+
+        _rentalConditions[tokenAddress][tokenId] = rc;
+
+        _postList(
+            tokenAddress,
+            tokenId,
+            msg.sender,
+            rc.minTimeDuration,
+            rc.maxTimeDuration,
+            rc.pricePerSecond
+        );
+
+        emit UpdateRentalConditions(
+            tokenAddress,
+            tokenId,
+            rc.paymentTokenAddress,
+            rc.paymentTokenId,
+            rc.minTimeDuration,
+            rc.maxTimeDuration,
+            rc.pricePerSecond,
+            rc.privateRenter
+        );
+    }
+
+    function deleteRentalConditionsV1(address tokenAddress, uint256 tokenId)
+        external
+        onlyOTokenOwner(tokenAddress, tokenId)
+    {
+        (_rentalConditions[tokenAddress][tokenId]).maxTimeDuration = 0;
+    }
+
+    function legacyRentalConditions(address tokenAddress, uint256 tokenId)
+        external
+        view
+        returns (RentableTypes.RentalConditions memory)
+    {
+        return _rentalConditions[tokenAddress][tokenId];
+    }
+}
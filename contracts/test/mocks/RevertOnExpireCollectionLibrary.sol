@@ -0,0 +1,62 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+import {ICollectionLibrary} from "../../collections/ICollectionLibrary.sol";
+
+contract RevertOnExpireCollectionLibrary is ICollectionLibrary {
+    uint256 public immutable revertTokenId;
+
+    constructor(uint256 _revertTokenId) {
+        revertTokenId = _revertTokenId;
+    }
+
+    function postDeposit(
+        address tokenAddress,
+        uint256 tokenId,
+        address user
+    ) external override {}
+
+    function postList(
+        address tokenAddress,
+        uint256 tokenId,
+        address user,
+        uint256 minTimeDuration,
+        uint256 maxTimeDuration,
+        uint256 pricePerSecond
+    ) external override {}
+
+    function postRent(
+        address tokenAddress,
+        uint256 tokenId,
+        uint256 duration,
+        address from,
+        address to,
+        address payable toWallet
+    ) external payable override {}
+
+    function postExpireRental(
+        address,
+        uint256 tokenId,
+        address
+    ) external payable override {
+        require(tokenId != revertTokenId, "always revert");
+    }
+
+    function postWTokenTransfer(
+        address tokenAddress,
+        uint256 tokenId,
+        address from,
+        address to,
+        address payable toWallet
+    ) external override {}
+
+    function postOTokenTransfer(
+        address tokenAddress,
+        uint256 tokenId,
+        address from,
+        address to,
+        address payable currentRenterWallet,
+        bool rented
+    ) external override {}
+}
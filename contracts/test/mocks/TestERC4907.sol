@@ -0,0 +1,79 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+import {ERC721} from "@openzeppelin/contracts/token/ERC721/ERC721.sol";
+
+import {IERC4907} from "../../interfaces/IERC4907.sol";
+
+// EIP-4907 reference implementation
+contract TestERC4907 is ERC721, IERC4907 {
+    struct UserInfo {
+        address user;
+        uint64 expires;
+    }
+
+    mapping(uint256 => UserInfo) internal _users;
+
+    constructor() ERC721("TestERC4907", "T4907") {}
+
+    function mint(address to, uint256 tokenId) external {
+        _mint(to, tokenId);
+    }
+
+    function setUser(
+        uint256 tokenId,
+        address user,
+        uint64 expires
+    ) external override {
+        require(
+            _isApprovedOrOwner(msg.sender, tokenId),
+            "ERC4907: transfer caller is not owner nor approved"
+        );
+        UserInfo storage info = _users[tokenId];
+        info.user = user;
+        info.expires = expires;
+        emit UpdateUser(tokenId, user, expires);
+    }
+
+    function userOf(uint256 tokenId) external view override returns (address) {
+        if (uint256(_users[tokenId].expires) >= block.timestamp) {
+            return _users[tokenId].user;
+        }
+        return address(0);
+    }
+
+    function userExpires(uint256 tokenId)
+        external
+        view
+        override
+        returns (uint256)
+    {
+        return _users[tokenId].expires;
+    }
+
+    function supportsInterface(bytes4 interfaceId)
+        public
+        view
+        virtual
+        override
+        returns (bool)
+    {
+        return
+            interfaceId == type(IERC4907).interfaceId ||
+            super.supportsInterface(interfaceId);
+    }
+
+    function _beforeTokenTransfer(
+        address from,
+        address to,
+        uint256 tokenId
+    ) internal virtual override {
+        super._beforeTokenTransfer(from, to, tokenId);
+
+        if (from != to && _users[tokenId].user != address(0)) {
+            delete _users[tokenId];
+            emit UpdateUser(tokenId, address(0), 0);
+        }
+    }
+}
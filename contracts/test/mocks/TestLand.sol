@@ -28,6 +28,19 @@ contract TestLand is ERC721, ILandRegistry {
         _updateOperator[assetId] = operator;
     }
 
+    function setManyUpdateOperator(
+        uint256[] calldata assetIds,
+        address operator
+    ) external override {
+        for (uint256 i = 0; i < assetIds.length; i++) {
+            require(
+                ownerOf(assetIds[i]) == msg.sender,
+                "You are not the owner"
+            );
+            _updateOperator[assetIds[i]] = operator;
+        }
+    }
+
     function mint(address to, uint256 assetId) external {
         _mint(to, assetId);
     }
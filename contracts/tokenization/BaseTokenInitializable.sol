@@ -4,12 +4,16 @@ pragma solidity >=0.8.7;
 
 // Inheritance
 import {ERC721ReadOnlyProxy} from "./ERC721ReadOnlyProxy.sol";
+import {IERC721BatchOwnership} from "../interfaces/IERC721BatchOwnership.sol";
 
 /// @title BaseToken for O/W tokens
 /// @author Rentable Team <hello@rentable.world>
 /// @custom:security Rentable Security Team <security@rentable.world>
 /// @notice Abstract contract integrating rentable utils
-abstract contract BaseTokenInitializable is ERC721ReadOnlyProxy {
+abstract contract BaseTokenInitializable is
+    IERC721BatchOwnership,
+    ERC721ReadOnlyProxy
+{
     /* ========== STATE VARIABLES ========== */
     // rentable reference
     address private _rentable;
@@ -95,6 +99,23 @@ abstract contract BaseTokenInitializable is ERC721ReadOnlyProxy {
         return _rentable;
     }
 
+    /// @inheritdoc IERC721BatchOwnership
+    /// @dev No expiration by default, skipExpirationCheck is ignored
+    function ownersOf(uint256[] calldata tokenIds, bool)
+        external
+        view
+        virtual
+        override
+        returns (address[] memory owners)
+    {
+        owners = new address[](tokenIds.length);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            if (_exists(tokenIds[i])) {
+                owners[i] = super.ownerOf(tokenIds[i]);
+            }
+        }
+    }
+
     // Reserved storage space to allow for layout changes in the future.
     // slither-disable-next-line unused-state
     uint256[50] private _gap;
@@ -0,0 +1,158 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {Ownable} from "@openzeppelin/contracts/access/Ownable.sol";
+
+// References
+import {Rentable} from "../Rentable.sol";
+import {BaseTokenInitializable} from "./BaseTokenInitializable.sol";
+import {ImmutableAdminUpgradeableBeaconProxy} from "../upgradability/ImmutableAdminUpgradeableBeaconProxy.sol";
+
+/// @title Rentable collection factory
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Onboard a collection in a single transaction: deploy o/w tokens and register them
+/// @dev Must be enabled in Rentable via setCollectionFactory.
+///      Library and proxy calls of the collection are set by governance
+contract RentableCollectionFactory is Ownable {
+    /* ========== STRUCTS ========== */
+
+    struct Collection {
+        address tokenAddress; // wrapped token address
+        address oBeacon; // beacon for the otoken proxy
+        address wBeacon; // beacon for the wtoken proxy
+    }
+
+    /* ========== STATE VARIABLES ========== */
+
+    // rentable reference
+    Rentable private immutable _rentable;
+
+    // admin for o/w token proxies
+    address private immutable _proxyAdmin;
+
+    /* ========== EVENTS ========== */
+
+    /// @notice Emitted on collection onboarding
+    /// @param tokenAddress wrapped token address
+    /// @param oRentable otoken address
+    /// @param wRentable wtoken address
+    event CollectionOnboarded(
+        address indexed tokenAddress,
+        address oRentable,
+        address wRentable
+    );
+
+    /* ========== CONSTRUCTOR ========== */
+
+    /// @dev Instatiate RentableCollectionFactory
+    /// @param rentable rentable address
+    /// @param proxyAdmin admin for o/w token proxies
+    constructor(address rentable, address proxyAdmin) {
+        require(rentable != address(0), "Rentable cannot be 0");
+        require(proxyAdmin != address(0), "ProxyAdmin cannot be 0");
+
+        _rentable = Rentable(rentable);
+        _proxyAdmin = proxyAdmin;
+    }
+
+    /* ========== VIEWS ========== */
+
+    /// @notice Get rentable address
+    /// @return rentable address
+    function getRentable() external view returns (address) {
+        return address(_rentable);
+    }
+
+    /// @notice Get admin for o/w token proxies
+    /// @return proxy admin address
+    function getProxyAdmin() external view returns (address) {
+        return _proxyAdmin;
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    /* ---------- Internal ---------- */
+
+    /// @dev Deploy a o/w token proxy owned by current Rentable governance
+    /// @param beacon beacon for the proxy
+    /// @param tokenAddress wrapped token address
+    /// @return proxy address
+    function _deployToken(address beacon, address tokenAddress)
+        internal
+        returns (address)
+    {
+        return
+            address(
+                new ImmutableAdminUpgradeableBeaconProxy(
+                    beacon,
+                    _proxyAdmin,
+                    abi.encodeWithSelector(
+                        BaseTokenInitializable.initialize.selector,
+                        tokenAddress,
+                        _rentable.getGovernance(),
+                        address(_rentable)
+                    )
+                )
+            );
+    }
+
+    /// @dev Deploy and register o/w tokens for a collection
+    /// @param collection collection parameters
+    /// @return oRentable otoken address
+    /// @return wRentable wtoken address
+    function _onboard(Collection calldata collection)
+        internal
+        returns (address oRentable, address wRentable)
+    {
+        address tokenAddress = collection.tokenAddress;
+
+        // onboarding never overrides an existing collection
+        require(
+            _rentable.getORentable(tokenAddress) == address(0) &&
+                _rentable.getWRentable(tokenAddress) == address(0),
+            "Collection already onboarded"
+        );
+
+        oRentable = _deployToken(collection.oBeacon, tokenAddress);
+        wRentable = _deployToken(collection.wBeacon, tokenAddress);
+
+        _rentable.setORentable(tokenAddress, oRentable);
+        _rentable.setWRentable(tokenAddress, wRentable);
+
+        emit CollectionOnboarded(tokenAddress, oRentable, wRentable);
+    }
+
+    /* ---------- Public ---------- */
+
+    /// @notice Onboard a collection
+    /// @param collection collection parameters
+    /// @return oRentable otoken address
+    /// @return wRentable wtoken address
+    function onboard(Collection calldata collection)
+        external
+        onlyOwner
+        returns (address oRentable, address wRentable)
+    {
+        return _onboard(collection);
+    }
+
+    /// @notice Onboard many collections in a single transaction
+    /// @param collections collections parameters
+    /// @return oRentables otoken addresses, same order as collections
+    /// @return wRentables wtoken addresses, same order as collections
+    function onboardMany(Collection[] calldata collections)
+        external
+        onlyOwner
+        returns (address[] memory oRentables, address[] memory wRentables)
+    {
+        oRentables = new address[](collections.length);
+        wRentables = new address[](collections.length);
+
+        for (uint256 i = 0; i < collections.length; i++) {
+            (oRentables[i], wRentables[i]) = _onboard(collections[i]);
+        }
+    }
+}
@@ -4,6 +4,7 @@ pragma solidity >=0.8.7;
 
 // Inheritance
 import {IERC721ExistExtension} from "../interfaces/IERC721ExistExtension.sol";
+import {IERC721BatchOwnership} from "../interfaces/IERC721BatchOwnership.sol";
 import {BaseTokenInitializable} from "./BaseTokenInitializable.sol";
 
 // References
@@ -75,6 +76,32 @@ contract WRentable is IERC721ExistExtension, BaseTokenInitializable {
         return _ownerOf(tokenId, skipExpirationCheck);
     }
 
+    /// @inheritdoc IERC721BatchOwnership
+    /// @dev A single expiration lookup on Rentable for all the tokens
+    function ownersOf(uint256[] calldata tokenIds, bool skipExpirationCheck)
+        external
+        view
+        override
+        returns (address[] memory owners)
+    {
+        bool[] memory expired;
+        if (!skipExpirationCheck) {
+            expired = IRentable(getRentable()).isExpiredBatch(
+                getWrapped(),
+                tokenIds
+            );
+        }
+
+        owners = new address[](tokenIds.length);
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            if (
+                (skipExpirationCheck || !expired[i]) && _exists(tokenIds[i])
+            ) {
+                owners[i] = super.ownerOf(tokenIds[i]);
+            }
+        }
+    }
+
     /// @inheritdoc IERC721ExistExtension
     function exists(uint256 tokenId) external view override returns (bool) {
         return super._exists(tokenId);
@@ -0,0 +1,45 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity >=0.8.7;
+
+/// @title Rentable multicall
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Aggregate read-only calls in a single request, all results refer to the same block
+contract RentableMulticall {
+    /* ========== STRUCTS ========== */
+
+    struct Call {
+        address target; // contract to call
+        bytes callData; // function selector + data
+    }
+
+    struct Result {
+        bool success; // false when the call reverted
+        bytes returnData; // return data or revert reason
+    }
+
+    /* ========== VIEWS ========== */
+
+    /// @notice Execute a batch of static calls, failing calls do not revert the batch
+    /// @param calls targets and respective calldata
+    /// @return blockNumber block the results refer to
+    /// @return results success flag and return data for every call, same order as calls
+    function aggregate(Call[] calldata calls)
+        external
+        view
+        returns (uint256 blockNumber, Result[] memory results)
+    {
+        blockNumber = block.number;
+        results = new Result[](calls.length);
+
+        for (uint256 i = 0; i < calls.length; i++) {
+            // slither-disable-next-line calls-loop,low-level-calls
+            (bool success, bytes memory returnData) = calls[i]
+                .target
+                .staticcall(calls[i].callData);
+
+            results[i] = Result(success, returnData);
+        }
+    }
+}
@@ -0,0 +1,102 @@
+// SPDX-License-Identifier: MIT
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {IWalletFactory} from "./IWalletFactory.sol";
+
+// Libraries
+import {Clones} from "@openzeppelin/contracts/proxy/Clones.sol";
+
+// References
+import {SimpleWallet} from "./SimpleWallet.sol";
+import {WalletBeaconForwarder} from "./WalletBeaconForwarder.sol";
+
+/// @title Rentable deterministic wallet factory
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Wallet factory deploying minimal proxies (EIP-1167) via CREATE2,
+/// wallet addresses are known in advance (see predictWallet)
+contract DeterministicWalletFactory is IWalletFactory {
+    /* ========== STATE VARIABLES ========== */
+
+    // implementation for wallet clones, following the wallet beacon
+    address private immutable _forwarder;
+
+    /* ========== CONSTRUCTOR ========== */
+
+    /// @dev Instatiate DeterministicWalletFactory
+    /// @param beacon beacon address
+    constructor(address beacon) {
+        _forwarder = address(new WalletBeaconForwarder(beacon));
+    }
+
+    /* ========== VIEWS ========== */
+
+    /* ---------- Internal ---------- */
+
+    /// @dev Wallet salt, owner is part of it so that nobody else can take a user address
+    /// @param owner address for owner role
+    /// @param user address for user role
+    /// @return salt for CREATE2
+    function _salt(address owner, address user)
+        internal
+        pure
+        returns (bytes32)
+    {
+        return keccak256(abi.encode(owner, user));
+    }
+
+    /* ---------- Public ---------- */
+
+    /// @notice Get beacon followed by wallets
+    /// @return beacon address
+    function getBeacon() external view returns (address) {
+        return WalletBeaconForwarder(payable(_forwarder)).getBeacon();
+    }
+
+    /// @notice Get implementation for wallet clones
+    /// @return forwarder address
+    function getForwarder() external view returns (address) {
+        return _forwarder;
+    }
+
+    /// @notice Get wallet address, deployed or not yet
+    /// @param owner address for owner role
+    /// @param user address for user role
+    /// @return wallet address
+    function predictWallet(address owner, address user)
+        external
+        view
+        returns (address payable)
+    {
+        return
+            payable(
+                Clones.predictDeterministicAddress(
+                    _forwarder,
+                    _salt(owner, user)
+                )
+            );
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    /// @inheritdoc IWalletFactory
+    /// @dev idempotent, returns the existing wallet if already deployed
+    function createWallet(address owner, address user)
+        external
+        override
+        returns (address payable wallet)
+    {
+        bytes32 salt = _salt(owner, user);
+
+        wallet = payable(Clones.predictDeterministicAddress(_forwarder, salt));
+
+        if (wallet.code.length == 0) {
+            // slither-disable-next-line reentrancy-benign
+            Clones.cloneDeterministic(_forwarder, salt);
+            SimpleWallet(wallet).initialize(owner, user);
+        }
+
+        return wallet;
+    }
+}
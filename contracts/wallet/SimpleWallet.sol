@@ -133,6 +133,39 @@ contract SimpleWallet is
         }
     }
 
+    /// @notice Execute many txs, all or nothing
+    /// @param to targets
+    /// @param value ether values
+    /// @param data functions+data
+    /// @param isDelegateCall true will execute a delegate call, false a call
+    /// @return returnData results, one per tx
+    function executeBatch(
+        address[] calldata to,
+        uint256[] calldata value,
+        bytes[] calldata data,
+        bool[] calldata isDelegateCall
+    ) external payable onlyOwner returns (bytes[] memory returnData) {
+        require(
+            to.length == value.length &&
+                to.length == data.length &&
+                to.length == isDelegateCall.length,
+            "Array length mismatch"
+        );
+
+        returnData = new bytes[](to.length);
+        for (uint256 i = 0; i < to.length; i++) {
+            if (isDelegateCall[i]) {
+                returnData[i] = to[i].functionDelegateCall(data[i], "");
+            } else {
+                returnData[i] = to[i].functionCallWithValue(
+                    data[i],
+                    value[i],
+                    ""
+                );
+            }
+        }
+    }
+
     /// @notice Withdraw ETH
     /// @param amount amount to withdraw
     function withdrawETH(uint256 amount) external onlyOwner {
@@ -0,0 +1,51 @@
+// SPDX-License-Identifier: MIT
+pragma solidity >=0.8.7;
+
+// Inheritance
+import {Proxy} from "@openzeppelin/contracts/proxy/Proxy.sol";
+
+// References
+import {IBeacon} from "@openzeppelin/contracts/proxy/beacon/IBeacon.sol";
+import {Address} from "@openzeppelin/contracts/utils/Address.sol";
+
+/// @title Rentable wallet beacon forwarder
+/// @author Rentable Team <hello@rentable.world>
+/// @custom:security Rentable Security Team <security@rentable.world>
+/// @notice Implementation for minimal proxy (EIP-1167) wallets.
+/// Forwards every call to the current beacon implementation, so clones follow wallet upgrades
+/// as BeaconProxy does, without storing the beacon in each wallet.
+contract WalletBeaconForwarder is Proxy {
+    /* ========== STATE VARIABLES ========== */
+
+    // beacon for wallets
+    address private immutable _beacon;
+
+    /* ========== CONSTRUCTOR ========== */
+
+    /// @dev Instatiate WalletBeaconForwarder
+    /// @param beacon beacon address
+    constructor(address beacon) {
+        require(
+            Address.isContract(IBeacon(beacon).implementation()),
+            "Beacon implementation is not a contract"
+        );
+
+        _beacon = beacon;
+    }
+
+    /* ========== VIEWS ========== */
+
+    /// @notice Get beacon followed by wallets
+    /// @return beacon address
+    function getBeacon() external view returns (address) {
+        return _beacon;
+    }
+
+    /* ---------- Internal ---------- */
+
+    /// @dev Current wallet implementation, read from the beacon on every call
+    /// @return implementation address
+    function _implementation() internal view override returns (address) {
+        return IBeacon(_beacon).implementation();
+    }
+}
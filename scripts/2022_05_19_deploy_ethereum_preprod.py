@@ -2,7 +2,6 @@ import click
 
 from brownie import (
     accounts,
-    network,
     Rentable,
     ORentable,
     WRentable,
@@ -12,15 +11,16 @@ from brownie import (
     ImmutableAdminUpgradeableBeaconProxy,
     DecentralandCollectionLibrary,
     history,
-    project,
 )
 
-oz = project.load("./lib/openzeppelin-contracts")
+from scripts.artifacts import oz
+from scripts.fees import FeeOracle, feeReport, formatFees
+
 UpgradeableBeacon = oz.UpgradeableBeacon
 ProxyAdmin = oz.ProxyAdmin
 
 
-def main():
+def main(urgency="normal"):
     dev = accounts.load("rentable-deployer")
     accounts.default = dev
 
@@ -28,7 +28,7 @@ def main():
     governance = dev
     operator = dev
     feeCollector = dev
-    network.gas_price("10 gwei")
+    fees = FeeOracle(urgency).apply()
 
     initialDeployerBalance = dev.balance()
     click.echo(
@@ -36,7 +36,7 @@ def main():
         ---- Params ----
      Deployer: {dev.address}
       Balance: {initialDeployerBalance/1e18} ETH
-    Gas Price: {network.gas_price()/1e9} gwei
+         Fees: {formatFees(fees)}
         ----------------
     """
     )
@@ -206,15 +206,11 @@ def main():
          """
     )
 
-    totalGasUsed = 0
-    for tx in history:
-        totalGasUsed += tx.gas_used
+    feeReport(history).echo()
 
     click.echo(
         f"""
             -------- Stats --------
-              TotalGas: {totalGasUsed}
-              GasPrice: {network.gas_price()/1e9} gwei
 Final Balance Deployer: {dev.balance()/1e18} ETH
            Total Spent: {(initialDeployerBalance - dev.balance())/1e18} ETH
             -----------------------
@@ -2,7 +2,6 @@ import click
 
 from brownie import (
     accounts,
-    network,
     Rentable,
     ORentable,
     WRentable,
@@ -12,20 +11,21 @@ from brownie import (
     ImmutableAdminUpgradeableBeaconProxy,
     DecentralandCollectionLibrary,
     history,
-    project,
 )
 
-oz = project.load("./lib/openzeppelin-contracts")
+from scripts.artifacts import oz
+from scripts.fees import FeeOracle, feeReport, formatFees
+
 UpgradeableBeacon = oz.UpgradeableBeacon
 ProxyAdmin = oz.ProxyAdmin
 
 
-def main():
+def main(urgency="normal"):
     dev = accounts.load("rentable-deployer")
     accounts.default = dev
 
     # params
-    network.gas_price("25 gwei")
+    fees = FeeOracle(urgency).apply()
 
     initialDeployerBalance = dev.balance()
     click.echo(
@@ -33,7 +33,7 @@ def main():
         ---- Params ----
      Deployer: {dev.address}
       Balance: {initialDeployerBalance/1e18} ETH
-    Gas Price: {network.gas_price()/1e9} gwei
+         Fees: {formatFees(fees)}
         ----------------
     """
     )
@@ -90,15 +90,11 @@ def main():
          """
     )
 
-    totalGasUsed = 0
-    for tx in history:
-        totalGasUsed += tx.gas_used
+    feeReport(history).echo()
 
     click.echo(
         f"""
             -------- Stats --------
-              TotalGas: {totalGasUsed}
-              GasPrice: {network.gas_price()/1e9} gwei
 Final Balance Deployer: {dev.balance()/1e18} ETH
            Total Spent: {(initialDeployerBalance - dev.balance())/1e18} ETH
             -----------------------
@@ -2,19 +2,20 @@ import click
 
 from brownie import (
     accounts,
-    network,
     Rentable,
     WalletFactory,
     history,
 )
 
+from scripts.fees import FeeOracle, feeReport, formatFees
 
-def main():
+
+def main(urgency="normal"):
     dev = accounts.load("rentable-deployer")
     accounts.default = dev
 
     # params
-    network.gas_price("54 gwei")
+    fees = FeeOracle(urgency).apply()
 
     initialDeployerBalance = dev.balance()
     click.echo(
@@ -22,7 +23,7 @@ def main():
         ---- Params ----
      Deployer: {dev.address}
       Balance: {initialDeployerBalance/1e18} ETH
-    Gas Price: {network.gas_price()/1e9} gwei
+         Fees: {formatFees(fees)}
         ----------------
     """
     )
@@ -45,15 +46,11 @@ def main():
          """
     )
 
-    totalGasUsed = 0
-    for tx in history:
-        totalGasUsed += tx.gas_used
+    feeReport(history).echo()
 
     click.echo(
         f"""
             -------- Stats --------
-              TotalGas: {totalGasUsed}
-              GasPrice: {network.gas_price()/1e9} gwei
 Final Balance Deployer: {dev.balance()/1e18} ETH
            Total Spent: {(initialDeployerBalance - dev.balance())/1e18} ETH
             -----------------------
@@ -2,18 +2,19 @@ import click
 
 from brownie import (
     accounts,
-    network,
     Rentable,
     history,
 )
 
+from scripts.fees import FeeOracle, feeReport, formatFees
 
-def main():
+
+def main(urgency="normal"):
     dev = accounts.load("rentable-deployer")
     accounts.default = dev
 
     # params
-    network.gas_price("51 gwei")
+    fees = FeeOracle(urgency).apply()
 
     initialDeployerBalance = dev.balance()
     click.echo(
@@ -21,7 +22,7 @@ def main():
         ---- Params ----
      Deployer: {dev.address}
       Balance: {initialDeployerBalance/1e18} ETH
-    Gas Price: {network.gas_price()/1e9} gwei
+         Fees: {formatFees(fees)}
         ----------------
     """
     )
@@ -35,15 +36,11 @@ def main():
     r.enableProxyCall(oLand, "0x9d40b850", False)  # disable updateOperator signature
     r.enableProxyCall(oLand, "0xb0b02c60", True)  # enable setUpdateOperator signature
 
-    totalGasUsed = 0
-    for tx in history:
-        totalGasUsed += tx.gas_used
+    feeReport(history).echo()
 
     click.echo(
         f"""
             -------- Stats --------
-              TotalGas: {totalGasUsed}
-              GasPrice: {network.gas_price()/1e9} gwei
 Final Balance Deployer: {dev.balance()/1e18} ETH
            Total Spent: {(initialDeployerBalance - dev.balance())/1e18} ETH
             -----------------------
@@ -1,18 +1,20 @@
 import json
 
-from brownie import accounts, network, Rentable, history, project, interface
+from brownie import accounts, Rentable, history, interface
+
+from scripts.artifacts import oz
+from scripts.fees import FeeOracle, feeReport
 
 address0 = "0x0000000000000000000000000000000000000000"
 
-oz = project.load("./lib/openzeppelin-contracts")
 UpgradeableBeacon = oz.UpgradeableBeacon
 ProxyAdmin = oz.ProxyAdmin
 
 
-def main():
+def main(urgency="normal"):
     dev = accounts.load("rentable-deployer")
     accounts.default = dev
-    network.gas_price("77 gwei")
+    FeeOracle(urgency).apply()
 
     deployment = json.load(open("deployments/ethereum-mainnet.json"))
     print(f"Deployed contracts: {len(deployment)}")
@@ -84,7 +86,7 @@ def main():
         )  ## todo use proxyadmin to get the effective admin
         print(f"{contractName} owner: {contractAdmin}")
         print(f"{contractName} expected admin: {expectedAdmin}")
-        if contractOwner != expectedAdmin and contractAdmin != address0:
+        if contractAdmin == expectedAdmin:
             print("OK!")
         else:
             print("NOT OK!")
@@ -107,8 +109,4 @@ def main():
         else:
             print("OK!")
 
-    totalGasUsed = 0
-    for tx in history:
-        totalGasUsed += tx.gas_used
-
-    print(f"Total gas used {totalGasUsed}")
+    feeReport(history).echo()
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import click
+import eth_abi
+
+from brownie import Contract, accounts, project
+
+ARTIFACT_VERSION = 1
+
+OZ_PATH = "./lib/openzeppelin-contracts"
+CACHE_DIR = "./build/artifact-cache"
+
+
+def _fileHash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class LazyContract:
+    """Cached artifact with the part of ContractContainer used by the scripts:
+    _name, at() and deploy(). The artifact is read on first use."""
+
+    def __init__(self, cache, name):
+        self._cache = cache
+        self._name = name
+        self._artifact = None
+
+    @property
+    def artifact(self):
+        if self._artifact is None:
+            self._artifact = self._cache.artifact(self._name)
+        return self._artifact
+
+    @property
+    def abi(self):
+        return self.artifact["abi"]
+
+    @property
+    def bytecode(self):
+        return self.artifact["bytecode"]
+
+    def at(self, address, owner=None):
+        return Contract.from_abi(self._name, address, self.abi, owner)
+
+    def encodeDeploy(self, *args):
+        """Deployment data, bytecode followed by the constructor arguments."""
+        inputs = next((i["inputs"] for i in self.abi if i["type"] == "constructor"), [])
+        assert len(args) == len(inputs), f"{self._name} takes {len(inputs)} args"
+        encoded = eth_abi.encode_abi(
+            [i["type"] for i in inputs],
+            [getattr(a, "address", a) for a in args],
+        )
+        return f"0x{self.bytecode}{encoded.hex()}"
+
+    def deploy(self, *args):
+        """Same call convention as ContractContainer.deploy, the last argument
+        being optional transaction parameters. Returns the pending receipt
+        when required_confs is 0, otw the deployed contract."""
+        params = {}
+        if args and isinstance(args[-1], dict):
+            params = dict(args[-1])
+            args = args[:-1]
+
+        sender = params.pop("from", None) or accounts.default
+        assert sender is not None, "No deployer account"
+        amount = params.pop("value", 0)
+
+        receipt = sender.transfer(None, amount, data=self.encodeDeploy(*args), **params)
+        # even if already mined (automine nodes), callers expect the receipt
+        if params.get("required_confs", 1) == 0:
+            return receipt
+        return self.at(receipt.contract_address, sender)
+
+
+class ArtifactCache:
+    """ABI/bytecode of a brownie project kept in `cacheDir`, one JSON file per
+    contract, so scripts don't load (and possibly compile) the whole project
+    on every run.
+
+    {
+      "version": 1,
+      "contractName": "ProxyAdmin",
+      "abi": [...],
+      "bytecode": "...",
+      "compiler": {...},
+      "sources": {"contracts/proxy/transparent/ProxyAdmin.sol": "<sha256>"}
+    }
+
+    An artifact is valid while every source it was compiled from (the
+    contract and its imports) and the project config hash the same.
+    Otw the project is loaded once and the artifact rebuilt."""
+
+    def __init__(self, projectPath, cacheDir):
+        self.projectPath = projectPath
+        self.cacheDir = os.path.join(cacheDir, os.path.basename(projectPath))
+        self.project = None
+        self.contracts = {}
+        self.hits = 0
+        self.misses = 0
+        self.elapsed = 0
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self.contracts:
+            self.contracts[name] = LazyContract(self, name)
+        return self.contracts[name]
+
+    def _path(self, name):
+        return os.path.join(self.cacheDir, f"{name}.json")
+
+    def _sourceHashes(self, paths):
+        hashes = {}
+        for path in paths:
+            hashes[path] = _fileHash(os.path.join(self.projectPath, path))
+        config = os.path.join(self.projectPath, "brownie-config.yaml")
+        if os.path.exists(config):
+            hashes["brownie-config.yaml"] = _fileHash(config)
+        return hashes
+
+    def _isValid(self, artifact):
+        if artifact.get("version") != ARTIFACT_VERSION:
+            return False
+        try:
+            current = self._sourceHashes(
+                p for p in artifact["sources"] if p != "brownie-config.yaml"
+            )
+        except FileNotFoundError:
+            return False
+        return current == artifact["sources"]
+
+    def _load(self, name):
+        try:
+            with open(self._path(name)) as f:
+                artifact = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        return artifact if self._isValid(artifact) else None
+
+    def _build(self, name):
+        if self.project is None:
+            self.project = project.load(self.projectPath)
+        build = getattr(self.project, name)._build
+
+        artifact = {
+            "version": ARTIFACT_VERSION,
+            "contractName": name,
+            "abi": build["abi"],
+            "bytecode": build["bytecode"],
+            "compiler": build.get("compiler", {}),
+            "sources": self._sourceHashes(sorted(build["allSourcePaths"].values())),
+        }
+
+        os.makedirs(self.cacheDir, exist_ok=True)
+        tmp = f"{self._path(name)}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(artifact, f)
+        os.replace(tmp, self._path(name))
+        return artifact
+
+    def artifact(self, name):
+        start = time.time()
+        artifact = self._load(name)
+        if artifact is None:
+            self.misses += 1
+            artifact = self._build(name)
+        else:
+            self.hits += 1
+        self.elapsed += time.time() - start
+        return artifact
+
+    def clear(self):
+        shutil.rmtree(self.cacheDir, ignore_errors=True)
+
+
+oz = ArtifactCache(OZ_PATH, CACHE_DIR)
+
+
+def _timeStartup(names):
+    cache = ArtifactCache(OZ_PATH, CACHE_DIR)
+    for name in names:
+        getattr(cache, name).abi
+    return cache
+
+
+def main(names="UpgradeableBeacon,ProxyAdmin", rebuild="true"):
+    """Prebuild the OpenZeppelin artifacts used by the scripts, reporting cold
+    (rebuild) vs warm (cached) startup."""
+    names = names.split(",")
+
+    if rebuild == "true":
+        oz.clear()
+    cold = _timeStartup(names)
+    warm = _timeStartup(names)
+
+    click.echo(
+        f"""
+            -------- Stats --------
+             Contracts: {", ".join(names)}
+                  Cold: {cold.elapsed:.2f} s ({cold.misses} rebuilt)
+                  Warm: {warm.elapsed:.3f} s ({warm.hits} cached)
+              CacheDir: {oz.cacheDir}
+            -----------------------
+         """
+    )
@@ -0,0 +1,171 @@
+import json
+import os
+import time
+from typing import NamedTuple, Optional
+
+import click
+
+from brownie import (
+    ORentable,
+    Rentable,
+    RentableMulticall,
+    WRentable,
+    accounts,
+    network,
+    web3,
+)
+
+
+class RentalConditions(NamedTuple):
+    minTimeDuration: int
+    maxTimeDuration: int
+    pricePerSecond: int
+    paymentTokenId: int
+    paymentTokenAddress: str
+    privateRenter: str
+
+
+class TokenState(NamedTuple):
+    tokenId: int
+    rentee: Optional[str]  # ORentable owner, None when not deposited
+    renter: Optional[str]  # WRentable owner skipping expiration, None when not rented
+    expiresAt: int
+    expired: bool
+    conditions: RentalConditions
+
+
+class BulkReader:
+    """Read rental state for whole collections via RentableMulticall.
+
+    Every token needs 5 view calls (rentalConditions, expiresAt, isExpired,
+    ORentable.ownerOf, WRentable.ownerOf skipping expiration), packed in
+    a few eth_call all pinned to the same block."""
+
+    callsPerToken = 5
+
+    def __init__(self, rentable, multicall, callsPerRequest=2_000):
+        self.rentable = rentable
+        self.multicall = multicall
+        self.tokensPerRequest = max(callsPerRequest // self.callsPerToken, 1)
+        self.tokens = {}
+
+    def _tokens(self, tokenAddress):
+        if tokenAddress not in self.tokens:
+            self.tokens[tokenAddress] = (
+                ORentable.at(self.rentable.getORentable(tokenAddress)),
+                WRentable.at(self.rentable.getWRentable(tokenAddress)),
+            )
+        return self.tokens[tokenAddress]
+
+    def _views(self, tokenAddress, tokenId):
+        orentable, wrentable = self._tokens(tokenAddress)
+        return [
+            (self.rentable.rentalConditions, self.rentable, (tokenAddress, tokenId)),
+            (self.rentable.expiresAt, self.rentable, (tokenAddress, tokenId)),
+            (self.rentable.isExpired, self.rentable, (tokenAddress, tokenId)),
+            (orentable.ownerOf, orentable, (tokenId,)),
+            (wrentable.ownerOf["uint256,bool"], wrentable, (tokenId, True)),
+        ]
+
+    def _aggregate(self, views, block):
+        calls = [(target.address, fn.encode_input(*args)) for fn, target, args in views]
+        blockNumber, results = self.multicall.aggregate(calls, block_identifier=block)
+        assert blockNumber == block, "Results not pinned to the requested block"
+
+        return [
+            fn.decode_output(returnData) if success else None
+            for (fn, _, _), (success, returnData) in zip(views, results)
+        ]
+
+    def read(self, tokenAddress, tokenIds, block=None):
+        """Read the state of every token id, returns (block, [TokenState])."""
+        tokenAddress = web3.toChecksumAddress(tokenAddress)
+        block = web3.eth.block_number if block is None else block
+
+        states = []
+        chunk = []
+        for tokenId in tokenIds:
+            chunk.append(tokenId)
+            if len(chunk) == self.tokensPerRequest:
+                states += self._read(tokenAddress, chunk, block)
+                chunk = []
+        if chunk:
+            states += self._read(tokenAddress, chunk, block)
+
+        return block, states
+
+    def _read(self, tokenAddress, tokenIds, block):
+        views = []
+        for tokenId in tokenIds:
+            views += self._views(tokenAddress, tokenId)
+
+        values = self._aggregate(views, block)
+
+        states = []
+        for i, tokenId in enumerate(tokenIds):
+            rcs, expiresAt, expired, rentee, renter = values[
+                i * self.callsPerToken : (i + 1) * self.callsPerToken
+            ]
+            states.append(
+                TokenState(
+                    tokenId,
+                    rentee,
+                    renter,
+                    expiresAt,
+                    expired,
+                    RentalConditions(*rcs),
+                )
+            )
+        return states
+
+
+def findMulticall(multicallAddress, deploymentFile):
+    """Given address, otw the one of the deployment file, otw a new one on a
+    local node or fork."""
+    if multicallAddress:
+        return RentableMulticall.at(multicallAddress)
+
+    if os.path.exists(deploymentFile):
+        with open(deploymentFile) as f:
+            deployment = json.load(f)
+        if "RentableMulticall" in deployment:
+            return RentableMulticall.at(deployment["RentableMulticall"])
+
+    if not network.rpc.is_active():
+        raise ValueError(f"No RentableMulticall address and none in {deploymentFile}")
+    return RentableMulticall.deploy({"from": accounts[0]})
+
+
+def main(
+    rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4",
+    multicallAddress="",
+    tokenAddress="0xF87E31492Faf9A91B02Ee0dEAAd50d51d56D5d4d",
+    startId="1",
+    endId="101",
+    deploymentFile="deployments/ethereum-mainnet.json",
+):
+    rentable = Rentable.at(rentableAddress)
+    multicall = findMulticall(multicallAddress, deploymentFile)
+
+    reader = BulkReader(rentable, multicall)
+
+    start = time.time()
+    block, states = reader.read(tokenAddress, range(int(startId), int(endId)))
+    elapsed = time.time() - start
+
+    deposited = [s for s in states if s.rentee is not None]
+    listed = [s for s in deposited if s.conditions.maxTimeDuration > 0]
+    rented = [s for s in deposited if s.renter is not None and not s.expired]
+
+    click.echo(
+        f"""
+            -------- Snapshot --------
+                 Block: {block}
+                Tokens: {len(states)}
+             Deposited: {len(deposited)}
+                Listed: {len(listed)}
+                Rented: {len(rented)}
+               Elapsed: {elapsed:.2f}s
+            --------------------------
+         """
+    )
@@ -10,88 +10,135 @@ from brownie import (
     TestNFT,
     ImmutableAdminTransparentUpgradeableProxy,
     ImmutableAdminUpgradeableBeaconProxy,
-    history,
-    project,
 )
 
-oz = project.load("./lib/openzeppelin-contracts")
+from scripts.artifacts import oz
+from scripts.tx_engine import TxEngine
+
 UpgradeableBeacon = oz.UpgradeableBeacon
 ProxyAdmin = oz.ProxyAdmin
 
 
-def main():
-    dev = accounts.load("rentable-deployer")
-    governance = dev
-    operator = dev
-    feeCollector = dev
+def castProxy(proxyContainer, container, address, owner):
+    """Contract at a proxy address. Brownie registers the deployment under
+    the proxy container, it must be removed otw direct cast not work."""
+    proxyContainer.remove(proxyContainer.at(address))
+    return container.at(address, owner)
 
-    click.echo(f"You are using: 'dev' [{dev.address}]")
 
-    testNFT = TestNFT.deploy({"from": dev})
+def deploy(engine, governance, operator, feeCollector):
+    """Deploy and configure the whole stack with TestNFT as collection."""
+    dev = engine.account
     eth = "0x0000000000000000000000000000000000000000"
 
-    proxyAdmin = ProxyAdmin.deploy({"from": dev})
-    rLogic = Rentable.deploy(governance, operator, {"from": dev})
-    rLogic.SCRAM()
+    # Transactions are submitted in layers, each one depending only on
+    # contracts deployed by the previous ones: every layer takes roughly
+    # one confirmation window.
 
-    proxy = ImmutableAdminTransparentUpgradeableProxy.deploy(
+    testNFT = engine.deploy(TestNFT)
+    proxyAdmin = engine.deploy(ProxyAdmin)
+    rLogic = engine.deploy(Rentable, governance, operator)
+    engine.wait()
+
+    testNFT = TestNFT.at(testNFT.contractAddress)
+    proxyAdmin = ProxyAdmin.at(proxyAdmin.contractAddress)
+    rLogic = Rentable.at(rLogic.contractAddress)
+
+    engine.transact(rLogic.SCRAM)
+    proxy = engine.deploy(
+        ImmutableAdminTransparentUpgradeableProxy,
         rLogic,
         proxyAdmin,
         rLogic.initialize.encode_input(governance, operator),
-        {"from": dev},
     )
+    orentableLogic = engine.deploy(ORentable, testNFT, eth, eth)
+    wrentableLogic = engine.deploy(WRentable, testNFT, eth, eth)
+    engine.wait()
+
+    r = castProxy(
+        ImmutableAdminTransparentUpgradeableProxy,
+        Rentable,
+        proxy.contractAddress,
+        dev,
+    )
+    orentableLogic = ORentable.at(orentableLogic.contractAddress)
+    wrentableLogic = WRentable.at(wrentableLogic.contractAddress)
 
-    r = proxy.address
-    ImmutableAdminTransparentUpgradeableProxy.remove(proxy)
+    assert proxyAdmin.getProxyImplementation(r) == rLogic.address
 
-    r = Rentable.at(r, dev)
+    obeacon = engine.deploy(UpgradeableBeacon, orentableLogic)
+    wbeacon = engine.deploy(UpgradeableBeacon, wrentableLogic)
+    simpleWalletLogic = engine.deploy(SimpleWallet, r, eth)
+    engine.transact(r.enablePaymentToken, eth)
+    engine.transact(r.setFeeCollector, feeCollector)
+    engine.wait()
 
-    assert proxyAdmin.getProxyImplementation(r) == rLogic.address
+    obeacon = UpgradeableBeacon.at(obeacon.contractAddress)
+    wbeacon = UpgradeableBeacon.at(wbeacon.contractAddress)
+    simpleWalletLogic = SimpleWallet.at(simpleWalletLogic.contractAddress)
 
-    orentableLogic = ORentable.deploy(testNFT, eth, eth, {"from": dev})
-    obeacon = UpgradeableBeacon.deploy(orentableLogic, {"from": dev})
-    oproxy = ImmutableAdminUpgradeableBeaconProxy.deploy(
+    oproxy = engine.deploy(
+        ImmutableAdminUpgradeableBeaconProxy,
         obeacon,
         proxyAdmin,
         orentableLogic.initialize.encode_input(testNFT, governance, r),
-        {"from": dev},
     )
-
-    o = oproxy.address
-    ImmutableAdminUpgradeableBeaconProxy.remove(oproxy)  # otw direct cast not work
-
-    orentable = ORentable.at(o, dev)
-
-    r.setORentable(testNFT, orentable)
-
-    wrentableLogic = WRentable.deploy(testNFT, eth, eth, {"from": dev})
-    wbeacon = UpgradeableBeacon.deploy(wrentableLogic, {"from": dev})
-    wproxy = ImmutableAdminUpgradeableBeaconProxy.deploy(
+    wproxy = engine.deploy(
+        ImmutableAdminUpgradeableBeaconProxy,
         wbeacon,
         proxyAdmin,
         wrentableLogic.initialize.encode_input(testNFT, governance, r),
-        {"from": dev},
     )
+    simpleWalletBeacon = engine.deploy(UpgradeableBeacon, simpleWalletLogic)
+    engine.wait()
 
-    w = wproxy.address
-    ImmutableAdminUpgradeableBeaconProxy.remove(wproxy)  # otw direct cast not work
-
-    wrentable = WRentable.at(w, dev)
+    orentable = castProxy(
+        ImmutableAdminUpgradeableBeaconProxy, ORentable, oproxy.contractAddress, dev
+    )
+    wrentable = castProxy(
+        ImmutableAdminUpgradeableBeaconProxy, WRentable, wproxy.contractAddress, dev
+    )
+    simpleWalletBeacon = UpgradeableBeacon.at(simpleWalletBeacon.contractAddress)
+
+    engine.transact(r.setORentable, testNFT, orentable)
+    engine.transact(r.setWRentable, testNFT, wrentable)
+    walletFactory = engine.deploy(WalletFactory, simpleWalletBeacon)
+    engine.wait()
+
+    walletFactory = WalletFactory.at(walletFactory.contractAddress)
+
+    engine.transact(r.setWalletFactory, walletFactory)
+    failed = engine.wait()
+    assert not failed, "Deployment failed"
+
+    return {
+        "TestNFT": testNFT,
+        "OBeacon": obeacon,
+        "ORentable": orentable,
+        "WBeacon": wbeacon,
+        "WRentable": wrentable,
+        "SimpleWalletLogic": simpleWalletLogic,
+        "SimpleWalletBeacon": simpleWalletBeacon,
+        "WalletFactory": walletFactory,
+        "Rentable": r,
+        "RentableLogic": rLogic,
+        "ProxyAdmin": proxyAdmin,
+    }
 
-    r.setWRentable(testNFT, wrentable)
 
-    simpleWalletLogic = SimpleWallet.deploy(r, eth, {"from": dev})
-    simpleWalletBeacon = UpgradeableBeacon.deploy(simpleWalletLogic, {"from": dev})
-    walletFactory = WalletFactory.deploy(simpleWalletBeacon, {"from": dev})
+def main():
+    dev = accounts.load("rentable-deployer")
+    governance = dev
+    operator = dev
+    feeCollector = dev
 
-    r.setWalletFactory(walletFactory)
+    click.echo(f"You are using: 'dev' [{dev.address}]")
 
-    r.enablePaymentToken(eth)
-    r.setFeeCollector(feeCollector)
+    engine = TxEngine(dev)
+    stack = deploy(engine, governance, operator, feeCollector)
+    engine.report()
 
-    totalGasUsed = 0
-    for tx in history:
-        totalGasUsed += tx.gas_used
+    totalGasUsed = sum(tx.gasUsed for tx in engine.txs)
 
     click.echo(
         f"""
@@ -100,17 +147,17 @@ def main():
             Governance: {governance}
               Operator: {operator}
           FeeCollector: {feeCollector}
-               TestNFT: {testNFT.address}
-               OBeacon: {obeacon.address}
-             ORentable: {orentable.address}
-               WBeacon: {wbeacon.address}
-             WRentable: {wrentable.address}
-     SimpleWalletLogic: {simpleWalletLogic.address}
-    SimpleWalletBeacon: {simpleWalletBeacon.address}
-         WalletFactory: {walletFactory.address}
-              Rentable: {r.address}
-         RentableLogic: {rLogic.address}
-            ProxyAdmin: {proxyAdmin.address}
+               TestNFT: {stack["TestNFT"].address}
+               OBeacon: {stack["OBeacon"].address}
+             ORentable: {stack["ORentable"].address}
+               WBeacon: {stack["WBeacon"].address}
+             WRentable: {stack["WRentable"].address}
+     SimpleWalletLogic: {stack["SimpleWalletLogic"].address}
+    SimpleWalletBeacon: {stack["SimpleWalletBeacon"].address}
+         WalletFactory: {stack["WalletFactory"].address}
+              Rentable: {stack["Rentable"].address}
+         RentableLogic: {stack["RentableLogic"].address}
+            ProxyAdmin: {stack["ProxyAdmin"].address}
               TotalGas: {totalGasUsed}
     """
     )
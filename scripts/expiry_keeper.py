@@ -0,0 +1,324 @@
+import heapq
+import time
+
+import click
+
+from brownie import Rentable, WRentable, accounts, web3
+from brownie.exceptions import VirtualMachineError
+
+from scripts.indexer import fetchLogs
+
+# Rentable EXPIRY_BUCKET_SIZE
+EXPIRY_BUCKET_SIZE = 3600
+
+
+class ExpiryKeeper:
+    """Settle expired rentals on-chain via Rentable.expireRentals.
+
+    Pending rentals are kept in a min-heap of (expiresAt, tokenAddress, tokenId)
+    fed by Rent/RentalExtended/RentEnds logs. Entries superseded by a newer
+    rental or extension, or already settled by another actor, are dropped
+    lazily when they reach the top."""
+
+    def __init__(
+        self,
+        rentable,
+        account,
+        fromBlock=0,
+        gasLimitShare=0.5,
+        chunkSize=2_000,
+    ):
+        self.rentable = rentable
+        self.account = account
+        self.lastBlock = fromBlock - 1
+        self.gasLimitShare = gasLimitShare
+        self.chunkSize = chunkSize
+
+        self.contract = web3.eth.contract(address=rentable.address, abi=Rentable.abi)
+        self.topics = {
+            Rentable.topics["Rent"]: "Rent",
+            Rentable.topics["RentalExtended"]: "RentalExtended",
+            Rentable.topics["RentEnds"]: "RentEnds",
+        }
+
+        self.heap = []
+        # (tokenAddress, tokenId) => expiresAt of the rental to settle
+        self.scheduled = {}
+        self.wrentables = {}
+
+        # estimated gas for a single expiration, refined after every batch
+        self.perItemGas = None
+
+        self.txs = 0
+        self.expired = 0
+        self.dropped = 0
+        self.rescheduled = 0
+        self.gasUsed = 0
+
+    # ---------- schedule ----------
+
+    def schedule(self, tokenAddress, tokenId, expiresAt):
+        key = (tokenAddress, tokenId)
+        self.scheduled[key] = expiresAt
+        heapq.heappush(self.heap, (expiresAt,) + key)
+
+    def poll(self):
+        """Update the schedule with rental logs since the last poll."""
+        head = web3.eth.block_number
+        for _, end, logs in fetchLogs(
+            self.rentable.address,
+            list(self.topics.keys()),
+            self.lastBlock + 1,
+            head,
+            self.chunkSize,
+        ):
+            for log in logs:
+                name = self.topics[log["topics"][0].hex()]
+                args = self.contract.events[name]().processLog(log).args
+                key = (args["tokenAddress"], args["tokenId"])
+                if name in ("Rent", "RentalExtended"):
+                    self.schedule(*key, args["expiresAt"])
+                else:
+                    self.scheduled.pop(key, None)
+            self.lastBlock = end
+
+    def nextDue(self):
+        """Expiration time of the next pending rental, None when idle."""
+        while self.heap:
+            expiresAt, tokenAddress, tokenId = self.heap[0]
+            if self.scheduled.get((tokenAddress, tokenId)) == expiresAt:
+                return expiresAt
+            heapq.heappop(self.heap)
+        return None
+
+    def popDue(self, now, limit):
+        due = []
+        while len(due) < limit and self.nextDue() is not None:
+            if self.heap[0][0] > now:
+                break
+            _, tokenAddress, tokenId = heapq.heappop(self.heap)
+            del self.scheduled[(tokenAddress, tokenId)]
+            due.append((tokenAddress, tokenId))
+        return due
+
+    # ---------- settlement ----------
+
+    def _wrentable(self, tokenAddress):
+        if tokenAddress not in self.wrentables:
+            self.wrentables[tokenAddress] = WRentable.at(
+                self.rentable.getWRentable(tokenAddress)
+            )
+        return self.wrentables[tokenAddress]
+
+    def _stillPending(self, tokenAddress, tokenId):
+        # another actor (withdraw, transfer, rent, keeper) may have settled it
+        if not self._wrentable(tokenAddress).exists(tokenId):
+            self.dropped += 1
+            return False
+        # extended after the last poll, settle at the new expiration
+        if not self.rentable.isExpired(tokenAddress, tokenId):
+            self.schedule(
+                tokenAddress, tokenId, self.rentable.expiresAt(tokenAddress, tokenId)
+            )
+            self.rescheduled += 1
+            return False
+        return True
+
+    def batchSize(self):
+        """Max expirations per tx against the block gas limit share."""
+        gasLimit = web3.eth.get_block("latest").gasLimit
+        return max(int(gasLimit * self.gasLimitShare) // self.perItemGas, 1)
+
+    def _drop(self, item):
+        self.dropped += 1
+        click.echo(f"Expiration of {item[0]} #{item[1]} reverts, dropped")
+
+    def settle(self, items):
+        """Settle items in a single tx. expireRentals is all-or-nothing: when
+        it reverts the batch is split in halves until the rentals failing to
+        settle are isolated and dropped. Returns the number settled."""
+        tokenAddresses = [i[0] for i in items]
+        tokenIds = [i[1] for i in items]
+
+        try:
+            tx = self.rentable.expireRentals(
+                tokenAddresses, tokenIds, {"from": self.account}
+            )
+        except (ValueError, VirtualMachineError):
+            # gas estimation fails on live networks, the tx reverts otw
+            if len(items) == 1:
+                self._drop(items[0])
+                return 0
+            half = len(items) // 2
+            return self.settle(items[:half]) + self.settle(items[half:])
+
+        self.txs += 1
+        self.expired += len(items)
+        self.gasUsed += tx.gas_used
+
+        # keep the most pessimistic observation, collections differ in hooks cost
+        self.perItemGas = max(self.perItemGas, -(-tx.gas_used // len(items)))
+
+        return len(items)
+
+    def step(self):
+        """Settle every rental due at the latest block timestamp."""
+        self.poll()
+        now = web3.eth.get_block("latest").timestamp
+
+        settled = 0
+        while self.nextDue() is not None and self.heap[0][0] <= now:
+            if self.perItemGas is None:
+                _, tokenAddress, tokenId = self.heap[0]
+                try:
+                    self.perItemGas = self.rentable.expireRentals.estimate_gas(
+                        [tokenAddress], [tokenId], {"from": self.account}
+                    )
+                except (ValueError, VirtualMachineError):
+                    self._drop(self.popDue(now, 1)[0])
+                    continue
+
+            candidates = self.popDue(now, self.batchSize())
+            pending = [c for c in candidates if self._stillPending(*c)]
+            if pending:
+                settled += self.settle(pending)
+
+        return settled
+
+    def run(self, pollInterval=15):
+        while True:
+            if self.step() > 0:
+                self.report()
+            nextDue = self.nextDue()
+            wait = pollInterval if nextDue is None else nextDue - time.time()
+            time.sleep(min(max(wait, 1), pollInterval))
+
+    def report(self):
+        click.echo(
+            f"""
+            -------- Keeper --------
+                   Txs: {self.txs}
+           Expirations: {self.expired}
+               Dropped: {self.dropped}
+           Rescheduled: {self.rescheduled}
+               Pending: {len(self.scheduled)}
+        Expirations/Tx: {self.expired / self.txs if self.txs else 0:.2f}
+        Gas/Expiration: {self.gasUsed // self.expired if self.expired else 0}
+            ------------------------
+         """
+        )
+
+
+class QueueExpiryKeeper:
+    """Settle expired rentals via the on-chain expiry queue (Rentable.expireDue).
+
+    No log index is needed: pendingExpirations is read from the queue head to
+    check something is due, then expireDue settles it. maxCount bounds queue
+    steps, including superseded entries and empty buckets, so it is sized from
+    a probe."""
+
+    def __init__(self, rentable, account, gasLimitShare=0.5, pageSize=200):
+        self.rentable = rentable
+        self.account = account
+        self.gasLimitShare = gasLimitShare
+        self.pageSize = pageSize
+
+        # estimated gas for a single queue step, refined after every batch
+        self.perStepGas = None
+
+        self.txs = 0
+        self.expired = 0
+        self.gasUsed = 0
+
+    def probe(self, now):
+        """(work, cursor): work when something is due in the first page, or the
+        head is behind the current bucket (a page of empty buckets or settled
+        entries shows nothing due but expireDue must still walk it). cursor
+        is the end of the first page, it moves with the head."""
+        entries, nextCursor = self.rentable.pendingExpirations(0, self.pageSize)
+        if any(e["expiresAt"] <= now for e in entries):
+            return True, nextCursor
+        behind = nextCursor != 0 and (nextCursor >> 64) < now // EXPIRY_BUCKET_SIZE
+        return behind, nextCursor
+
+    def batchSize(self):
+        gasLimit = web3.eth.get_block("latest").gasLimit
+        return max(int(gasLimit * self.gasLimitShare) // self.perStepGas, 1)
+
+    def step(self):
+        settled = 0
+        stalled = None
+        while True:
+            now = web3.eth.get_block("latest").timestamp
+            work, cursor = self.probe(now)
+            # due entries failing to settle behind one not due yet hold the
+            # head, retry once it moves rather than every block
+            if not work or cursor == stalled:
+                return settled
+
+            if self.perStepGas is None:
+                self.perStepGas = self.rentable.expireDue.estimate_gas(
+                    1, {"from": self.account}
+                )
+
+            maxCount = self.batchSize()
+            expired = self.rentable.expireDue.call(maxCount, {"from": self.account})
+            tx = self.rentable.expireDue(maxCount, {"from": self.account})
+
+            self.txs += 1
+            self.expired += expired
+            self.gasUsed += tx.gas_used
+            settled += expired
+
+            # zero when only superseded entries were visited, the head moved anyway
+            if expired:
+                self.perStepGas = max(self.perStepGas, -(-tx.gas_used // expired))
+            stalled = None if expired else cursor
+
+    def run(self, pollInterval=15):
+        while True:
+            if self.step() > 0:
+                self.report()
+            time.sleep(pollInterval)
+
+    def report(self):
+        click.echo(
+            f"""
+            -------- Keeper --------
+                   Txs: {self.txs}
+           Expirations: {self.expired}
+        Expirations/Tx: {self.expired / self.txs if self.txs else 0:.2f}
+        Gas/Expiration: {self.gasUsed // self.expired if self.expired else 0}
+            ------------------------
+         """
+        )
+
+
+def main(
+    rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4",
+    fromBlock="0",
+    account="rentable-deployer",
+    gasLimitShare="0.5",
+    pollInterval="15",
+    once="false",
+    mode="logs",
+):
+    if mode == "queue":
+        keeper = QueueExpiryKeeper(
+            Rentable.at(rentableAddress),
+            accounts.load(account),
+            float(gasLimitShare),
+        )
+    else:
+        keeper = ExpiryKeeper(
+            Rentable.at(rentableAddress),
+            accounts.load(account),
+            int(fromBlock),
+            float(gasLimitShare),
+        )
+
+    if once.lower() == "true":
+        keeper.step()
+        keeper.report()
+    else:
+        keeper.run(int(pollInterval))
@@ -0,0 +1,266 @@
+import random
+import statistics
+
+import click
+
+from brownie import network, web3
+
+# reward percentiles requested to eth_feeHistory
+PERCENTILES = [10, 50, 90]
+
+# urgency => (reward percentile, next base fee multiplier)
+# the multiplier is the base fee headroom kept in maxFeePerGas,
+# 2 survives 6 full blocks in a row
+URGENCY = {
+    "low": (10, 1.25),
+    "normal": (50, 2),
+    "high": (90, 3),
+}
+
+MIN_PRIORITY_FEE = 10**8  # 0.1 gwei, blocks without tips (e.g. local nodes)
+
+
+def _int(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def suggestFees(feeHistory, urgency="normal", minPriorityFee=MIN_PRIORITY_FEE):
+    """Transaction fee params from an eth_feeHistory result over PERCENTILES.
+
+    Priority fee is the median, over the blocks, of the urgency percentile
+    of the tips paid. Max fee adds it to the next block base fee times the
+    urgency multiplier. Legacy gas price when the network has no base fee."""
+    percentile, multiplier = URGENCY[urgency]
+    nextBaseFee = _int(feeHistory["baseFeePerGas"][-1])
+    if nextBaseFee == 0:
+        return {"gas_price": web3.eth.gas_price}
+
+    i = PERCENTILES.index(percentile)
+    rewards = [_int(r[i]) for r in feeHistory.get("reward") or []]
+    rewards = [r for r in rewards if r > 0]
+    priorityFee = max(int(statistics.median(rewards)) if rewards else 0, minPriorityFee)
+
+    return {
+        "max_fee": int(nextBaseFee * multiplier) + priorityFee,
+        "priority_fee": priorityFee,
+    }
+
+
+def formatFees(fees):
+    if "gas_price" in fees:
+        return f"gas price {fees['gas_price']/1e9:.2f} gwei"
+    return (
+        f"max {fees['max_fee']/1e9:.2f} gwei, "
+        f"priority {fees['priority_fee']/1e9:.2f} gwei"
+    )
+
+
+class FeeOracle:
+    """EIP-1559 fees from the last `blocks` blocks, refreshed once per block.
+
+    `source` is called as eth_feeHistory (blockCount, newestBlock,
+    percentiles), e.g. SimulatedFeeHistory to replay a base fee history."""
+
+    def __init__(
+        self,
+        urgency="normal",
+        blocks=20,
+        minPriorityFee=MIN_PRIORITY_FEE,
+        source=None,
+    ):
+        assert urgency in URGENCY, f"Unknown urgency {urgency}"
+        self.urgency = urgency
+        self.blocks = blocks
+        self.minPriorityFee = minPriorityFee
+        self.source = source or web3.eth.fee_history
+        self.blockNumber = None
+        self.suggested = None
+
+    def fees(self, blockNumber=None):
+        if blockNumber is None:
+            blockNumber = web3.eth.block_number
+        if blockNumber != self.blockNumber:
+            self.suggested = suggestFees(
+                self.source(self.blocks, blockNumber, PERCENTILES),
+                self.urgency,
+                self.minPriorityFee,
+            )
+            self.blockNumber = blockNumber
+        return dict(self.suggested)
+
+    def bump(self, previous, gasBump, blockNumber=None):
+        """Replacement fees, the current suggestion but at least gasBump times
+        the previous ones (nodes require both fees bumped)."""
+        current = self.fees(blockNumber)
+        return {k: max(current[k], int(previous.get(k, 0) * gasBump)) for k in current}
+
+    def apply(self):
+        """Set the fees as brownie defaults for every following transaction."""
+        fees = self.fees()
+        if "gas_price" in fees:
+            network.gas_price(fees["gas_price"])
+        else:
+            network.max_fee(fees["max_fee"])
+            network.priority_fee(fees["priority_fee"])
+        return fees
+
+
+class FeeReport:
+    """Paid vs base fee of mined transactions."""
+
+    def __init__(self):
+        self.txs = 0
+        self.gasUsed = 0
+        self.paid = 0
+        self.base = 0
+        self.baseFees = {}  # block number => base fee
+
+    def _baseFee(self, blockNumber):
+        if blockNumber not in self.baseFees:
+            block = web3.eth.get_block(blockNumber)
+            self.baseFees[blockNumber] = block.get("baseFeePerGas", 0)
+        return self.baseFees[blockNumber]
+
+    def add(self, gasUsed, gasPrice, blockNumber):
+        self.txs += 1
+        self.gasUsed += gasUsed
+        self.paid += gasUsed * gasPrice
+        self.base += gasUsed * self._baseFee(blockNumber)
+
+    def addReceipt(self, receipt):
+        self.add(
+            receipt["gasUsed"],
+            receipt.get("effectiveGasPrice", 0),
+            receipt["blockNumber"],
+        )
+
+    def echo(self):
+        tips = self.paid - self.base
+        gasUsed = self.gasUsed or 1
+        click.echo(
+            f"""
+            -------- Fees --------
+          Transactions: {self.txs}
+              TotalGas: {self.gasUsed}
+                  Paid: {self.paid/1e18} ETH
+               BaseFee: {self.base/1e18} ETH
+                  Tips: {tips/1e18} ETH
+         Avg Gas Price: {self.paid/gasUsed/1e9:.2f} gwei
+          Avg Base Fee: {self.base/gasUsed/1e9:.2f} gwei
+            ----------------------
+         """
+        )
+
+
+def feeReport(txs):
+    """FeeReport of brownie receipts, e.g. brownie.history."""
+    report = FeeReport()
+    for tx in txs:
+        if tx.status >= 0:  # skip pending and dropped
+            report.addReceipt(web3.eth.get_transaction_receipt(tx.txid))
+    return report
+
+
+class SimulatedFeeHistory:
+    """Synthetic chain following the EIP-1559 base fee rule, callable as
+    eth_feeHistory. Block fullness and tips are drawn at random."""
+
+    def __init__(self, baseFee=30 * 10**9, tip=2 * 10**9, volatility=0.4, seed=0):
+        self.random = random.Random(seed)
+        self.tip = tip
+        self.volatility = volatility
+        self.baseFees = [baseFee]
+        self.gasUsedRatios = []
+        self.rewards = []
+
+    def _nextBaseFee(self, baseFee, gasUsedRatio):
+        # +-12.5% at most, full blocks raise the base fee, empty ones lower it
+        return max(int(baseFee * (1 + (gasUsedRatio - 0.5) / 4)), 7)
+
+    def mine(self, blocks=1):
+        for _ in range(blocks):
+            ratio = min(max(self.random.gauss(0.5, self.volatility), 0), 1)
+            self.gasUsedRatios.append(ratio)
+            tips = sorted(
+                int(self.tip * self.random.lognormvariate(0, 0.5)) for _ in range(50)
+            )
+            self.rewards.append([tips[p * len(tips) // 100] for p in PERCENTILES])
+            self.baseFees.append(self._nextBaseFee(self.baseFees[-1], ratio))
+
+    @property
+    def blockNumber(self):
+        return len(self.gasUsedRatios) - 1
+
+    def __call__(self, blockCount, newestBlock, percentiles):
+        assert list(percentiles) == PERCENTILES
+        newest = self.blockNumber if newestBlock == "latest" else newestBlock
+        oldest = max(newest - blockCount + 1, 0)
+        return {
+            "oldestBlock": oldest,
+            "baseFeePerGas": self.baseFees[oldest : newest + 2],
+            "gasUsedRatio": self.gasUsedRatios[oldest : newest + 1],
+            "reward": self.rewards[oldest : newest + 1],
+        }
+
+
+def simulate(
+    urgency="normal",
+    blocks="500",
+    replaceAfterBlocks="3",
+    gasBump="1.125",
+    seed="0",
+):
+    """Price a transaction every block of a simulated base fee history and
+    replay inclusion: a transaction is included in the first block whose base
+    fee it covers with a tip above the block median, otw replaced after
+    replaceAfterBlocks blocks."""
+    chain = SimulatedFeeHistory(seed=int(seed))
+    chain.mine(20)
+    oracle = FeeOracle(urgency, source=chain)
+    blocks = int(blocks)
+    replaceAfterBlocks = int(replaceAfterBlocks)
+
+    latencies = []
+    replacements = 0
+    paid = 0
+    base = 0
+    for start in range(blocks):
+        chain.mine(1)
+        sentAt = chain.blockNumber
+        fees = oracle.fees(sentAt)
+
+        current = sentAt
+        while True:
+            chain.mine(1)
+            current = chain.blockNumber
+            baseFee = chain.baseFees[current]
+            priorityFee = min(fees["priority_fee"], fees["max_fee"] - baseFee)
+            if priorityFee >= chain.rewards[current][1]:
+                latencies.append(current - sentAt)
+                paid += baseFee + priorityFee
+                base += baseFee
+                break
+            if (current - sentAt) % replaceAfterBlocks == 0:
+                fees = oracle.bump(fees, float(gasBump), current)
+                replacements += 1
+
+    latencies.sort()
+    click.echo(
+        f"""
+            -------- Simulation --------
+               Urgency: {urgency}
+          Transactions: {blocks}
+          Replacements: {replacements}
+ Median Latency Blocks: {latencies[len(latencies) // 2]}
+    Max Latency Blocks: {latencies[-1]}
+         Avg Gas Price: {paid/blocks/1e9:.2f} gwei
+          Avg Base Fee: {base/blocks/1e9:.2f} gwei
+            ----------------------------
+         """
+    )
+
+
+def main():
+    """Suggested fees of every urgency on the connected network."""
+    for urgency in URGENCY:
+        click.echo(f"{urgency}: {formatFees(FeeOracle(urgency).fees())}")
@@ -6,6 +6,8 @@ from brownie import (
     TestNFT,
 )
 
+from scripts.tx_engine import TxEngine
+
 
 def chunks(lst, n):
     """Yield successive n-sized chunks from lst."""
@@ -13,18 +15,16 @@ def chunks(lst, n):
         yield lst[i : i + n]
 
 
-def listOnMarket(
-    user,
-    token,
-    rentable,
-    tokenId,
+def encodeRentalConditions(
+    minTimeDuration,
     maxTimeDuration,
     pricePerSecond,
     paymentTokenId,
     paymentTokenAddress,
     privateRenter,
 ):
-    data = eth_abi.encode_abi(
+    """RentableTypes.RentalConditions as safeTransferFrom data."""
+    return eth_abi.encode_abi(
         [
             "uint256",
             "uint256",
@@ -34,7 +34,7 @@ def listOnMarket(
             "address",
         ],
         (
-            1,
+            minTimeDuration,
             maxTimeDuration,
             pricePerSecond,
             paymentTokenId,
@@ -42,16 +42,54 @@ def listOnMarket(
             privateRenter,
         ),
     ).hex()
-    token.safeTransferFrom(user, rentable, tokenId, data, {"from": user})
 
 
-def main():
+def listOnMarket(
+    user,
+    token,
+    rentable,
+    tokenId,
+    maxTimeDuration,
+    pricePerSecond,
+    paymentTokenId,
+    paymentTokenAddress,
+    privateRenter,
+    engine=None,
+):
+    """Deposit and list, through engine (non-blocking) when given."""
+    data = encodeRentalConditions(
+        1,
+        maxTimeDuration,
+        pricePerSecond,
+        paymentTokenId,
+        paymentTokenAddress,
+        privateRenter,
+    )
+    if engine is not None:
+        return engine.transact(
+            token.safeTransferFrom,
+            user,
+            rentable,
+            tokenId,
+            data,
+            label=f"list {tokenId}",
+        )
+    return token.safeTransferFrom(user, rentable, tokenId, data, {"from": user})
+
+
+def main(
+    testNFTAddress="0x8fA4d7B0C204B8f03C9f037E05Cece57decE2214",
+    rentable="0xb8Cd02CbCc05Ac25D77F63FAbB2501Bb71f9e2BB",
+    startId="1",
+    endId="51",
+):
     dev = accounts.load("rentable-deployer")
-    testNFT = TestNFT.at("0x8fA4d7B0C204B8f03C9f037E05Cece57decE2214")
-    rentable = "0xb8Cd02CbCc05Ac25D77F63FAbB2501Bb71f9e2BB"
+    testNFT = TestNFT.at(testNFTAddress)
+
+    startId = int(startId)
+    endId = int(endId)
 
-    startId = 1
-    endId = 51
+    engine = TxEngine(dev)
 
     day = 24 * 60 * 60
     maxTimeDurationLow = 3 * day
@@ -82,4 +120,8 @@ def main():
             paymentTokenId,
             paymentTokenAddress,
             privateRenter,
+            engine,
         )
+
+    engine.wait()
+    engine.report()
@@ -0,0 +1,133 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+import click
+
+BENCHMARK_CONTRACT = "RentableGasBenchmark"
+
+# emitted by RentableGasBenchmark as log_named_uint("gas/<flow>", gas)
+GAS_LINE = re.compile(r"^\s*gas/(?P<flow>\S+):\s*(?P<gas>\d+)\s*$")
+
+
+def gitCommit():
+    commit = subprocess.check_output(
+        ["git", "rev-parse", "--short", "HEAD"], text=True
+    ).strip()
+    dirty = subprocess.run(
+        ["git", "diff", "--quiet", "HEAD", "--", "contracts"]
+    ).returncode
+    return f"{commit}-dirty" if dirty else commit
+
+
+def runBenchmark():
+    """Run the benchmark suite with forge, returns {flow: gas}."""
+    output = subprocess.run(
+        ["forge", "test", "--match-contract", BENCHMARK_CONTRACT, "-vv"],
+        capture_output=True,
+        text=True,
+    )
+    if output.returncode != 0:
+        click.echo(output.stdout + output.stderr, err=True)
+        raise RuntimeError("Benchmark suite failed")
+
+    flows = {}
+    for line in output.stdout.splitlines():
+        match = GAS_LINE.match(line)
+        if match:
+            flows[match["flow"]] = int(match["gas"])
+    if not flows:
+        raise RuntimeError("No gas measure found in forge output")
+    return flows
+
+
+def compare(baseline, current, threshold):
+    """Per flow change against baseline, returns (rows, regressions)."""
+    rows = []
+    regressions = []
+    for flow in sorted(set(baseline) | set(current)):
+        before = baseline.get(flow)
+        after = current.get(flow)
+        if before is None or after is None:
+            rows.append((flow, before, after, None))
+            continue
+        change = (after - before) * 100 / before
+        rows.append((flow, before, after, change))
+        if change > threshold:
+            regressions.append(flow)
+    return rows, regressions
+
+
+def loadHistory(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def saveHistory(path, history):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def main(history="benchmarks/gas-history.json", threshold="2", save="true"):
+    """Run with python -m scripts.gas_benchmark [history] [threshold] [save]"""
+    start = time.time()
+    threshold = float(threshold)
+
+    commit = gitCommit()
+    current = runBenchmark()
+
+    entries = loadHistory(history)
+    # compare against the last recorded commit other than the current one
+    previous = [e for e in entries if e["commit"] != commit]
+    baseline = previous[-1] if previous else None
+
+    regressions = []
+    if baseline is not None:
+        rows, regressions = compare(baseline["gas"], current, threshold)
+        click.echo(f"        ---- Gas {baseline['commit']} -> {commit} ----")
+        for flow, before, after, change in rows:
+            if change is None:
+                click.echo(f"    {flow}: {before or '-'} -> {after or '-'}")
+                continue
+            flag = "  REGRESSION" if flow in regressions else ""
+            click.echo(f"    {flow}: {before} -> {after} ({change:+.2f}%){flag}")
+    else:
+        click.echo(f"        ---- Gas {commit} (no baseline) ----")
+        for flow, gas in sorted(current.items()):
+            click.echo(f"    {flow}: {gas}")
+
+    # a regressed run never becomes the baseline of the next one
+    saved = save.lower() == "true" and not regressions
+    if saved:
+        entries = previous + [
+            {"commit": commit, "timestamp": int(time.time()), "gas": current}
+        ]
+        os.makedirs(os.path.dirname(history) or ".", exist_ok=True)
+        saveHistory(history, entries)
+
+    click.echo(
+        f"""
+            -------- Stats --------
+                 Flows: {len(current)}
+           Regressions: {len(regressions)}
+             Threshold: {threshold}%
+               History: {history} ({"saved" if saved else "not saved"})
+          Elapsed Time: {time.time() - start:.1f} s
+            -----------------------
+         """
+    )
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
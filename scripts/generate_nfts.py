@@ -1,37 +1,258 @@
+import json
+import os
+import time
+from collections import deque
+from itertools import islice
+
+import click
+
 from brownie import (
     accounts,
     TestNFT,
+    web3,
 )
+from brownie.exceptions import VirtualMachineError
 
 
-def chunks(lst, n):
-    """Yield successive n-sized chunks from lst."""
-    for i in range(0, len(lst), n):
-        yield lst[i : i + n]
+class UriStream:
+    """Read token URIs lazily, one per line, token id = line number."""
 
+    def __init__(self, path, lastId=0):
+        self.file = open(path)
+        self.lines = (line.strip() for line in self.file)
+        # skip already minted ids
+        for _ in islice(self.lines, lastId):
+            pass
+        self.nextId = lastId + 1
+        self.buffer = deque()  # (id, uri) taken but not sent
 
-def main():
-    dev = accounts.load("rentable-deployer")
-    testNFT = TestNFT.at("0x8fA4d7B0C204B8f03C9f037E05Cece57decE2214")
+    def take(self, n):
+        items = [self.buffer.popleft() for _ in range(min(n, len(self.buffer)))]
+        for uri in islice(self.lines, n - len(items)):
+            items.append((self.nextId, uri))
+            self.nextId += 1
+        return items
+
+    def putBack(self, items):
+        self.buffer.extendleft(reversed(items))
+
+    def close(self):
+        self.file.close()
+
+
+class Checkpoint:
+    """Last confirmed token id per collection, persisted atomically on disk."""
+
+    def __init__(self, path, nftAddress):
+        self.path = path
+        self.key = nftAddress
+        self.state = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.state = json.load(f)
+
+    @property
+    def lastId(self):
+        return self.state.get(self.key, 0)
+
+    def save(self, lastId):
+        self.state[self.key] = lastId
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.path)
+
+
+class MintPipeline:
+    """Mint TestNFT tokens from a URI file via TestNFT.mintBatch.
+
+    Batches are sized from estimate_gas against a share of the block gas
+    limit and sent with locally managed nonces, keeping up to maxInFlight
+    transactions pending. Receipts are awaited in nonce order, so the
+    checkpoint always points to the last id of a contiguous confirmed prefix."""
+
+    def __init__(self, nft, account, checkpoint, gasLimitShare=0.5, maxInFlight=4):
+        self.nft = nft
+        self.account = account
+        self.checkpoint = checkpoint
+        self.gasLimitShare = gasLimitShare
+        self.maxInFlight = maxInFlight
+
+        self.nonce = None
+        self.inFlight = deque()  # (tx, firstId, lastId, size)
+
+        # estimated gas for a single mint, refined after every batch
+        self.perItemGas = None
+
+        self.batches = []  # (firstId, lastId, size, gasUsed)
+        self.start = None
+
+    # ---------- resume ----------
+
+    def _exists(self, tokenId):
+        try:
+            self.nft.ownerOf(tokenId)
+            return True
+        except (ValueError, VirtualMachineError):
+            return False
 
-    file = open("./fixtures/nfts-to-be-minted.txt")
-    uris = file.read().splitlines()
-    file.close()
+    def resumeFrom(self):
+        """Last minted id, including batches mined after the last checkpoint."""
+        lastId = self.checkpoint.lastId
+        if not self._exists(lastId + 1):
+            return lastId
 
-    print(len(uris))
-    chunkSize = 120
+        # gallop then bisect, minted ids are a contiguous range
+        step = 1
+        while self._exists(lastId + step * 2):
+            step *= 2
+        lo, hi = lastId + step, lastId + step * 2
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self._exists(mid):
+                lo = mid
+            else:
+                hi = mid
+        self.checkpoint.save(lo)
+        return lo
 
-    cks = chunks(uris, chunkSize)
+    # ---------- batching ----------
 
-    i = 1
+    def _gasBudget(self):
+        return int(web3.eth.get_block("latest").gasLimit * self.gasLimitShare)
+
+    def _args(self, items):
+        return (
+            [self.account.address] * len(items),
+            [i[0] for i in items],
+            [i[1] for i in items],
+        )
+
+    def _estimate(self, items):
+        return self.nft.mintBatch.estimate_gas(
+            *self._args(items), {"from": self.account}
+        )
+
+    def nextBatch(self, stream):
+        """Take the largest batch fitting the gas budget, returns (items, gas)."""
+        budget = self._gasBudget()
+
+        if self.perItemGas is None:
+            probe = stream.take(10)
+            if not probe:
+                return [], 0
+            self.perItemGas = -(-self._estimate(probe) // len(probe))
+            stream.putBack(probe)
+
+        items = stream.take(max(budget // self.perItemGas, 1))
+        while items:
+            gas = self._estimate(items)
+            if gas <= budget or len(items) == 1:
+                return items, gas
+            # URIs longer than estimated, shrink proportionally
+            keep = max(len(items) * budget // gas, 1)
+            stream.putBack(items[keep:])
+            items = items[:keep]
+        return [], 0
+
+    # ---------- pipeline ----------
+
+    def send(self, items, gas):
+        tx = self.nft.mintBatch(
+            *self._args(items),
+            {
+                "from": self.account,
+                "nonce": self.nonce,
+                "gas_limit": int(gas * 1.1),
+                "required_confs": 0,
+            },
+        )
+        self.nonce += 1
+        self.inFlight.append((tx, items[0][0], items[-1][0], len(items)))
+
+    def confirmOldest(self):
+        tx, firstId, lastId, size = self.inFlight.popleft()
+        try:
+            tx.wait(1)
+        except VirtualMachineError:
+            pass
+        if tx.status != 1:
+            raise RuntimeError(
+                f"mintBatch {firstId}-{lastId} reverted ({tx.txid}), "
+                f"resume from {self.checkpoint.lastId + 1}"
+            )
+
+        self.checkpoint.save(lastId)
+        self.batches.append((firstId, lastId, size, tx.gas_used))
+
+        # keep the most pessimistic observation, URIs have different lengths
+        self.perItemGas = max(self.perItemGas, -(-tx.gas_used // size))
+
+    def run(self, urisPath):
+        self.start = time.time()
+        # pending, previous runs may have left transactions in the mempool
+        self.nonce = web3.eth.get_transaction_count(self.account.address, "pending")
+
+        stream = UriStream(urisPath, self.resumeFrom())
+        try:
+            while True:
+                items, gas = self.nextBatch(stream)
+                if not items:
+                    break
+                if len(self.inFlight) >= self.maxInFlight:
+                    self.confirmOldest()
+                self.send(items, gas)
+
+            while self.inFlight:
+                self.confirmOldest()
+        finally:
+            stream.close()
+
+    def report(self):
+        elapsed = time.time() - self.start
+        minted = sum(b[2] for b in self.batches)
+        gasUsed = sum(b[3] for b in self.batches)
+
+        click.echo("        ---- Batches ----")
+        for firstId, lastId, size, batchGas in self.batches:
+            click.echo(
+                f"    {firstId}-{lastId}: {size} tokens, "
+                f"{batchGas} gas, {batchGas // size} gas/token"
+            )
+
+        click.echo(
+            f"""
+            -------- Stats --------
+                Minted: {minted}
+                   Txs: {len(self.batches)}
+           Last Minted: {self.checkpoint.lastId}
+              TotalGas: {gasUsed}
+             Gas/Token: {gasUsed // minted if minted else 0}
+          Elapsed Time: {elapsed:.1f} s
+            Tokens/Sec: {minted / elapsed if elapsed else 0:.2f}
+            -----------------------
+         """
+        )
+
+
+def main(
+    nftAddress="0x8fA4d7B0C204B8f03C9f037E05Cece57decE2214",
+    uris="./fixtures/nfts-to-be-minted.txt",
+    checkpoint="./fixtures/nfts-minted.checkpoint.json",
+    gasLimitShare="0.5",
+    maxInFlight="4",
+):
+    dev = accounts.load("rentable-deployer")
+    testNFT = TestNFT.at(nftAddress)
 
-    for c in cks:
-        to = []
-        ids = []
-        tokenUris = []
-        for j in range(len(c)):
-            ids.append(i)
-            to.append(dev.address)
-            tokenUris.append(c[j])
-            i += 1
-        testNFT.mintBatch(to, ids, tokenUris, {"from": dev})
+    pipeline = MintPipeline(
+        testNFT,
+        dev,
+        Checkpoint(checkpoint, testNFT.address),
+        float(gasLimitShare),
+        int(maxInFlight),
+    )
+    try:
+        pipeline.run(uris)
+    finally:
+        pipeline.report()
@@ -0,0 +1,374 @@
+import json
+import sqlite3
+import time
+
+import click
+
+from brownie import Rentable, web3
+
+# IRentableEvents indexed by the store
+indexedEvents = [
+    "Deposit",
+    "Withdraw",
+    "UpdateRentalConditions",
+    "Rent",
+    "RentEnds",
+    "RentalExtended",
+    "WalletCreated",
+]
+
+schema = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    rentable TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    blockHash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block INTEGER NOT NULL,
+    logIndex INTEGER NOT NULL,
+    txHash TEXT NOT NULL,
+    event TEXT NOT NULL,
+    tokenAddress TEXT,
+    tokenId TEXT,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block, logIndex)
+);
+CREATE INDEX IF NOT EXISTS eventsByToken ON events (tokenAddress, tokenId);
+CREATE TABLE IF NOT EXISTS deposits (
+    tokenAddress TEXT NOT NULL,
+    tokenId TEXT NOT NULL,
+    depositor TEXT,
+    deposited INTEGER NOT NULL DEFAULT 0,
+    listed INTEGER NOT NULL DEFAULT 0,
+    paymentTokenAddress TEXT,
+    paymentTokenId TEXT,
+    minTimeDuration INTEGER,
+    maxTimeDuration INTEGER,
+    pricePerSecond TEXT,
+    privateRenter TEXT,
+    renter TEXT,
+    expiresAt INTEGER NOT NULL DEFAULT 0,
+    updatedAt INTEGER NOT NULL,
+    PRIMARY KEY (tokenAddress, tokenId)
+);
+CREATE INDEX IF NOT EXISTS depositsByExpiry ON deposits (expiresAt);
+CREATE TABLE IF NOT EXISTS wallets (
+    user TEXT PRIMARY KEY,
+    wallet TEXT NOT NULL,
+    block INTEGER NOT NULL
+);
+"""
+
+
+def fetchLogs(address, topics, fromBlock, toBlock, chunkSize, maxChunkSize=100_000):
+    """Yield (fromBlock, toBlock, logs) chunks of eth_getLogs adapting the range size.
+
+    The range is halved when the node refuses a query (too many results, timeout)
+    and doubled again after successful ones, up to maxChunkSize blocks."""
+    start = fromBlock
+    while start <= toBlock:
+        end = min(start + chunkSize - 1, toBlock)
+        try:
+            logs = web3.eth.get_logs(
+                {
+                    "address": address,
+                    "fromBlock": start,
+                    "toBlock": end,
+                    "topics": [topics],
+                }
+            )
+        except ValueError:
+            if chunkSize == 1:
+                raise
+            chunkSize = max(chunkSize // 2, 1)
+            continue
+
+        yield start, end, logs
+
+        start = end + 1
+        chunkSize = min(chunkSize * 2, maxChunkSize)
+
+
+class RentableIndexer:
+    """Incremental Rentable event indexer backed by SQLite.
+
+    Events are stored as-is in `events` and projected into `deposits` and `wallets`,
+    so the current state of every deposit can be queried locally."""
+
+    def __init__(
+        self,
+        rentableAddress,
+        dbPath="rentable-index.sqlite",
+        startBlock=0,
+        confirmations=0,
+        reorgDepth=12,
+        chunkSize=2_000,
+    ):
+        self.address = web3.toChecksumAddress(rentableAddress)
+        self.contract = web3.eth.contract(address=self.address, abi=Rentable.abi)
+        self.startBlock = startBlock
+        self.confirmations = confirmations
+        self.reorgDepth = reorgDepth
+        self.chunkSize = chunkSize
+
+        self.topics = {Rentable.topics[e]: e for e in indexedEvents}
+
+        self.db = sqlite3.connect(dbPath)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(schema)
+
+        checkpoint = self.checkpoint()
+        if checkpoint is not None and checkpoint["rentable"] != self.address:
+            raise ValueError(
+                f"{dbPath} indexes {checkpoint['rentable']}, not {self.address}"
+            )
+
+    # ---------- checkpoint ----------
+
+    def checkpoint(self):
+        return self.db.execute("SELECT * FROM checkpoint WHERE id = 0").fetchone()
+
+    def lastBlock(self):
+        checkpoint = self.checkpoint()
+        return self.startBlock - 1 if checkpoint is None else checkpoint["block"]
+
+    def _saveCheckpoint(self, block):
+        blockHash = web3.eth.get_block(block).hash.hex() if block >= 0 else ""
+        self.db.execute(
+            "INSERT OR REPLACE INTO checkpoint (id, rentable, block, blockHash) VALUES (0, ?, ?, ?)",
+            (self.address, block, blockHash),
+        )
+
+    # ---------- reorgs ----------
+
+    def _detectReorg(self):
+        checkpoint = self.checkpoint()
+        if checkpoint is None or checkpoint["block"] < 0:
+            return False
+        return (
+            web3.eth.get_block(checkpoint["block"]).hash.hex()
+            != checkpoint["blockHash"]
+        )
+
+    def rollback(self, blocks):
+        """Drop the last `blocks` indexed blocks and rebuild the touched state."""
+        lastValidBlock = max(self.lastBlock() - blocks, self.startBlock - 1)
+
+        with self.db:
+            touched = self.db.execute(
+                "SELECT DISTINCT tokenAddress, tokenId FROM events WHERE block > ? AND tokenId IS NOT NULL",
+                (lastValidBlock,),
+            ).fetchall()
+            self.db.execute("DELETE FROM events WHERE block > ?", (lastValidBlock,))
+            self.db.execute("DELETE FROM wallets WHERE block > ?", (lastValidBlock,))
+
+            for row in touched:
+                self.db.execute(
+                    "DELETE FROM deposits WHERE tokenAddress = ? AND tokenId = ?",
+                    (row["tokenAddress"], row["tokenId"]),
+                )
+                replay = self.db.execute(
+                    "SELECT * FROM events WHERE tokenAddress = ? AND tokenId = ? ORDER BY block, logIndex",
+                    (row["tokenAddress"], row["tokenId"]),
+                ).fetchall()
+                for event in replay:
+                    self._project(
+                        event["event"], json.loads(event["args"]), event["block"]
+                    )
+
+            self._saveCheckpoint(lastValidBlock)
+
+        return lastValidBlock
+
+    # ---------- ingestion ----------
+
+    def _decode(self, log):
+        name = self.topics[log["topics"][0].hex()]
+        decoded = self.contract.events[name]().processLog(log)
+        args = {
+            k: (str(v) if isinstance(v, int) else v) for k, v in decoded.args.items()
+        }
+        return name, args
+
+    def _project(self, name, args, block):
+        if name == "WalletCreated":
+            self.db.execute(
+                "INSERT OR REPLACE INTO wallets (user, wallet, block) VALUES (?, ?, ?)",
+                (args["user"], args["walletAddress"], block),
+            )
+            return
+
+        key = (args["tokenAddress"], args["tokenId"])
+        self.db.execute(
+            "INSERT OR IGNORE INTO deposits (tokenAddress, tokenId, updatedAt) VALUES (?, ?, ?)",
+            key + (block,),
+        )
+
+        if name == "Deposit":
+            self.db.execute(
+                """UPDATE deposits SET depositor = ?, deposited = 1, listed = 0, renter = NULL,
+                expiresAt = 0, updatedAt = ? WHERE tokenAddress = ? AND tokenId = ?""",
+                (args["who"], block) + key,
+            )
+        elif name == "Withdraw":
+            self.db.execute(
+                """UPDATE deposits SET deposited = 0, listed = 0, renter = NULL,
+                updatedAt = ? WHERE tokenAddress = ? AND tokenId = ?""",
+                (block,) + key,
+            )
+        elif name == "UpdateRentalConditions":
+            self.db.execute(
+                """UPDATE deposits SET listed = ?, paymentTokenAddress = ?, paymentTokenId = ?,
+                minTimeDuration = ?, maxTimeDuration = ?, pricePerSecond = ?, privateRenter = ?,
+                updatedAt = ? WHERE tokenAddress = ? AND tokenId = ?""",
+                (
+                    int(int(args["maxTimeDuration"]) > 0),
+                    args["paymentTokenAddress"],
+                    args["paymentTokenId"],
+                    int(args["minTimeDuration"]),
+                    int(args["maxTimeDuration"]),
+                    args["pricePerSecond"],
+                    args["privateRenter"],
+                    block,
+                )
+                + key,
+            )
+        elif name == "Rent":
+            self.db.execute(
+                """UPDATE deposits SET depositor = ?, renter = ?, expiresAt = ?,
+                updatedAt = ? WHERE tokenAddress = ? AND tokenId = ?""",
+                (args["from"], args["to"], int(args["expiresAt"]), block) + key,
+            )
+        elif name == "RentalExtended":
+            self.db.execute(
+                """UPDATE deposits SET expiresAt = ?, updatedAt = ?
+                WHERE tokenAddress = ? AND tokenId = ?""",
+                (int(args["expiresAt"]), block) + key,
+            )
+        elif name == "RentEnds":
+            self.db.execute(
+                """UPDATE deposits SET renter = NULL, updatedAt = ?
+                WHERE tokenAddress = ? AND tokenId = ?""",
+                (block,) + key,
+            )
+
+    def _ingest(self, logs, toBlock):
+        rows = []
+        with self.db:
+            for log in logs:
+                name, args = self._decode(log)
+                rows.append(
+                    (
+                        log["blockNumber"],
+                        log["logIndex"],
+                        log["transactionHash"].hex(),
+                        name,
+                        args.get("tokenAddress"),
+                        args.get("tokenId"),
+                        json.dumps(args),
+                    )
+                )
+                self._project(name, args, log["blockNumber"])
+
+            self.db.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._saveCheckpoint(toBlock)
+
+        return len(rows)
+
+    def sync(self, toBlock=None):
+        """Index up to `toBlock` (default: head minus confirmations)."""
+        if self._detectReorg():
+            click.echo(f"Reorg detected, rolling back {self.reorgDepth} blocks")
+            self.rollback(self.reorgDepth)
+
+        head = web3.eth.block_number - self.confirmations
+        toBlock = head if toBlock is None else min(toBlock, head)
+
+        indexed = 0
+        for start, end, logs in fetchLogs(
+            self.address,
+            list(self.topics.keys()),
+            self.lastBlock() + 1,
+            toBlock,
+            self.chunkSize,
+        ):
+            indexed += self._ingest(logs, end)
+
+        return indexed
+
+    # ---------- queries ----------
+
+    def deposit(self, tokenAddress, tokenId):
+        return self.db.execute(
+            "SELECT * FROM deposits WHERE tokenAddress = ? AND tokenId = ?",
+            (web3.toChecksumAddress(tokenAddress), str(tokenId)),
+        ).fetchone()
+
+    def listed(self, tokenAddress=None, now=None):
+        """Deposits available for rental at `now` (default: current time)."""
+        now = int(time.time()) if now is None else now
+        query = "SELECT * FROM deposits WHERE deposited = 1 AND listed = 1 AND expiresAt <= ?"
+        params = (now,)
+        if tokenAddress is not None:
+            query += " AND tokenAddress = ?"
+            params += (web3.toChecksumAddress(tokenAddress),)
+        return self.db.execute(query, params).fetchall()
+
+    def rentals(self, renter=None, now=None):
+        """Active rentals at `now`, optionally for a single renter."""
+        now = int(time.time()) if now is None else now
+        query = "SELECT * FROM deposits WHERE renter IS NOT NULL AND expiresAt > ?"
+        params = (now,)
+        if renter is not None:
+            query += " AND renter = ?"
+            params += (web3.toChecksumAddress(renter),)
+        return self.db.execute(query, params).fetchall()
+
+    def expiring(self, until):
+        """Rentals not yet settled on-chain expiring before `until`, soonest first."""
+        return self.db.execute(
+            "SELECT * FROM deposits WHERE renter IS NOT NULL AND expiresAt <= ? ORDER BY expiresAt",
+            (until,),
+        ).fetchall()
+
+    def wallet(self, user):
+        row = self.db.execute(
+            "SELECT wallet FROM wallets WHERE user = ?",
+            (web3.toChecksumAddress(user),),
+        ).fetchone()
+        return None if row is None else row["wallet"]
+
+
+def main(
+    rentableAddress="0xb8Cd02CbCc05Ac25D77F63FAbB2501Bb71f9e2BB",
+    dbPath="rentable-index.sqlite",
+    startBlock="0",
+    follow="false",
+    pollInterval="5",
+):
+    indexer = RentableIndexer(rentableAddress, dbPath, int(startBlock))
+
+    while True:
+        start = time.time()
+        indexed = indexer.sync()
+        click.echo(
+            f"Indexed {indexed} events up to block {indexer.lastBlock()} in {time.time() - start:.2f}s"
+        )
+
+        if follow.lower() != "true":
+            break
+        time.sleep(int(pollInterval))
+
+    click.echo(
+        f"""
+            -------- Index --------
+              Deposits: {indexer.db.execute("SELECT COUNT(*) FROM deposits WHERE deposited = 1").fetchone()[0]}
+                Listed: {len(indexer.listed())}
+        Active rentals: {len(indexer.rentals())}
+               Wallets: {indexer.db.execute("SELECT COUNT(*) FROM wallets").fetchone()[0]}
+            -----------------------
+         """
+    )
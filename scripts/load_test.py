@@ -0,0 +1,378 @@
+import json
+import random
+import subprocess
+import time
+
+import click
+
+from brownie import accounts, chain, network
+from brownie.exceptions import VirtualMachineError
+
+from scripts.deploy_testnet import deploy
+from scripts.fees import FeeOracle
+from scripts.fill_marketplace import encodeRentalConditions
+from scripts.tx_engine import TxEngine
+from scripts.workload import captureChain, saveWorkload
+
+eth = "0x0000000000000000000000000000000000000000"
+
+DEFAULT_MIX = "deposit=1,depositAndList=3,list=1,update=1,rent=4,expire=1,withdraw=1"
+
+# flow => token states it applies to
+FLOW_STATES = {
+    "deposit": ("wallet",),
+    "depositAndList": ("wallet",),
+    "list": ("deposited",),
+    "update": ("listed",),
+    "rent": ("listed", "expired"),
+    "expire": ("expired",),
+    "withdraw": ("deposited", "listed", "expired"),
+}
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+def gasStats(values):
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean": sum(values) // len(values) if values else 0,
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else 0,
+    }
+
+
+def parseMix(mix):
+    weights = {}
+    for item in mix.split(","):
+        flow, weight = item.split("=")
+        assert flow in FLOW_STATES, f"Unknown flow {flow}"
+        weights[flow] = float(weight)
+    return weights
+
+
+class Token:
+    def __init__(self, tokenId, rentee):
+        self.tokenId = tokenId
+        self.rentee = rentee
+        self.state = "wallet"  # wallet, deposited, listed, rented
+        self.expiresAt = 0
+        self.price = 0
+        self.maxTimeDuration = 0
+
+    def stateAt(self, now):
+        if self.state == "rented" and self.expiresAt <= now:
+            return "expired"
+        return self.state
+
+
+class LoadTest:
+    """Drive a mix of Rentable flows in parallel from many accounts.
+
+    The test runs in rounds: every round each account submits up to
+    txsPerAccount transactions through its own TxEngine (independent nonces),
+    all engines are awaited, the local model of every token is updated and
+    chain time moves forward by roundTime."""
+
+    def __init__(
+        self,
+        stack,
+        keeper,
+        rentees,
+        renters,
+        mix,
+        txsPerAccount=2,
+        roundTime=1800,
+        maxTimeDuration=6 * 3600,
+        seed=0,
+    ):
+        self.rentable = stack["Rentable"]
+        self.nft = stack["TestNFT"]
+        self.keeper = keeper
+        self.rentees = rentees
+        self.renters = renters
+        self.mix = mix
+        self.txsPerAccount = txsPerAccount
+        self.roundTime = roundTime
+        self.maxTimeDuration = maxTimeDuration
+        self.random = random.Random(seed)
+
+        self.fees = FeeOracle()  # shared by the account engines
+        self.engines = {}
+        self.tokens = []
+        self.renterWallets = set()
+
+        self.gas = {}  # flow => [gasUsed]
+        self.reverts = {}  # (flow, reason) => count
+        self.submitted = 0
+        self.confirmed = 0
+        self.skipped = 0
+        self.elapsed = 0
+
+    def _engine(self, account):
+        if account.address not in self.engines:
+            self.engines[account.address] = TxEngine(
+                account, fees=self.fees, pollInterval=0.2, pollWorkers=2
+            )
+        return self.engines[account.address]
+
+    # ---------- setup ----------
+
+    def setup(self, tokensPerRentee, funding):
+        engine = self._engine(self.keeper)
+        tokenId = 0
+        for rentee in self.rentees + self.renters:
+            engine.transfer(rentee, funding)
+        for rentee in self.rentees:
+            ids = list(range(tokenId + 1, tokenId + tokensPerRentee + 1))
+            tokenId += tokensPerRentee
+            engine.transact(
+                self.nft.mintBatch, [rentee] * len(ids), ids, [""] * len(ids)
+            )
+            self.tokens += [Token(i, rentee) for i in ids]
+        assert not engine.wait(), "Setup failed"
+
+    # ---------- flows ----------
+
+    def _conditions(self, token):
+        token.price = self.random.randrange(10**9, 10**12)
+        token.maxTimeDuration = self.random.randrange(3600, self.maxTimeDuration)
+        return (0, token.maxTimeDuration, token.price, 0, eth, eth)
+
+    def _submit(self, flow, token, now):
+        """Broadcast a flow, returns (pending tx, (state, expiresAt) on success)."""
+        r = self.rentable
+        engine = self._engine(token.rentee)
+
+        if flow == "deposit":
+            tx = engine.transact(
+                self.nft.safeTransferFrom, token.rentee, r, token.tokenId
+            )
+            return tx, ("deposited", None)
+        if flow == "depositAndList":
+            data = encodeRentalConditions(*self._conditions(token))
+            tx = engine.transact(
+                self.nft.safeTransferFrom, token.rentee, r, token.tokenId, data
+            )
+            return tx, ("listed", None)
+        if flow in ("list", "update"):
+            tx = engine.transact(
+                r.createOrUpdateRentalConditions,
+                self.nft,
+                token.tokenId,
+                self._conditions(token),
+            )
+            return tx, ("listed", None)
+        if flow == "withdraw":
+            tx = engine.transact(r.withdraw, self.nft, token.tokenId)
+            return tx, ("wallet", None)
+        if flow == "rent":
+            renter = self.random.choice(self.renters)
+            duration = self.random.randrange(60, token.maxTimeDuration)
+            label = (
+                "rent:repeat" if renter.address in self.renterWallets else "rent:first"
+            )
+            tx = self._engine(renter).transact(
+                r.rent,
+                self.nft,
+                token.tokenId,
+                duration,
+                label=label,
+                value=duration * token.price,
+            )
+            # the first rent creates the wallet, later ones are repeat rents
+            self.renterWallets.add(renter.address)
+            return tx, ("rented", now + duration)
+        raise ValueError(flow)
+
+    def _pick(self, flow, now, busy, quota):
+        states = FLOW_STATES[flow]
+        # rentee quota, rent and expire are submitted by renters and keeper
+        limited = flow not in ("rent", "expire")
+        candidates = [
+            t
+            for t in self.tokens
+            if t.tokenId not in busy
+            and t.stateAt(now) in states
+            and (not limited or quota.get(t.rentee.address, 0) < self.txsPerAccount)
+        ]
+        return self.random.choice(candidates) if candidates else None
+
+    def _revert(self, flow, reason):
+        key = (flow, reason)
+        self.reverts[key] = self.reverts.get(key, 0) + 1
+
+    def _revertReason(self, tx):
+        try:
+            return tx.receipts[-1].revert_msg or tx.error
+        except Exception:
+            # tracing not supported by the node
+            return tx.error
+
+    def round(self):
+        start = time.time()
+        now = chain.time()
+        busy = set()
+        quota = {}
+        submissions = []  # (flow, tokens, tx, newState)
+
+        flows = list(self.mix)
+        weights = [self.mix[f] for f in flows]
+        slots = (len(self.rentees) + len(self.renters)) * self.txsPerAccount
+
+        expireDue = []
+        for flow in self.random.choices(flows, weights, k=slots):
+            token = self._pick(flow, now, busy, quota)
+            if token is None:
+                self.skipped += 1
+                continue
+            busy.add(token.tokenId)
+            if flow == "expire":
+                # settled in a single keeper transaction below
+                expireDue.append(token)
+                continue
+            if flow != "rent":
+                quota[token.rentee.address] = quota.get(token.rentee.address, 0) + 1
+            try:
+                tx, newState = self._submit(flow, token, now)
+            except VirtualMachineError as e:
+                self._revert(flow, e.revert_msg or "unknown")
+                continue
+            submissions.append((flow, [token], tx, newState))
+
+        if expireDue:
+            tx = self._engine(self.keeper).transact(
+                self.rentable.expireRentals,
+                [self.nft] * len(expireDue),
+                [t.tokenId for t in expireDue],
+                label="expire",
+            )
+            submissions.append(("expire", expireDue, tx, ("listed", None)))
+
+        for engine in self.engines.values():
+            engine.wait()
+        self.elapsed += time.time() - start
+
+        for flow, tokens, tx, (state, expiresAt) in submissions:
+            self.submitted += 1
+            if tx.error is not None:
+                self._revert(tx.label, self._revertReason(tx))
+                if tx.label == "rent:first":
+                    self.renterWallets.discard(tx.receipts[0].sender.address)
+                continue
+            self.confirmed += 1
+            self.gas.setdefault(tx.label, []).append(tx.gasUsed)
+            for token in tokens:
+                token.state = state
+                token.expiresAt = expiresAt or 0
+
+        chain.sleep(self.roundTime)
+        chain.mine()
+
+    # ---------- results ----------
+
+    def results(self):
+        flows = {flow: gasStats(gas) for flow, gas in sorted(self.gas.items())}
+        first = flows.get("rent:first", gasStats([]))
+        repeat = flows.get("rent:repeat", gasStats([]))
+
+        try:
+            commit = subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], text=True
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            "commit": commit,
+            "network": network.show_active(),
+            "accounts": {"rentees": len(self.rentees), "renters": len(self.renters)},
+            "tokens": len(self.tokens),
+            "mix": self.mix,
+            "submitted": self.submitted,
+            "confirmed": self.confirmed,
+            "skipped": self.skipped,
+            "elapsed": round(self.elapsed, 3),
+            "txPerSec": round(self.confirmed / self.elapsed, 3) if self.elapsed else 0,
+            "gas": flows,
+            "reverts": [
+                {"flow": flow, "reason": reason, "count": count}
+                for (flow, reason), count in sorted(self.reverts.items())
+            ],
+            "rentWalletCreation": {
+                "firstP50": first["p50"],
+                "repeatP50": repeat["p50"],
+                "overheadP50": first["p50"] - repeat["p50"],
+            },
+        }
+
+
+def main(
+    rentees="10",
+    renters="10",
+    tokensPerRentee="10",
+    rounds="20",
+    mix=DEFAULT_MIX,
+    txsPerAccount="2",
+    output="load-test.json",
+    seed="0",
+    workload="",
+):
+    """Run with a local network, e.g. brownie run load_test --network development
+
+    With `workload` every call to the stack is also captured as a workload
+    file for scripts/workload.py."""
+    assert network.rpc.is_active(), "Load test needs a local node (ganache/anvil)"
+
+    keeper = accounts[0]
+    rentees = [accounts.add() for _ in range(int(rentees))]
+    renters = [accounts.add() for _ in range(int(renters))]
+
+    deployer = TxEngine(keeper)
+    stack = deploy(deployer, keeper, keeper, keeper)
+    startBlock = chain.height + 1
+
+    test = LoadTest(
+        stack,
+        keeper,
+        rentees,
+        renters,
+        parseMix(mix),
+        int(txsPerAccount),
+        seed=int(seed),
+    )
+    test.setup(
+        int(tokensPerRentee), keeper.balance() // (len(rentees) + len(renters) + 1)
+    )
+
+    for i in range(int(rounds)):
+        test.round()
+        click.echo(f"Round {i + 1}: {test.confirmed}/{test.submitted} confirmed")
+
+    results = test.results()
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    if workload:
+        saveWorkload(workload, captureChain(stack, keeper, startBlock))
+
+    click.echo(
+        f"""
+            -------- Load Test --------
+             Submitted: {results["submitted"]}
+             Confirmed: {results["confirmed"]}
+               Skipped: {results["skipped"]}
+                Tx/Sec: {results["txPerSec"]}
+       Rent First P50: {results["rentWalletCreation"]["firstP50"]}
+      Rent Repeat P50: {results["rentWalletCreation"]["repeatP50"]}
+               Results: {output}
+            ---------------------------
+         """
+    )
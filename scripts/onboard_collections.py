@@ -0,0 +1,159 @@
+import json
+import time
+
+import click
+
+from brownie import (
+    accounts,
+    Rentable,
+    RentableCollectionFactory,
+    history,
+    web3,
+)
+
+from scripts.fees import FeeOracle, feeReport, formatFees
+
+address0 = "0x0000000000000000000000000000000000000000"
+
+
+def resolve(value, deployment):
+    """Accept either an address or a contract name from the deployment file."""
+    if value is None:
+        return address0
+    return deployment.get(value, value)
+
+
+def selector(value):
+    """Accept either a 4 bytes selector (0x...) or a function signature."""
+    if value.startswith("0x"):
+        return value
+    return web3.keccak(text=value)[:4].hex()
+
+
+def toCollection(entry, defaults, deployment):
+    return (
+        web3.toChecksumAddress(entry["tokenAddress"]),
+        resolve(entry.get("oBeacon", defaults["oBeacon"]), deployment),
+        resolve(entry.get("wBeacon", defaults["wBeacon"]), deployment),
+    )
+
+
+def governanceCalls(r, entry, event, deployment):
+    """Library and proxy calls of an onboarded collection, governance only
+    as they run code in Rentable context."""
+    calls = []
+    library = resolve(entry.get("library"), deployment)
+    if library != address0:
+        calls.append(r.setLibrary.encode_input(event["tokenAddress"], library))
+    for key, token in [("oProxyCalls", "oRentable"), ("wProxyCalls", "wRentable")]:
+        for s in entry.get(key, []):
+            calls.append(
+                r.enableProxyCall.encode_input(event[token], selector(s), True)
+            )
+    return calls
+
+
+def chunks(lst, n):
+    """Yield successive n-sized chunks from lst."""
+    for i in range(0, len(lst), n):
+        yield lst[i : i + n]
+
+
+def main(
+    config="fixtures/collections-to-be-onboarded.json",
+    deploymentFile="deployments/ethereum-mainnet.json",
+    batchSize="10",
+    urgency="normal",
+):
+    dev = accounts.load("rentable-deployer")
+    accounts.default = dev
+    fees = FeeOracle(urgency).apply()
+
+    initialDeployerBalance = dev.balance()
+    click.echo(
+        f"""
+        ---- Params ----
+     Deployer: {dev.address}
+      Balance: {initialDeployerBalance/1e18} ETH
+         Fees: {formatFees(fees)}
+        ----------------
+    """
+    )
+
+    deployment = json.load(open(deploymentFile))
+    onboarding = json.load(open(config))
+
+    r = Rentable.at(deployment["Rentable"])
+
+    if "RentableCollectionFactory" in deployment:
+        factory = RentableCollectionFactory.at(
+            deployment["RentableCollectionFactory"], dev
+        )
+    else:
+        factory = RentableCollectionFactory.deploy(r, deployment["ProxyAdmin"])
+        click.echo(f"RentableCollectionFactory deployed: {factory.address}")
+
+    if r.getCollectionFactory() != factory.address:
+        click.echo(
+            f"""
+    Collection factory not enabled, governance ({r.getGovernance()}) must call:
+        Rentable.setCollectionFactory({factory.address})
+    Remember to add RentableCollectionFactory to {deploymentFile}
+    """
+        )
+        return
+
+    defaults = {
+        "oBeacon": onboarding.get("oBeacon", "OBeacon"),
+        "wBeacon": onboarding.get("wBeacon", "WBeacon"),
+    }
+
+    collections = []
+    for entry in onboarding["collections"]:
+        if r.getORentable(entry["tokenAddress"]) != address0:
+            click.echo(f"Skipping {entry['name']}: already onboarded")
+            continue
+        collections.append((entry, toCollection(entry, defaults, deployment)))
+
+    start = time.time()
+
+    calls = []
+    for batch in chunks(collections, int(batchSize)):
+        tx = factory.onboardMany([c for _, c in batch])
+        onboarded = tx.events["CollectionOnboarded"]
+        for (entry, _), event in zip(batch, onboarded):
+            calls += governanceCalls(r, entry, event, deployment)
+            click.echo(
+                f"""
+             ---- {entry["name"]} ----
+                 Token: {event["tokenAddress"]}
+             ORentable: {event["oRentable"]}
+             WRentable: {event["wRentable"]}
+             ----------------------
+         """
+            )
+
+    elapsed = time.time() - start
+
+    if calls:
+        click.echo(
+            f"""
+        ---- Governance Tx (libraries and proxy calls) ----
+           To: {r.address}
+         Data: {r.multicall.encode_input(calls)}
+        ---------------------------------------------------
+    """
+        )
+
+    feeReport(history).echo()
+
+    click.echo(
+        f"""
+            -------- Stats --------
+           Collections: {len(collections)}
+          Elapsed Time: {elapsed:.1f} s
+Final Balance Deployer: {dev.balance()/1e18} ETH
+           Total Spent: {(initialDeployerBalance - dev.balance())/1e18} ETH
+            -----------------------
+         """
+    )
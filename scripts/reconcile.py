@@ -0,0 +1,524 @@
+import json
+import os
+import tempfile
+
+import brownie
+import click
+
+from brownie import Rentable, RentableMulticall, accounts, history, interface, web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from scripts.artifacts import oz
+from scripts.fees import FeeOracle, feeReport
+from scripts.sync_admin_config import AdminConfigDiff
+
+# EIP-1967 slots, see ImmutableAdmin*Proxy
+IMPLEMENTATION_SLOT = (
+    "0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc"
+)
+BEACON_SLOT = "0xa3f0ad74e5423aebfd80d3ef4346578335a9a72aeaee59ff6cb3582b35133d50"
+
+# proxy contract => slot of its target, first constructor argument
+PROXY_SLOTS = {
+    "ImmutableAdminTransparentUpgradeableProxy": IMPLEMENTATION_SLOT,
+    "ImmutableAdminUpgradeableBeaconProxy": BEACON_SLOT,
+}
+
+
+def container(name):
+    """Contract container of the project, or cached OpenZeppelin artifact."""
+    return getattr(brownie, name, None) or getattr(oz, name)
+
+
+def rentableAt(address):
+    """Rentable at its proxy address. Brownie registers proxies deployed in the
+    session under the proxy container, they must be removed otw cast fails."""
+    proxies = container("ImmutableAdminTransparentUpgradeableProxy")
+    for proxy in [p for p in proxies if p.address == address]:
+        proxies.remove(proxy)
+    return Rentable.at(address)
+
+
+def saveJson(path, data):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp, path)
+
+
+class NotDeployed(Exception):
+    pass
+
+
+class StopReconcile(Exception):
+    pass
+
+
+class Step:
+    """A transaction of the plan, sent by `sender`."""
+
+    def __init__(self, description, sender, to=None, data=None, deploy=None):
+        self.description = description
+        self.sender = sender
+        self.to = to
+        self.data = data
+        self.deploy = deploy  # deployment name for contract deployments
+
+
+class StateReader:
+    """Read many views at once, in a single eth_call through RentableMulticall
+    when the deployment has one, otw one call each."""
+
+    def __init__(self, multicall=None):
+        self.multicall = multicall
+
+    def read(self, views):
+        """views: [(contract, function name, args)]"""
+        fns = [getattr(c, name) for c, name, _ in views]
+        if self.multicall is None:
+            return [fn(*args) for fn, (_, _, args) in zip(fns, views)]
+
+        calls = [
+            (c.address, fn.encode_input(*args)) for fn, (c, _, args) in zip(fns, views)
+        ]
+        _, results = self.multicall.aggregate(calls)
+        return [
+            fn.decode_output(returnData) if success else None
+            for fn, (success, returnData) in zip(fns, results)
+        ]
+
+
+class Reconciler:
+    """Bring a deployment to the desired state of a spec.
+
+    {
+      "roles": {"governance": "0x...", ...},  // "deployer" is the sender
+      "contracts": {"<name>": {"contract": "Rentable", "args": [...]}},
+      "collections": {"<name>": {"tokenAddress": ..., "oRentable": "<name>",
+                      "wRentable": "<name>", "oBeacon": ..., "wBeacon": ...}},
+      "rentable": {"operator": ..., "walletFactory": ..., "feeCollector": ...,
+                   "fee": ...},
+      "adminConfig": "fixtures/rentable-config.json" or inline,
+      "owners": {"<name>": "<role>"},  // Ownable
+      "governance": {"<name>": "<role>"}  // Rentable two steps governance
+    }
+
+    Values are roles, names of the deployment file, addresses or
+    {"encode": "Contract.function", "args": [...]} calldata. Every phase
+    reads the current state, plans only the missing steps and executes them.
+    The deployment file is rewritten after every confirmed deployment, the
+    transaction of a deployment in flight is kept in `<file>.pending.json`
+    so a rerun adopts it instead of deploying twice."""
+
+    def __init__(self, spec, deploymentFile, account, execute=True, maxSteps=0):
+        self.spec = spec
+        self.deploymentFile = deploymentFile
+        self.pendingFile = f"{os.path.splitext(deploymentFile)[0]}.pending.json"
+        self.account = account
+        self.execute = execute
+        self.maxSteps = maxSteps
+        self.executed = 0
+        self.manual = []  # steps for other senders
+
+        self.deployment = {}
+        if os.path.exists(deploymentFile):
+            with open(deploymentFile) as f:
+                self.deployment = json.load(f)
+        self.pending = {}
+        if os.path.exists(self.pendingFile):
+            with open(self.pendingFile) as f:
+                self.pending = json.load(f)
+
+        self.roles = dict(spec.get("roles", {}))
+        if account is not None:  # read only otw, e.g. roles_audit
+            self.roles["deployer"] = account.address
+
+    # ---------- resolution ----------
+
+    def resolve(self, value):
+        if isinstance(value, dict):
+            contractName, function = value["encode"].split(".")
+            return web3.eth.contract(abi=container(contractName).abi).encodeABI(
+                fn_name=function, args=[self.resolve(a) for a in value["args"]]
+            )
+        if value in self.roles:
+            return web3.toChecksumAddress(self.roles[value])
+        if value in self.deployment:
+            return web3.toChecksumAddress(self.deployment[value])
+        if isinstance(value, str) and value.startswith("0x"):
+            return web3.toChecksumAddress(value)
+        raise NotDeployed(value)
+
+    def contracts(self):
+        """Contracts of the spec, then O/W proxies of every collection."""
+        contracts = dict(self.spec.get("contracts", {}))
+        for collection in self.spec.get("collections", {}).values():
+            for token, beacon, logic in [
+                ("oRentable", "oBeacon", "ORentable"),
+                ("wRentable", "wBeacon", "WRentable"),
+            ]:
+                contracts[collection[token]] = {
+                    "contract": "ImmutableAdminUpgradeableBeaconProxy",
+                    "args": [
+                        collection[beacon],
+                        collection.get("proxyAdmin", "ProxyAdmin"),
+                        {
+                            "encode": f"{logic}.initialize",
+                            "args": [
+                                collection["tokenAddress"],
+                                collection.get("owner", "governance"),
+                                "Rentable",
+                            ],
+                        },
+                    ],
+                }
+        return contracts
+
+    def reader(self):
+        if "RentableMulticall" in self.deployment:
+            return StateReader(
+                RentableMulticall.at(self.deployment["RentableMulticall"])
+            )
+        return StateReader()
+
+    # ---------- phases ----------
+
+    def _adopt(self, name):
+        """Record the deployment in flight of a previous run, if mined."""
+        try:
+            receipt = web3.eth.wait_for_transaction_receipt(
+                self.pending[name], timeout=120
+            )
+        except (TimeExhausted, TransactionNotFound):
+            receipt = None  # dropped or not found, deploy again
+        if receipt is not None and receipt["status"] == 1:
+            self._record(name, receipt["contractAddress"])
+        self.pending.pop(name)
+        saveJson(self.pendingFile, self.pending)
+
+    def _isDeployed(self, name):
+        if name in self.pending:
+            self._adopt(name)
+        address = self.deployment.get(name)
+        return address is not None and len(web3.eth.get_code(address)) > 0
+
+    def deployments(self):
+        return [
+            Step(f"deploy {name} ({c['contract']})", self.account.address, deploy=name)
+            for name, c in self.contracts().items()
+            if not self._isDeployed(name)
+        ]
+
+    def upgrades(self):
+        """Beacons and proxies not pointing to the spec logic/beacon."""
+        reader = self.reader()
+        beacons = []
+        steps = []
+        for name, c in self.contracts().items():
+            if (
+                c["contract"] != "UpgradeableBeacon"
+                and c["contract"] not in PROXY_SLOTS
+            ):
+                continue
+            address = self.resolve(name)
+            target = self.resolve(c["args"][0])
+            if c["contract"] == "UpgradeableBeacon":
+                beacons.append((name, oz.UpgradeableBeacon.at(address), target))
+            elif c["contract"] in PROXY_SLOTS:
+                slot = web3.eth.get_storage_at(address, PROXY_SLOTS[c["contract"]])
+                current = web3.toChecksumAddress(slot[-20:])
+                if current != target:
+                    proxyAdmin = oz.ProxyAdmin.at(self.resolve(c["args"][1]))
+                    steps.append(
+                        Step(
+                            f"upgrade {name}: {current} -> {target}",
+                            proxyAdmin.owner(),
+                            proxyAdmin.address,
+                            proxyAdmin.upgrade.encode_input(address, target),
+                        )
+                    )
+
+        views = []
+        for _, beacon, _ in beacons:
+            views += [(beacon, "implementation", ()), (beacon, "owner", ())]
+        values = reader.read(views)
+        for i, (name, beacon, target) in enumerate(beacons):
+            current, owner = values[2 * i : 2 * i + 2]
+            if current != target:
+                steps.append(
+                    Step(
+                        f"upgrade {name}: {current} -> {target}",
+                        owner,
+                        beacon.address,
+                        beacon.upgradeTo.encode_input(target),
+                    )
+                )
+        return steps
+
+    def settings(self):
+        """Rentable collections, wallet factory, fees and admin config."""
+        r = rentableAt(self.resolve("Rentable"))
+        desired = []  # (description, view, args, desired value, setter)
+        for name, collection in self.spec.get("collections", {}).items():
+            token = self.resolve(collection["tokenAddress"])
+            for view, setter, key in [
+                ("getORentable", "setORentable", "oRentable"),
+                ("getWRentable", "setWRentable", "wRentable"),
+            ]:
+                desired.append(
+                    (
+                        f"{setter} {name}",
+                        view,
+                        (token,),
+                        self.resolve(collection[key]),
+                        getattr(r, setter).encode_input(
+                            token, self.resolve(collection[key])
+                        ),
+                    )
+                )
+        rentable = self.spec.get("rentable", {})
+        for key, view, setter in [
+            ("operator", "getOperator", "setOperator"),
+            ("walletFactory", "getWalletFactory", "setWalletFactory"),
+            ("feeCollector", "getFeeCollector", "setFeeCollector"),
+        ]:
+            if key in rentable:
+                value = self.resolve(rentable[key])
+                desired.append(
+                    (setter, view, (), value, getattr(r, setter).encode_input(value))
+                )
+        if "fee" in rentable:
+            fee = int(rentable["fee"])
+            desired.append(("setFee", "getFee", (), fee, r.setFee.encode_input(fee)))
+
+        values = self.reader().read(
+            [(r, "getGovernance", ())] + [(r, v, args) for _, v, args, _, _ in desired]
+        )
+        governance, values = values[0], values[1:]
+
+        steps = [
+            Step(f"{description}: {current} -> {value}", governance, r.address, call)
+            for (description, _, _, value, call), current in zip(desired, values)
+            if current != value
+        ]
+
+        adminConfig = self.spec.get("adminConfig", {})
+        if isinstance(adminConfig, str):
+            with open(adminConfig) as f:
+                adminConfig = json.load(f)
+        diff = AdminConfigDiff(r, {**self.deployment, **self.roles}).load(adminConfig)
+        steps += [
+            Step(description, governance, r.address, call)
+            for description, call in diff.changes
+        ]
+        return steps
+
+    def owners(self):
+        """Ownable owners and Rentable governance, last as they lock the
+        deployer out."""
+        reader = self.reader()
+        owners = self.spec.get("owners", {})
+        governance = self.spec.get("governance", {})
+
+        ownables = [(n, interface.IOwnable(self.resolve(n))) for n in owners]
+        rentables = [(n, rentableAt(self.resolve(n))) for n in governance]
+        views = [(c, "owner", ()) for _, c in ownables]
+        for _, c in rentables:
+            views += [(c, "getGovernance", ()), (c, "getPendingGovernance", ())]
+        values = reader.read(views)
+
+        steps = []
+        for (name, c), current in zip(ownables, values):
+            owner = self.resolve(owners[name])
+            if current != owner:
+                steps.append(
+                    Step(
+                        f"{name} owner: {current} -> {owner}",
+                        current,
+                        c.address,
+                        c.transferOwnership.encode_input(owner),
+                    )
+                )
+
+        values = values[len(ownables) :]
+        for i, (name, c) in enumerate(rentables):
+            current, pending = values[2 * i : 2 * i + 2]
+            wanted = self.resolve(governance[name])
+            if current == wanted:
+                continue
+            if pending == wanted:
+                click.echo(f"{name} governance: waiting acceptGovernance of {wanted}")
+                continue
+            steps.append(
+                Step(
+                    f"{name} governance: {current} -> {wanted} (to be accepted)",
+                    current,
+                    c.address,
+                    c.setGovernance.encode_input(wanted),
+                )
+            )
+        return steps
+
+    # ---------- execution ----------
+
+    def _record(self, name, address):
+        self.deployment[name] = address
+        saveJson(self.deploymentFile, self.deployment)
+
+    def _deploy(self, name):
+        spec = self.contracts()[name]
+        args = [self.resolve(a) for a in spec.get("args", [])]
+        deployed = container(spec["contract"]).deploy(
+            *args, {"from": self.account, "required_confs": 0}
+        )
+        # brownie returns the contract when already mined (automine nodes)
+        receipt = getattr(deployed, "tx", deployed)
+        self.pending[name] = receipt.txid
+        saveJson(self.pendingFile, self.pending)
+
+        receipt.wait(1)
+        assert receipt.status == 1, f"{name} deployment failed"
+        self._record(name, receipt.contract_address)
+        self.pending.pop(name)
+        saveJson(self.pendingFile, self.pending)
+
+    def _run(self, step):
+        if self.maxSteps and self.executed == self.maxSteps:
+            raise StopReconcile()
+
+        if step.deploy is not None:
+            self._deploy(step.deploy)
+        else:
+            tx = self.account.transfer(step.to, 0, data=step.data)
+            assert tx.status == 1, f"{step.description} failed"
+        self.executed += 1
+
+    def phase(self, name, plan):
+        try:
+            steps = plan()
+        except NotDeployed as e:
+            click.echo(f"    {name}: after {e} is deployed")
+            return False
+
+        click.echo(f"    {name}: {len(steps)} steps")
+        for step in steps:
+            if step.sender != self.account.address:
+                click.echo(f"      - {step.description} (sender {step.sender})")
+                self.manual.append(step)
+            elif not self.execute:
+                click.echo(f"      - {step.description}")
+            else:
+                click.echo(f"      + {step.description}")
+                self._run(step)
+        return True
+
+    def reconcile(self):
+        """Run every phase, returns False when stopped after maxSteps."""
+        try:
+            for name, plan in [
+                ("Deployments", self.deployments),
+                ("Upgrades", self.upgrades),
+                ("Settings", self.settings),
+                ("Owners", self.owners),
+            ]:
+                if not self.phase(name, plan):
+                    break
+        except StopReconcile:
+            return False
+        return True
+
+
+def main(
+    spec="fixtures/deployment-spec.json",
+    deploymentFile="deployments/ethereum-mainnet.json",
+    execute="false",
+    account="rentable-deployer",
+    urgency="normal",
+    maxSteps="0",
+):
+    """Print the plan, or execute it with execute=true. Steps of other senders
+    (e.g. governance multisig) are printed with their calldata."""
+    dev = accounts.load(account)
+    accounts.default = dev
+    FeeOracle(urgency).apply()
+
+    with open(spec) as f:
+        desired = json.load(f)
+
+    reconciler = Reconciler(
+        desired, deploymentFile, dev, execute.lower() == "true", int(maxSteps)
+    )
+    click.echo(f"        ---- Plan ({deploymentFile}) ----")
+    complete = reconciler.reconcile()
+
+    for step in reconciler.manual:
+        click.echo(
+            f"""
+        ---- {step.description} ----
+       Sender: {step.sender}
+           To: {step.to}
+         Data: {step.data}
+    """
+        )
+
+    feeReport(history).echo()
+    click.echo(
+        f"""
+            -------- Stats --------
+              Executed: {reconciler.executed}
+                Manual: {len(reconciler.manual)}
+              Complete: {complete}
+            -----------------------
+         """
+    )
+
+
+def verify(spec="fixtures/deployment-spec-local.json"):
+    """End-to-end check on a local chain: a run interrupted after a few steps,
+    resumed, then idempotent, e.g. brownie run reconcile verify --network development"""
+    assert brownie.network.rpc.is_active(), "Needs a local node (ganache/anvil)"
+
+    with open(spec) as f:
+        desired = json.load(f)
+    deployer = accounts[0]
+    governance = accounts[1]
+    desired["roles"] = {
+        "governance": governance.address,
+        "operator": deployer.address,
+        "feeCollector": governance.address,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        deploymentFile = os.path.join(tmp, "local.json")
+
+        interrupted = Reconciler(desired, deploymentFile, deployer, maxSteps=3)
+        assert not interrupted.reconcile(), "Expected an interrupted run"
+        partial = dict(interrupted.deployment)
+
+        resumed = Reconciler(desired, deploymentFile, deployer)
+        assert resumed.reconcile() and not resumed.manual
+        deployment = resumed.deployment
+        assert all(deployment[k] == v for k, v in partial.items()), "Redeployed"
+
+        rentableAt(deployment["Rentable"]).acceptGovernance({"from": governance})
+
+        final = Reconciler(desired, deploymentFile, deployer)
+        assert final.reconcile() and final.executed == 0, "Not idempotent"
+
+        r = rentableAt(deployment["Rentable"])
+        for collection in desired["collections"].values():
+            token = final.resolve(collection["tokenAddress"])
+            assert r.getORentable(token) == deployment[collection["oRentable"]]
+            assert r.getWRentable(token) == deployment[collection["wRentable"]]
+        assert r.getGovernance() == governance.address
+
+    click.echo(
+        f"""
+            -------- Verify --------
+           Interrupted: {interrupted.executed} steps
+               Resumed: {resumed.executed} steps
+                 Rerun: {final.executed} steps
+             Contracts: {len(deployment)}
+            ------------------------
+         """
+    )
@@ -0,0 +1,346 @@
+import json
+import os
+import time
+
+import click
+
+from brownie import ORentable, Rentable, accounts, chain, web3
+from brownie.exceptions import VirtualMachineError
+from eth_account import Account
+from eth_account.messages import encode_structured_data
+
+eth = "0x0000000000000000000000000000000000000000"
+
+ORDER_BOOK_VERSION = 1
+
+# see RentableStorageV2 EIP-712 constants
+DOMAIN_NAME = "Rentable"
+DOMAIN_VERSION = "1"
+
+OFFER_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "RentalConditions": [
+        {"name": "minTimeDuration", "type": "uint256"},
+        {"name": "maxTimeDuration", "type": "uint256"},
+        {"name": "pricePerSecond", "type": "uint256"},
+        {"name": "paymentTokenId", "type": "uint256"},
+        {"name": "paymentTokenAddress", "type": "address"},
+        {"name": "privateRenter", "type": "address"},
+    ],
+    "RentalOffer": [
+        {"name": "tokenAddress", "type": "address"},
+        {"name": "tokenId", "type": "uint256"},
+        {"name": "conditions", "type": "RentalConditions"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+    ],
+}
+
+
+def makeOffer(
+    tokenAddress,
+    tokenId,
+    pricePerSecond,
+    maxTimeDuration,
+    nonce,
+    deadline,
+    minTimeDuration=0,
+    paymentTokenAddress=eth,
+    paymentTokenId=0,
+    privateRenter=eth,
+):
+    return {
+        "tokenAddress": web3.toChecksumAddress(tokenAddress),
+        "tokenId": int(tokenId),
+        "conditions": {
+            "minTimeDuration": int(minTimeDuration),
+            "maxTimeDuration": int(maxTimeDuration),
+            "pricePerSecond": int(pricePerSecond),
+            "paymentTokenId": int(paymentTokenId),
+            "paymentTokenAddress": web3.toChecksumAddress(paymentTokenAddress),
+            "privateRenter": web3.toChecksumAddress(privateRenter),
+        },
+        "nonce": int(nonce),
+        "deadline": int(deadline),
+    }
+
+
+def offerTuple(offer):
+    """Offer as Rentable.rentWithOffer argument."""
+    c = offer["conditions"]
+    return (
+        offer["tokenAddress"],
+        offer["tokenId"],
+        (
+            c["minTimeDuration"],
+            c["maxTimeDuration"],
+            c["pricePerSecond"],
+            c["paymentTokenId"],
+            c["paymentTokenAddress"],
+            c["privateRenter"],
+        ),
+        offer["nonce"],
+        offer["deadline"],
+    )
+
+
+def typedData(chainId, rentableAddress, offer):
+    return {
+        "types": OFFER_TYPES,
+        "primaryType": "RentalOffer",
+        "domain": {
+            "name": DOMAIN_NAME,
+            "version": DOMAIN_VERSION,
+            "chainId": int(chainId),
+            "verifyingContract": web3.toChecksumAddress(rentableAddress),
+        },
+        "message": offer,
+    }
+
+
+def signOffer(privateKey, chainId, rentableAddress, offer):
+    """EIP-712 signature of an offer, returns (signature, digest)."""
+    signed = Account.sign_message(
+        encode_structured_data(typedData(chainId, rentableAddress, offer)),
+        privateKey,
+    )
+    return signed.signature.hex(), bytes(signed.messageHash)
+
+
+def recoverSigner(chainId, rentableAddress, offer, signature):
+    return Account.recover_message(
+        encode_structured_data(typedData(chainId, rentableAddress, offer)),
+        signature=signature,
+    )
+
+
+class OrderBook:
+    """Local file of signed rental offers.
+
+    {
+      "version": 1,
+      "chainId": 1,
+      "rentable": "0x...",
+      "offers": [{"signer": "0x...", "signature": "0x...", "offer": {...}}]
+    }
+
+    Offer fields follow RentableTypes.RentalOffer, one entry per
+    (signer, tokenAddress, tokenId, nonce)."""
+
+    def __init__(self, path, chainId, rentableAddress):
+        self.path = path
+        self.chainId = int(chainId)
+        self.rentable = web3.toChecksumAddress(rentableAddress)
+        self.offers = []
+
+        if os.path.exists(path):
+            with open(path) as f:
+                book = json.load(f)
+            assert book["version"] == ORDER_BOOK_VERSION, "Unknown order book"
+            assert (
+                book["chainId"] == self.chainId and book["rentable"] == self.rentable
+            ), "Order book of another deployment"
+            self.offers = book["offers"]
+
+    @staticmethod
+    def _key(entry):
+        offer = entry["offer"]
+        return (
+            entry["signer"],
+            offer["tokenAddress"],
+            offer["tokenId"],
+            offer["nonce"],
+        )
+
+    def add(self, entry):
+        signer = recoverSigner(
+            self.chainId, self.rentable, entry["offer"], entry["signature"]
+        )
+        assert signer == entry["signer"], "Signature does not match signer"
+        self.offers = [o for o in self.offers if self._key(o) != self._key(entry)]
+        self.offers.append(entry)
+
+    def forToken(self, tokenAddress, tokenId):
+        """Offers of a token, cheapest first."""
+        tokenAddress = web3.toChecksumAddress(tokenAddress)
+        return sorted(
+            (
+                o
+                for o in self.offers
+                if o["offer"]["tokenAddress"] == tokenAddress
+                and o["offer"]["tokenId"] == int(tokenId)
+            ),
+            key=lambda o: o["offer"]["conditions"]["pricePerSecond"],
+        )
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "version": ORDER_BOOK_VERSION,
+                    "chainId": self.chainId,
+                    "rentable": self.rentable,
+                    "offers": self.offers,
+                },
+                f,
+                indent=2,
+            )
+        os.replace(tmp, self.path)
+
+
+class OfferVerifier:
+    """Check signed offers against Rentable state, as rentWithOffer would."""
+
+    def __init__(self, rentable):
+        self.rentable = rentable
+        self.orentables = {}
+
+    def _owner(self, tokenAddress, tokenId):
+        if tokenAddress not in self.orentables:
+            self.orentables[tokenAddress] = ORentable.at(
+                self.rentable.getORentable(tokenAddress)
+            )
+        try:
+            return self.orentables[tokenAddress].ownerOf(tokenId)
+        except (ValueError, VirtualMachineError):
+            return None
+
+    def invalidReason(self, entry, now):
+        """None for a rentable offer, otw the reason it would revert."""
+        offer = entry["offer"]
+        if now > offer["deadline"]:
+            return "Offer expired"
+        if self._owner(offer["tokenAddress"], offer["tokenId"]) != entry["signer"]:
+            return "Signer is not the owner"
+        if self.rentable.isRentalOfferCancelled(entry["signer"], offer["nonce"]):
+            return "Offer cancelled"
+        paymentToken = offer["conditions"]["paymentTokenAddress"]
+        if self.rentable.getPaymentTokenAllowlist(paymentToken) == 0:
+            return "Not supported payment token"
+        return None
+
+
+def sign(
+    book,
+    tokenAddress,
+    tokenId,
+    pricePerSecond,
+    maxTimeDuration,
+    nonce,
+    validDays="30",
+    account="rentable-deployer",
+    rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4",
+):
+    """Sign an offer for a deposited token and add it to the order book."""
+    signer = accounts.load(account)
+    rentable = Rentable.at(rentableAddress)
+    offer = makeOffer(
+        tokenAddress,
+        tokenId,
+        pricePerSecond,
+        maxTimeDuration,
+        nonce,
+        int(time.time()) + int(validDays) * 86400,
+    )
+
+    signature, digest = signOffer(signer.private_key, chain.id, rentable.address, offer)
+    # catch domain or encoding mismatches before sharing the offer
+    assert (
+        bytes(rentable.hashRentalOffer(offerTuple(offer))) == digest
+    ), "Digest differs from Rentable.hashRentalOffer"
+
+    orderBook = OrderBook(book, chain.id, rentable.address)
+    orderBook.add({"signer": signer.address, "signature": signature, "offer": offer})
+    orderBook.save()
+
+    click.echo(f"Signed offer {nonce} for {tokenAddress} #{tokenId} in {book}")
+
+
+def prune(book, rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4"):
+    """Drop offers that rentWithOffer would reject."""
+    start = time.time()
+    rentable = Rentable.at(rentableAddress)
+    orderBook = OrderBook(book, chain.id, rentable.address)
+    verifier = OfferVerifier(rentable)
+    now = web3.eth.get_block("latest").timestamp
+
+    kept = []
+    dropped = {}
+    for entry in orderBook.offers:
+        reason = verifier.invalidReason(entry, now)
+        if reason is None:
+            kept.append(entry)
+        else:
+            dropped[reason] = dropped.get(reason, 0) + 1
+
+    orderBook.offers = kept
+    orderBook.save()
+
+    click.echo("        ---- Dropped ----")
+    for reason, count in sorted(dropped.items()):
+        click.echo(f"    {reason}: {count}")
+
+    click.echo(
+        f"""
+            -------- Stats --------
+                 Valid: {len(kept)}
+               Dropped: {sum(dropped.values())}
+          Elapsed Time: {time.time() - start:.1f} s
+            -----------------------
+         """
+    )
+
+
+def rent(
+    book,
+    tokenAddress,
+    tokenId,
+    duration,
+    account="rentable-deployer",
+    rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4",
+):
+    """Rent a token with its cheapest valid offer, paid in Ether."""
+    renter = accounts.load(account)
+    rentable = Rentable.at(rentableAddress)
+    orderBook = OrderBook(book, chain.id, rentable.address)
+    verifier = OfferVerifier(rentable)
+    now = web3.eth.get_block("latest").timestamp
+
+    for entry in orderBook.forToken(tokenAddress, tokenId):
+        if verifier.invalidReason(entry, now) is not None:
+            continue
+        offer = entry["offer"]
+        assert offer["conditions"]["paymentTokenAddress"] == eth, "Ether only"
+        tx = rentable.rentWithOffer(
+            offerTuple(offer),
+            entry["signature"],
+            int(duration),
+            {
+                "from": renter,
+                "value": offer["conditions"]["pricePerSecond"] * int(duration),
+            },
+        )
+        click.echo(f"Rented with offer {offer['nonce']}, {tx.gas_used} gas")
+        return
+
+    click.echo("No valid offer for the token")
+
+
+def cancel(
+    nonces,
+    account="rentable-deployer",
+    rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4",
+):
+    """Cancel offers by comma separated nonces."""
+    signer = accounts.load(account)
+    rentable = Rentable.at(rentableAddress)
+    tx = rentable.cancelRentalOffers(
+        [int(n) for n in nonces.split(",")], {"from": signer}
+    )
+    click.echo(f"Cancelled offers {nonces}, {tx.gas_used} gas")
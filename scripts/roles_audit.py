@@ -0,0 +1,360 @@
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from brownie import Rentable, RentableMulticall, interface, web3
+from brownie.exceptions import VirtualMachineError
+
+from scripts.artifacts import oz
+from scripts.reconcile import PROXY_SLOTS, Reconciler
+from scripts.sync_admin_config import PAYMENT_TOKEN_STATUS
+
+REPORT_VERSION = 1
+
+
+class Check:
+    """Expected value of a role, `fix` builds (sender read, to, data) from the
+    actual value when it can be fixed by a transaction."""
+
+    def __init__(self, contract, address, name, expected, read, fix=None):
+        self.contract = contract
+        self.address = address
+        self.name = name
+        self.expected = expected
+        self.read = read
+        self.fix = fix
+
+
+class RolesAudit:
+    """Read every role of a deployment pinned to one block and diff it with
+    the spec (see reconcile.Reconciler).
+
+    View calls go in a single RentableMulticall eth_call when the deployment
+    has one, otw they are sent concurrently like the storage slot reads
+    (EIP-1967 implementation and beacon slots)."""
+
+    def __init__(self, reconciler, block, workers=8, callsPerRequest=500):
+        self.reconciler = reconciler
+        self.block = block
+        self.pool = ThreadPoolExecutor(workers)
+        self.callsPerRequest = callsPerRequest
+        # key => ("call", address, fn, args) or ("slot", address, slot, None)
+        self.reads = {}
+        self.checks = []
+
+    # ---------- reads ----------
+
+    def call(self, contract, function, *args):
+        key = (contract.address, function, args)
+        self.reads[key] = ("call", contract.address, getattr(contract, function), args)
+        return key
+
+    def slot(self, address, slot):
+        key = (address, slot)
+        self.reads[key] = ("slot", address, slot, None)
+        return key
+
+    def _readOne(self, read):
+        kind, address, target, args = read
+        try:
+            if kind == "slot":
+                value = web3.eth.get_storage_at(address, target, self.block)
+                return web3.toChecksumAddress(value[-20:])
+            return target(*args, block_identifier=self.block)
+        except (ValueError, VirtualMachineError):
+            return None
+
+    def _multicall(self, keys, multicall):
+        values = {}
+        for i in range(0, len(keys), self.callsPerRequest):
+            chunk = keys[i : i + self.callsPerRequest]
+            reads = [self.reads[k] for k in chunk]
+            calls = [(a, fn.encode_input(*args)) for _, a, fn, args in reads]
+            blockNumber, results = multicall.aggregate(
+                calls, block_identifier=self.block
+            )
+            assert blockNumber == self.block, "Results not pinned to the block"
+            for key, (_, _, fn, _), (success, returnData) in zip(chunk, reads, results):
+                values[key] = fn.decode_output(returnData) if success else None
+        return values
+
+    def _readAll(self):
+        calls = [k for k, r in self.reads.items() if r[0] == "call"]
+        others = [k for k, r in self.reads.items() if r[0] != "call"]
+
+        multicall = self.reconciler.deployment.get("RentableMulticall")
+        if multicall is not None and len(web3.eth.get_code(multicall, self.block)):
+            values = self._multicall(calls, RentableMulticall.at(multicall))
+        else:
+            others += calls
+            values = {}
+
+        values.update(
+            zip(others, self.pool.map(lambda k: self._readOne(self.reads[k]), others))
+        )
+        return values
+
+    # ---------- checks ----------
+
+    def _add(self, *args, **kwargs):
+        self.checks.append(Check(*args, **kwargs))
+
+    def contracts(self):
+        """Beacon implementations, proxy targets and admins."""
+        resolve = self.reconciler.resolve
+        for name, c in self.reconciler.contracts().items():
+            if c["contract"] == "UpgradeableBeacon":
+                beacon = oz.UpgradeableBeacon.at(resolve(name))
+                target = resolve(c["args"][0])
+                owner = self.call(beacon, "owner")
+                self._add(
+                    name,
+                    beacon.address,
+                    "implementation",
+                    target,
+                    self.call(beacon, "implementation"),
+                    lambda b=beacon, t=target, o=owner: (
+                        o,
+                        b.address,
+                        b.upgradeTo.encode_input(t),
+                    ),
+                )
+            elif c["contract"] in PROXY_SLOTS:
+                proxy = resolve(name)
+                target = resolve(c["args"][0])
+                proxyAdmin = oz.ProxyAdmin.at(resolve(c["args"][1]))
+                owner = self.call(proxyAdmin, "owner")
+                kind = "implementation" if "Transparent" in c["contract"] else "beacon"
+                self._add(
+                    name,
+                    proxy,
+                    kind,
+                    target,
+                    self.slot(proxy, PROXY_SLOTS[c["contract"]]),
+                    lambda a=proxyAdmin, p=proxy, t=target, o=owner: (
+                        o,
+                        a.address,
+                        a.upgrade.encode_input(p, t),
+                    ),
+                )
+                # immutable admin, a mismatch can only be redeployed
+                self._add(
+                    name,
+                    proxy,
+                    "proxyAdmin",
+                    proxyAdmin.address,
+                    self.call(proxyAdmin, "getProxyAdmin", proxy),
+                )
+
+    def owners(self):
+        for name, role in self.reconciler.spec.get("owners", {}).items():
+            c = interface.IOwnable(self.reconciler.resolve(name))
+            owner = self.call(c, "owner")
+            expected = self.reconciler.resolve(role)
+            self._add(
+                name,
+                c.address,
+                "owner",
+                expected,
+                owner,
+                lambda c=c, e=expected, o=owner: (
+                    o,
+                    c.address,
+                    c.transferOwnership.encode_input(e),
+                ),
+            )
+
+    def governance(self):
+        for name, role in self.reconciler.spec.get("governance", {}).items():
+            r = Rentable.at(self.reconciler.resolve(name))
+            governance = self.call(r, "getGovernance")
+            expected = self.reconciler.resolve(role)
+            self._add(
+                name,
+                r.address,
+                "governance",
+                expected,
+                governance,
+                lambda r=r, e=expected, g=governance: (
+                    g,
+                    r.address,
+                    r.setGovernance.encode_input(e),
+                ),
+            )
+
+    def rentable(self):
+        """Operator, fee collector, wallet factory, fee and payment allowlist."""
+        resolve = self.reconciler.resolve
+        spec = self.reconciler.spec
+        r = Rentable.at(resolve("Rentable"))
+        governance = self.call(r, "getGovernance")
+
+        def add(name, expected, view, setter, *args):
+            self._add(
+                "Rentable",
+                r.address,
+                name,
+                expected,
+                self.call(r, view, *args),
+                lambda: (
+                    governance,
+                    r.address,
+                    getattr(r, setter).encode_input(*args, expected),
+                ),
+            )
+
+        settings = spec.get("rentable", {})
+        for key, view, setter in [
+            ("operator", "getOperator", "setOperator"),
+            ("feeCollector", "getFeeCollector", "setFeeCollector"),
+            ("walletFactory", "getWalletFactory", "setWalletFactory"),
+        ]:
+            if key in settings:
+                add(key, resolve(settings[key]), view, setter)
+        if "fee" in settings:
+            add("fee", int(settings["fee"]), "getFee", "setFee")
+
+        adminConfig = spec.get("adminConfig", {})
+        if isinstance(adminConfig, str):
+            with open(adminConfig) as f:
+                adminConfig = json.load(f)
+        for token, statusName in adminConfig.get("paymentTokens", {}).items():
+            token = resolve(token)
+            status = PAYMENT_TOKEN_STATUS[statusName]
+            setter = {
+                PAYMENT_TOKEN_STATUS["ERC20"]: r.enablePaymentToken,
+                PAYMENT_TOKEN_STATUS["ERC1155"]: r.enable1155PaymentToken,
+            }.get(status, r.disablePaymentToken)
+            self._add(
+                "Rentable",
+                r.address,
+                f"paymentToken {token}",
+                status,
+                self.call(r, "getPaymentTokenAllowlist", token),
+                lambda s=setter, t=token: (governance, r.address, s.encode_input(t)),
+            )
+
+    # ---------- report ----------
+
+    def fixPlan(self, failed, values):
+        """Fix transactions grouped by sender, Rentable admin calls of a sender
+        batched in one Rentable.multicall."""
+        rentable = Rentable.at(self.reconciler.resolve("Rentable"))
+        bySender = {}
+        for check in failed:
+            if check.fix is None:
+                continue
+            senderKey, to, data = check.fix()
+            sender = values[senderKey]
+            bySender.setdefault(sender, []).append(
+                (f"{check.contract}.{check.name}", to, data)
+            )
+
+        plan = []
+        for sender, txs in bySender.items():
+            batched = [t for t in txs if t[1] == rentable.address]
+            if len(batched) > 1:
+                txs = [t for t in txs if t[1] != rentable.address] + [
+                    (
+                        ", ".join(d for d, _, _ in batched),
+                        rentable.address,
+                        rentable.multicall.encode_input([t[2] for t in batched]),
+                    )
+                ]
+            plan += [
+                {"sender": sender, "description": d, "to": to, "data": data}
+                for d, to, data in txs
+            ]
+        return plan
+
+    def run(self):
+        for section in [self.contracts, self.owners, self.governance, self.rentable]:
+            section()
+
+        values = self._readAll()
+        results = []
+        failed = []
+        for check in self.checks:
+            actual = values[check.read]
+            ok = actual == check.expected
+            if not ok:
+                failed.append(check)
+            results.append(
+                {
+                    "contract": check.contract,
+                    "address": check.address,
+                    "check": check.name,
+                    "expected": check.expected,
+                    "actual": actual,
+                    "ok": ok,
+                }
+            )
+
+        return {
+            "version": REPORT_VERSION,
+            "block": self.block,
+            "blockHash": web3.eth.get_block(self.block).hash.hex(),
+            "checks": results,
+            "mismatches": len(failed),
+            "fixPlan": self.fixPlan(failed, values),
+        }
+
+
+def parseBlocks(blocks):
+    """latest, a block number or fromBlock:toBlock:step"""
+    if blocks == "latest":
+        return [web3.eth.block_number]
+    if ":" in blocks:
+        fromBlock, toBlock, step = (int(b) for b in blocks.split(":"))
+        return list(range(fromBlock, toBlock + 1, step))
+    return [int(blocks)]
+
+
+def main(
+    spec="fixtures/deployment-spec.json",
+    deploymentFile="deployments/ethereum-mainnet.json",
+    output="roles-audit.json",
+    blocks="latest",
+    failOnMismatch="true",
+):
+    """Audit roles at every block of `blocks`, writing one report per block,
+    e.g. in CI against a fork: brownie run roles_audit --network mainnet-fork"""
+    with open(spec) as f:
+        desired = json.load(f)
+    reconciler = Reconciler(desired, deploymentFile, None, execute=False)
+
+    start = time.time()
+    reports = [RolesAudit(reconciler, block).run() for block in parseBlocks(blocks)]
+    elapsed = time.time() - start
+
+    with open(output, "w") as f:
+        json.dump(reports, f, indent=2)
+
+    for report in reports:
+        click.echo(f"        ---- Block {report['block']} ----")
+        for check in report["checks"]:
+            if not check["ok"]:
+                click.echo(
+                    f"    {check['contract']}.{check['check']}: "
+                    f"{check['actual']} != {check['expected']}"
+                )
+
+    last = reports[-1]
+    click.echo(
+        f"""
+            -------- Stats --------
+                Blocks: {len(reports)}
+                Checks: {len(last["checks"])}
+            Mismatches: {sum(r["mismatches"] for r in reports)}
+           Fix Plan Tx: {len(last["fixPlan"])} (block {last["block"]})
+                Report: {output}
+          Elapsed Time: {elapsed:.1f} s
+            -----------------------
+         """
+    )
+
+    if failOnMismatch == "true" and any(r["mismatches"] for r in reports):
+        sys.exit(1)
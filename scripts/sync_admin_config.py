@@ -0,0 +1,183 @@
+import json
+import time
+
+import brownie
+import click
+
+from brownie import accounts, Rentable, web3
+
+from scripts.fees import FeeOracle, FeeReport
+
+address0 = "0x0000000000000000000000000000000000000000"
+
+# see RentableStorageV1 payment token allowlist values
+PAYMENT_TOKEN_STATUS = {"disabled": 0, "ERC20": 1, "ERC1155": 2}
+
+
+def canonicalType(abiInput):
+    """Solidity type as used in function signatures (tuples expanded)."""
+    abiType = abiInput["type"]
+    if abiType.startswith("tuple"):
+        components = ",".join(canonicalType(c) for c in abiInput["components"])
+        return f"({components}){abiType[len('tuple'):]}"
+    return abiType
+
+
+def abiSelectors(abi):
+    """Map function names and full signatures to selectors.
+
+    Overloaded functions are only reachable by full signature."""
+    selectors = {}
+    names = {}
+    for entry in abi:
+        if entry.get("type") != "function":
+            continue
+        types = ",".join(canonicalType(i) for i in entry["inputs"])
+        signature = f"{entry['name']}({types})"
+        selector = web3.keccak(text=signature)[:4].hex()
+        selectors[signature] = selector
+        names.setdefault(entry["name"], []).append(selector)
+    for name, sels in names.items():
+        if len(sels) == 1:
+            selectors[name] = sels[0]
+    return selectors
+
+
+def contractAbi(name):
+    """ABI of a compiled contract or interface of the project."""
+    container = getattr(brownie, name, None) or getattr(brownie.interface, name)
+    return container.abi
+
+
+class AdminConfigDiff:
+    """Compare desired Rentable admin config with on-chain state.
+
+    Every difference becomes an encoded Rentable admin call, ready to be
+    applied atomically via Rentable.multicall."""
+
+    def __init__(self, rentable, deployment):
+        self.rentable = rentable
+        self.deployment = deployment
+        self.changes = []  # (description, encoded call)
+
+    def _resolve(self, value):
+        """Accept either an address or a contract name from the deployment file."""
+        return web3.toChecksumAddress(self.deployment.get(value, value))
+
+    def _add(self, description, call):
+        self.changes.append((description, call))
+
+    def paymentTokens(self, desired):
+        for token, statusName in desired.items():
+            token = self._resolve(token)
+            status = PAYMENT_TOKEN_STATUS[statusName]
+            current = self.rentable.getPaymentTokenAllowlist(token)
+            if current == status:
+                continue
+            if status == PAYMENT_TOKEN_STATUS["ERC20"]:
+                call = self.rentable.enablePaymentToken.encode_input(token)
+            elif status == PAYMENT_TOKEN_STATUS["ERC1155"]:
+                call = self.rentable.enable1155PaymentToken.encode_input(token)
+            else:
+                call = self.rentable.disablePaymentToken.encode_input(token)
+            self._add(f"paymentToken {token}: {current} -> {status}", call)
+
+    def paymentTokenAccrual(self, desired):
+        for token, enabled in desired.items():
+            token = self._resolve(token)
+            current = self.rentable.isPaymentTokenAccrual(token)
+            if current == enabled:
+                continue
+            self._add(
+                f"accrual {token}: {current} -> {enabled}",
+                self.rentable.setPaymentTokenAccrual.encode_input(token, enabled),
+            )
+
+    def libraries(self, desired):
+        for token, library in desired.items():
+            token = self._resolve(token)
+            library = self._resolve(library or address0)
+            current = self.rentable.getLibrary(token)
+            if current == library:
+                continue
+            self._add(
+                f"library {token}: {current} -> {library}",
+                self.rentable.setLibrary.encode_input(token, library),
+            )
+
+    def proxyCalls(self, desired):
+        for entry in desired:
+            caller = self._resolve(entry["caller"])
+            selectors = abiSelectors(contractAbi(entry["contract"]))
+            wanted = {f: True for f in entry.get("enabled", [])}
+            wanted.update({f: False for f in entry.get("disabled", [])})
+            for function, enabled in wanted.items():
+                selector = selectors[function]
+                current = self.rentable.isEnabledProxyCall(caller, selector)
+                if current == enabled:
+                    continue
+                self._add(
+                    f"proxyCall {entry['caller']}.{function} ({selector}): "
+                    f"{current} -> {enabled}",
+                    self.rentable.enableProxyCall.encode_input(
+                        caller, selector, enabled
+                    ),
+                )
+
+    def load(self, config):
+        self.paymentTokens(config.get("paymentTokens", {}))
+        self.paymentTokenAccrual(config.get("paymentTokenAccrual", {}))
+        self.libraries(config.get("libraries", {}))
+        self.proxyCalls(config.get("proxyCalls", []))
+        return self
+
+
+def main(
+    config="fixtures/rentable-config.json",
+    deploymentFile="deployments/ethereum-mainnet.json",
+    execute="false",
+    urgency="normal",
+):
+    deployment = json.load(open(deploymentFile))
+    r = Rentable.at(deployment["Rentable"])
+
+    start = time.time()
+    diff = AdminConfigDiff(r, deployment).load(json.load(open(config)))
+
+    if not diff.changes:
+        click.echo("On-chain config is up to date, nothing to do")
+        return
+
+    click.echo("        ---- Changes ----")
+    for description, _ in diff.changes:
+        click.echo(f"    {description}")
+
+    calls = [call for _, call in diff.changes]
+
+    if execute.lower() != "true":
+        # governance is a multisig, submit it from there
+        click.echo(
+            f"""
+        ---- Governance Tx ----
+           To: {r.address}
+         Data: {r.multicall.encode_input(calls)}
+        -----------------------
+    """
+        )
+        return
+
+    dev = accounts.load("rentable-deployer")
+    tx = r.multicall(calls, {"from": dev, **FeeOracle(urgency).fees()})
+
+    click.echo(
+        f"""
+            -------- Stats --------
+               Changes: {len(calls)}
+          Elapsed Time: {time.time() - start:.1f} s
+            -----------------------
+         """
+    )
+
+    paid = FeeReport()
+    paid.addReceipt(web3.eth.get_transaction_receipt(tx.txid))
+    paid.echo()
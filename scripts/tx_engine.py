@@ -0,0 +1,231 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from brownie import web3
+from web3.exceptions import TransactionNotFound
+
+from scripts.fees import FeeOracle, FeeReport, formatFees
+
+
+class PendingTx:
+    """A transaction submitted by TxEngine, possibly replaced several times."""
+
+    def __init__(self, label, nonce, receipt, broadcast, fees, blockNumber):
+        self.label = label
+        self.nonce = nonce
+        self.receipts = [receipt]  # original first, then replacements
+        self.broadcast = broadcast
+        self.fees = fees  # of the last broadcast
+        self.sentAt = time.time()
+        self.lastSentBlock = blockNumber
+
+        self.done = False
+        self.status = None  # 1 success, 0 reverted, None pending or failed
+        self.error = None
+        self.gasUsed = 0
+        self.gasPrice = 0
+        self.blockNumber = None
+        self.latency = None
+        self.contractAddress = None
+
+    @property
+    def txid(self):
+        return self.receipts[-1].txid
+
+    @property
+    def replacements(self):
+        return len(self.receipts) - 1
+
+
+class TxEngine:
+    """Submit many transactions back to back from one account.
+
+    Nonces are assigned locally and transactions are broadcast without
+    waiting for receipts (required_confs=0), fees coming from `fees`
+    (FeeOracle). Receipts are polled concurrently by wait(); transactions
+    neither mined nor replaced after replaceAfterBlocks blocks (underpriced
+    or dropped from the mempool) are re-sent with the same nonce, the current
+    fees but at least gasBump times the previous ones."""
+
+    def __init__(
+        self,
+        account,
+        fees=None,
+        replaceAfterBlocks=3,
+        gasBump=1.125,
+        maxReplacements=3,
+        timeout=900,
+        pollInterval=2,
+        pollWorkers=8,
+    ):
+        self.account = account
+        self.fees = fees or FeeOracle()
+        self.replaceAfterBlocks = replaceAfterBlocks
+        self.gasBump = gasBump
+        self.maxReplacements = maxReplacements
+        self.timeout = timeout
+        self.pollInterval = pollInterval
+        self.pool = ThreadPoolExecutor(pollWorkers)
+
+        self.nonce = self._pendingNonce()
+        self.blockNumber = web3.eth.block_number
+        self.txs = []
+        self.start = time.time()
+
+    def _pendingNonce(self):
+        return web3.eth.get_transaction_count(self.account.address, "pending")
+
+    # ---------- submit ----------
+
+    def _params(self, nonce, fees, gasLimit):
+        params = {
+            "from": self.account,
+            "nonce": nonce,
+            "required_confs": 0,
+            "silent": True,
+            **fees,
+        }
+        if gasLimit is not None:
+            params["gas_limit"] = gasLimit
+        return params
+
+    def _send(self, label, broadcast, gasLimit):
+        fees = self.fees.fees(self.blockNumber)
+
+        def send(nonce, fees):
+            return broadcast(self._params(nonce, fees, gasLimit))
+
+        try:
+            receipt = send(self.nonce, fees)
+        except ValueError as e:
+            if "nonce too low" not in str(e):
+                raise
+            # someone else used the account, resync and retry once
+            self.nonce = self._pendingNonce()
+            receipt = send(self.nonce, fees)
+
+        tx = PendingTx(label, self.nonce, receipt, send, fees, self.blockNumber)
+        self.nonce += 1
+        self.txs.append(tx)
+        return tx
+
+    def transact(self, method, *args, label=None, value=0, gasLimit=None):
+        """Broadcast a contract call, e.g. transact(r.setFee, 100)."""
+
+        def broadcast(params):
+            if value:
+                params["value"] = value
+            return method(*args, params)
+
+        return self._send(label or method._name, broadcast, gasLimit)
+
+    def transfer(self, to, amount, label=None):
+        """Broadcast an Ether transfer."""
+
+        def broadcast(params):
+            del params["from"]
+            return self.account.transfer(to, amount, **params)
+
+        return self._send(label or "transfer", broadcast, None)
+
+    def deploy(self, container, *args, label=None, gasLimit=None):
+        """Broadcast a contract deployment, address available after wait()."""
+
+        def broadcast(params):
+            deployed = container.deploy(*args, params)
+            # brownie returns the contract when already mined (automine nodes)
+            return getattr(deployed, "tx", deployed)
+
+        return self._send(label or container._name, broadcast, gasLimit)
+
+    # ---------- confirm ----------
+
+    def _receipt(self, tx):
+        for receipt in reversed(tx.receipts):
+            try:
+                return web3.eth.get_transaction_receipt(receipt.txid)
+            except TransactionNotFound:
+                continue
+        return None
+
+    def _replace(self, tx):
+        fees = self.fees.bump(tx.fees, self.gasBump, self.blockNumber)
+        try:
+            tx.receipts.append(tx.broadcast(tx.nonce, fees))
+            tx.fees = fees
+            tx.lastSentBlock = self.blockNumber
+        except ValueError:
+            # already mined (nonce too low) or still underpriced, next poll decides
+            pass
+
+    def _poll(self, tx):
+        receipt = self._receipt(tx)
+        now = time.time()
+
+        if receipt is not None:
+            tx.done = True
+            tx.status = receipt["status"]
+            tx.gasUsed = receipt["gasUsed"]
+            tx.gasPrice = receipt.get("effectiveGasPrice", 0)
+            tx.blockNumber = receipt["blockNumber"]
+            tx.contractAddress = receipt["contractAddress"]
+            tx.latency = now - tx.sentAt
+            if tx.status != 1:
+                tx.error = "reverted"
+        elif now - tx.sentAt > self.timeout:
+            tx.done = True
+            tx.error = "timeout"
+        elif self.blockNumber - tx.lastSentBlock >= self.replaceAfterBlocks:
+            if tx.replacements < self.maxReplacements:
+                self._replace(tx)
+
+    def wait(self):
+        """Block until every submitted transaction is mined or failed."""
+        pending = [tx for tx in self.txs if not tx.done]
+        while pending:
+            self.blockNumber = web3.eth.block_number
+            list(self.pool.map(self._poll, pending))
+            pending = [tx for tx in pending if not tx.done]
+            if pending:
+                time.sleep(self.pollInterval)
+
+        return [tx for tx in self.txs if tx.error is not None]
+
+    # ---------- stats ----------
+
+    def report(self):
+        done = [tx for tx in self.txs if tx.done]
+        failed = [tx for tx in done if tx.error is not None]
+        latencies = sorted(tx.latency for tx in done if tx.latency is not None)
+
+        click.echo("        ---- Transactions ----")
+        for tx in self.txs:
+            latency = f"{tx.latency:.1f} s" if tx.latency is not None else "-"
+            click.echo(
+                f"    #{tx.nonce} {tx.label}: {tx.error or 'ok'}, "
+                f"{latency}, {tx.gasUsed} gas, {tx.replacements} replacements"
+            )
+
+        click.echo(
+            f"""
+            -------- Stats --------
+             Submitted: {len(self.txs)}
+             Confirmed: {len(done) - len(failed)}
+                Failed: {len(failed)}
+          Replacements: {sum(tx.replacements for tx in self.txs)}
+              TotalGas: {sum(tx.gasUsed for tx in self.txs)}
+          Current Fees: {formatFees(self.fees.fees(self.blockNumber))}
+        Median Latency: {latencies[len(latencies) // 2] if latencies else 0:.1f} s
+           Max Latency: {latencies[-1] if latencies else 0:.1f} s
+          Elapsed Time: {time.time() - self.start:.1f} s
+            -----------------------
+         """
+        )
+
+        paid = FeeReport()
+        for tx in done:
+            if tx.blockNumber is not None:
+                paid.add(tx.gasUsed, tx.gasPrice, tx.blockNumber)
+        paid.echo()
@@ -0,0 +1,116 @@
+import sqlite3
+import sys
+
+import click
+
+from eth_utils import keccak, to_canonical_address, to_checksum_address
+
+# EIP-1167 minimal proxy init code around the implementation address,
+# as deployed by OpenZeppelin Clones (see DeterministicWalletFactory)
+CLONE_PREFIX = bytes.fromhex("3d602d80600a3d3981f3363d3d373d3d3d363d73")
+CLONE_SUFFIX = bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+
+
+def forwarderAddress(factoryAddress):
+    """WalletBeaconForwarder deployed by the factory constructor (CREATE, nonce 1)."""
+    # rlp([factory, 1])
+    rlp = b"\xd6\x94" + to_canonical_address(factoryAddress) + b"\x01"
+    return to_checksum_address(keccak(rlp)[12:])
+
+
+def walletSalt(ownerAddress, userAddress):
+    # keccak256(abi.encode(owner, user))
+    return keccak(
+        to_canonical_address(ownerAddress).rjust(32, b"\0")
+        + to_canonical_address(userAddress).rjust(32, b"\0")
+    )
+
+
+class WalletPredictor:
+    """Compute DeterministicWalletFactory wallet addresses offline.
+
+    Mirrors DeterministicWalletFactory.predictWallet: CREATE2 by the factory,
+    salt keccak256(abi.encode(owner, user)), EIP-1167 clone of the forwarder.
+    Rentable keeps the wallet a user already has, e.g. created by the previous
+    WalletFactory: those are given as knownWallets (user => wallet) and
+    returned as-is."""
+
+    def __init__(self, factoryAddress, ownerAddress, forwarder=None, knownWallets=None):
+        self.owner = ownerAddress
+        self.knownWallets = {
+            to_checksum_address(u): to_checksum_address(w)
+            for u, w in (knownWallets or {}).items()
+        }
+        forwarder = forwarder or forwarderAddress(factoryAddress)
+        initCodeHash = keccak(
+            CLONE_PREFIX + to_canonical_address(forwarder) + CLONE_SUFFIX
+        )
+        # constant parts of the CREATE2 preimage
+        self.prefix = b"\xff" + to_canonical_address(factoryAddress)
+        self.initCodeHash = initCodeHash
+
+    def predict(self, userAddress):
+        digest = keccak(
+            self.prefix + walletSalt(self.owner, userAddress) + self.initCodeHash
+        )
+        return to_checksum_address(digest[12:])
+
+    def wallet(self, userAddress):
+        """Existing wallet of the user, predicted one otw."""
+        user = to_checksum_address(userAddress)
+        return self.knownWallets.get(user) or self.predict(user)
+
+    def predictMany(self, userAddresses):
+        """Map every user to its wallet address."""
+        return {to_checksum_address(u): self.wallet(u) for u in userAddresses}
+
+
+def predictWallet(factoryAddress, ownerAddress, userAddress):
+    return WalletPredictor(factoryAddress, ownerAddress).predict(userAddress)
+
+
+def loadKnownWallets(dbPath):
+    """Wallets already created (WalletCreated events) from an indexer database,
+    see scripts/indexer.py."""
+    db = sqlite3.connect(dbPath)
+    try:
+        return dict(db.execute("SELECT user, wallet FROM wallets").fetchall())
+    finally:
+        db.close()
+
+
+def main(
+    factoryAddress,
+    rentableAddress="0xd766a11858c57252cC4F9978282B616C3e0bBAC4",
+    users="-",
+    verify="false",
+    walletsDb="",
+):
+    """Print user,wallet pairs for users in a file (one address per line, - for stdin).
+    Users with a wallet in the indexer database walletsDb keep it."""
+    file = sys.stdin if users == "-" else open(users)
+    userAddresses = [line.strip() for line in file if line.strip()]
+    if file is not sys.stdin:
+        file.close()
+
+    knownWallets = loadKnownWallets(walletsDb) if walletsDb else {}
+    predictor = WalletPredictor(
+        factoryAddress, rentableAddress, knownWallets=knownWallets
+    )
+    wallets = predictor.predictMany(userAddresses)
+
+    if verify.lower() == "true":
+        # spot check against the deployed factory
+        from brownie import DeterministicWalletFactory
+
+        factory = DeterministicWalletFactory.at(factoryAddress)
+        predicted = [u for u in wallets if u not in predictor.knownWallets]
+        for user in predicted[:10]:
+            assert factory.predictWallet(rentableAddress, user) == wallets[user]
+
+    for user, wallet in wallets.items():
+        click.echo(f"{user},{wallet}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
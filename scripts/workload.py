@@ -0,0 +1,638 @@
+import ast
+import importlib
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+import click
+
+from brownie import accounts, chain, history, network, project, web3
+from brownie._config import CONFIG
+from brownie.exceptions import VirtualMachineError
+
+from scripts.fill_marketplace import encodeRentalConditions
+
+WORKLOAD_VERSION = 1
+
+eth = "0x0000000000000000000000000000000000000000"
+
+# stands for the indexed collections, remapped to TestNFT ids on replay
+PLACEHOLDER_NFT = web3.toChecksumAddress("0x" + "7e57" * 10)
+
+GAS_LIMIT = 10_000_000
+FUNDING = 10 * 10**18  # gas money of every replayed sender, on top of its values
+BASE_PORT = 8600
+
+# deploy_testnet.deploy signature replay relies on, in every build
+DEPLOY_ARGS = ["engine", "governance", "operator", "feeCollector"]
+
+
+# ---------- workload ----------
+#
+# {
+#   "version": 1,
+#   "source": "chain" | "index",
+#   "accounts": ["0x..."],                   # captured senders, 0 is the keeper
+#   "contracts": {"Rentable": "0x...", ...}, # captured stack (deploy_testnet names)
+#   "calls": [
+#     {
+#       "sender": 3,                         # index in accounts
+#       "to": "Rentable",
+#       "value": 0,
+#       "data": "0x...",
+#       "time": 3600,                        # seconds since the first call
+#       "label": "Rentable.rent",
+#       "keys": ["account:3", "token:12"]    # state the call depends on
+#     }
+#   ]
+# }
+#
+# Captured addresses are replaced in `data` by the ones of the replayed stack
+# and senders, so a workload replays on any fresh chain.
+
+
+def saveWorkload(path, workload):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(workload, f, indent=2)
+    os.replace(tmp, path)
+
+
+def loadWorkload(path):
+    with open(path) as f:
+        workload = json.load(f)
+    assert workload.get("version") == WORKLOAD_VERSION, f"Unknown workload {path}"
+    return workload
+
+
+def callKeys(sender, args):
+    """Accounts and tokens a call depends on, the keeper only settles tokens
+    (e.g. expireRentals) so its own calls are not linked together."""
+    keys = [] if sender == 0 else [f"account:{sender}"]
+    for name in ("tokenId", "tokenIds"):
+        if name in args:
+            ids = args[name] if isinstance(args[name], (list, tuple)) else [args[name]]
+            keys += [f"token:{i}" for i in ids]
+    return keys
+
+
+class Senders:
+    """Captured address => sender index, the keeper being the first one."""
+
+    def __init__(self, keeper):
+        self.addresses = [keeper]
+
+    def __call__(self, address):
+        address = web3.toChecksumAddress(address)
+        if address not in self.addresses:
+            self.addresses.append(address)
+        return self.addresses.index(address)
+
+
+def captureChain(stack, keeper, fromBlock, toBlock=None):
+    """Workload of every transaction sent to the stack between two blocks of
+    a local run, e.g. load_test. Transactions to other addresses (funding)
+    are left out, replay funds the senders itself."""
+    if toBlock is None:
+        toBlock = chain.height
+    byAddress = {c.address: name for name, c in stack.items()}
+    decoders = {name: web3.eth.contract(abi=c.abi) for name, c in stack.items()}
+    senders = Senders(keeper.address)
+
+    calls = []
+    start = None
+    for blockNumber in range(fromBlock, toBlock + 1):
+        block = web3.eth.get_block(blockNumber, full_transactions=True)
+        for tx in block.transactions:
+            name = byAddress.get(tx["to"])
+            if name is None:
+                continue
+            if start is None:
+                start = block.timestamp
+            sender = senders(tx["from"])
+            fn, args = decoders[name].decode_function_input(tx["input"])
+            calls.append(
+                {
+                    "sender": sender,
+                    "to": name,
+                    "value": tx["value"],
+                    "data": tx["input"],
+                    "time": block.timestamp - start,
+                    "label": f"{name}.{fn.fn_name}",
+                    "keys": callKeys(sender, args),
+                }
+            )
+
+    return {
+        "version": WORKLOAD_VERSION,
+        "source": "chain",
+        "accounts": senders.addresses,
+        "contracts": {name: c.address for name, c in stack.items()},
+        "calls": calls,
+    }
+
+
+def buildFromIndex(dbPath, keeper=None):
+    """Workload rebuilt from the events of an indexer database (see indexer).
+
+    Indexed tokens become TestNFT ids minted to their first depositor, payments
+    are replayed in ETH at the listed price and rent durations come from the
+    block timestamps of the connected network."""
+    # containers are only importable from a brownie run
+    from brownie import Rentable, TestNFT
+
+    db = sqlite3.connect(dbPath)
+    db.row_factory = sqlite3.Row
+    checkpoint = db.execute("SELECT * FROM checkpoint WHERE id = 0").fetchone()
+    assert checkpoint is not None, f"{dbPath} is empty"
+
+    rentable = web3.eth.contract(abi=Rentable.abi)
+    nft = web3.eth.contract(abi=TestNFT.abi)
+    senders = Senders(keeper or accounts[0].address)
+
+    timestamps = {}
+
+    def timestamp(block):
+        if block not in timestamps:
+            timestamps[block] = web3.eth.get_block(block).timestamp
+        return timestamps[block]
+
+    tokens = {}  # (tokenAddress, tokenId) => {id, depositor, price}
+    mints = {}  # depositor => [TestNFT id]
+    calls = []
+    start = None
+    lastDeposit = None  # (txHash, call) merged with its listing
+
+    rows = db.execute("SELECT * FROM events ORDER BY block, logIndex").fetchall()
+    for row in rows:
+        name, args = row["event"], json.loads(row["args"])
+        if name not in (
+            "Deposit",
+            "UpdateRentalConditions",
+            "Rent",
+            "RentalExtended",
+            "Withdraw",
+        ):
+            continue
+        if start is None:
+            start = timestamp(row["block"])
+
+        key = (row["tokenAddress"], row["tokenId"])
+        if key not in tokens:
+            tokens[key] = {
+                "id": len(tokens) + 1,
+                "depositor": None,
+                "price": 0,
+                "minted": False,
+            }
+        token = tokens[key]
+
+        if name == "Deposit":
+            token["depositor"] = senders(args["who"])
+            if not token["minted"]:
+                mints.setdefault(token["depositor"], []).append(token["id"])
+                token["minted"] = True
+            sender = token["depositor"]
+            fn = "safeTransferFrom"
+            to, value = "TestNFT", 0
+            data = nft.encodeABI(
+                fn_name=fn, args=[args["who"], checkpoint["rentable"], token["id"]]
+            )
+        elif name == "UpdateRentalConditions":
+            token["price"] = int(args["pricePerSecond"])
+            privateRenter = args["privateRenter"]
+            if privateRenter != eth:
+                senders(privateRenter)
+            conditions = (
+                int(args["minTimeDuration"]),
+                int(args["maxTimeDuration"]),
+                token["price"],
+                0,
+                eth,
+                privateRenter,
+            )
+            if lastDeposit is not None and lastDeposit[0] == row["txHash"]:
+                # deposit and list in a single safeTransferFrom
+                call = lastDeposit[1]
+                call["data"] = nft.encodeABI(
+                    fn_name="safeTransferFrom",
+                    args=[
+                        senders.addresses[call["sender"]],
+                        checkpoint["rentable"],
+                        token["id"],
+                        encodeRentalConditions(*conditions),
+                    ],
+                )
+                continue
+            sender = token["depositor"]
+            fn = "createOrUpdateRentalConditions"
+            to, value = "Rentable", 0
+            data = rentable.encodeABI(
+                fn_name=fn, args=[PLACEHOLDER_NFT, token["id"], conditions]
+            )
+        elif name == "Rent":
+            sender = senders(args["to"])
+            duration = int(args["expiresAt"]) - timestamp(row["block"])
+            fn = "rent"
+            to, value = "Rentable", duration * token["price"]
+            data = rentable.encodeABI(
+                fn_name=fn, args=[PLACEHOLDER_NFT, token["id"], duration]
+            )
+        elif name == "RentalExtended":
+            sender = senders(args["to"])
+            extraDuration = int(args["extraDuration"])
+            fn = "extendRental"
+            to, value = "Rentable", extraDuration * token["price"]
+            data = rentable.encodeABI(
+                fn_name=fn, args=[PLACEHOLDER_NFT, token["id"], extraDuration]
+            )
+        else:
+            sender = token["depositor"]
+            fn = "withdraw"
+            to, value = "Rentable", 0
+            data = rentable.encodeABI(fn_name=fn, args=[PLACEHOLDER_NFT, token["id"]])
+
+        if sender is None:
+            # deposited before the indexed range
+            continue
+        call = {
+            "sender": sender,
+            "to": to,
+            "value": value,
+            "data": data,
+            "time": timestamp(row["block"]) - start,
+            "label": f"{to}.{fn}",
+            "keys": callKeys(sender, {"tokenId": token["id"]}),
+        }
+        calls.append(call)
+        lastDeposit = (row["txHash"], call) if name == "Deposit" else None
+
+    setup = []
+    for depositor, ids in mints.items():
+        owner = senders.addresses[depositor]
+        setup.append(
+            {
+                "sender": 0,
+                "to": "TestNFT",
+                "value": 0,
+                "data": nft.encodeABI(
+                    fn_name="mintBatch",
+                    args=[[owner] * len(ids), ids, [""] * len(ids)],
+                ),
+                "time": 0,
+                "label": "TestNFT.mintBatch",
+                "keys": callKeys(0, {"tokenIds": ids}),
+            }
+        )
+
+    return {
+        "version": WORKLOAD_VERSION,
+        "source": "index",
+        "accounts": senders.addresses,
+        "contracts": {"Rentable": checkpoint["rentable"], "TestNFT": PLACEHOLDER_NFT},
+        "calls": setup + calls,
+    }
+
+
+# ---------- replay ----------
+
+
+def shard(calls, workers):
+    """Split the calls in up to `workers` groups of call indices with no key
+    in common, so each group replays on its own chain like on a shared one."""
+    parent = {}
+
+    def find(key):
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    for i, call in enumerate(calls):
+        root = find(f"call:{i}")
+        for key in call["keys"]:
+            parent[find(key)] = root
+
+    groups = {}
+    for i in range(len(calls)):
+        groups.setdefault(find(f"call:{i}"), []).append(i)
+
+    shards = [[] for _ in range(workers)]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(shards, key=len).extend(group)
+    return [sorted(s) for s in shards if s]
+
+
+def _send(sender, to, call, addresses):
+    data = call["data"].lower()
+    for captured, replayed in addresses.items():
+        data = data.replace(captured, replayed)
+    try:
+        tx = sender.transfer(
+            to,
+            call["value"],
+            data=data,
+            gas_limit=GAS_LIMIT,
+            allow_revert=True,
+            silent=True,
+        )
+    except VirtualMachineError as e:
+        tx = history[-1]
+        assert tx.status == 0, "Transaction not sent"
+        return {
+            "status": 0,
+            "gasUsed": tx.gas_used,
+            "revert": e.revert_msg or "unknown",
+        }
+    return {"status": 1, "gasUsed": tx.gas_used, "revert": None}
+
+
+def replay(projectPath, workloadPath, shardPath, port, output):
+    """Replay worker: deploy the stack of `projectPath` on a fresh local chain
+    listening on `port` and send the calls of a shard in order, moving chain
+    time forward like the capture."""
+    p = project.load(projectPath)
+    p.load_config()
+    cmdSettings = CONFIG.networks["development"]["cmd_settings"]
+    cmdSettings["port"] = int(port)
+    cmdSettings["default_balance"] = "1000000 ether"
+    network.connect("development")
+
+    # the stack is deployed by the scripts of the build, not the running ones,
+    # containers are importable once the project is loaded
+    for name in [m for m in sys.modules if m.split(".")[0] == "scripts"]:
+        del sys.modules[name]
+    sys.path.insert(0, projectPath)
+    deploy = importlib.import_module("scripts.deploy_testnet").deploy
+    TxEngine = importlib.import_module("scripts.tx_engine").TxEngine
+
+    workload = loadWorkload(workloadPath)
+    with open(shardPath) as f:
+        indices = json.load(f)
+    calls = [workload["calls"][i] for i in indices]
+
+    keeper = accounts[0]
+    stack = deploy(TxEngine(keeper), keeper, keeper, keeper)
+    missing = {c["to"] for c in calls} - set(stack)
+    if missing:
+        raise ValueError(f"{projectPath} does not deploy {', '.join(missing)}")
+
+    senders = {0: keeper}
+    values = {}
+    for call in calls:
+        if call["sender"] not in senders:
+            senders[call["sender"]] = accounts.add()
+        values[call["sender"]] = values.get(call["sender"], 0) + call["value"]
+    for sender, account in senders.items():
+        if sender != 0:
+            keeper.transfer(account, values[sender] + FUNDING, silent=True)
+
+    addresses = {}
+    for name, address in workload["contracts"].items():
+        if name in stack:
+            addresses[address.lower()[2:]] = stack[name].address.lower()[2:]
+    for sender, account in senders.items():
+        captured = workload["accounts"][sender]
+        addresses[captured.lower()[2:]] = account.address.lower()[2:]
+
+    start = chain.time()
+    results = []
+    for i, call in zip(indices, calls):
+        at = start + call["time"]
+        if chain.time() < at:
+            chain.sleep(at - chain.time())
+        result = _send(senders[call["sender"]], stack[call["to"]], call, addresses)
+        results.append({"index": i, **result})
+
+    with open(output, "w") as f:
+        json.dump(results, f)
+    network.disconnect()
+
+
+def revParse(ref):
+    if ref == ".":
+        return "working-tree"
+    return subprocess.check_output(
+        ["git", "rev-parse", "--short", ref], text=True
+    ).strip()
+
+
+def checkBuild(path):
+    """Replay deploys a build with its own deploy_testnet, which must have
+    the deploy(engine, ...) of the current one, and a TxEngine."""
+    scripts = os.path.join(path, "scripts")
+    deploy = None
+    if os.path.exists(os.path.join(scripts, "deploy_testnet.py")):
+        with open(os.path.join(scripts, "deploy_testnet.py")) as f:
+            tree = ast.parse(f.read())
+        deploy = next(
+            (
+                node
+                for node in tree.body
+                if isinstance(node, ast.FunctionDef) and node.name == "deploy"
+            ),
+            None,
+        )
+    if (
+        deploy is None
+        or [a.arg for a in deploy.args.args] != DEPLOY_ARGS
+        or not os.path.exists(os.path.join(scripts, "tx_engine.py"))
+    ):
+        raise ValueError(
+            f"{path} cannot be replayed, it needs scripts/tx_engine.py and "
+            f"deploy_testnet.deploy({', '.join(DEPLOY_ARGS)})"
+        )
+
+
+def prepareBuild(ref, buildDir):
+    """Compiled checkout of a git ref, "." being the working tree."""
+    if ref == ".":
+        path = os.getcwd()
+    else:
+        path = os.path.abspath(os.path.join(buildDir, revParse(ref)))
+        if not os.path.exists(path):
+            subprocess.run(
+                ["git", "worktree", "add", "--detach", path, ref], check=True
+            )
+            subprocess.run(
+                ["git", "submodule", "update", "--init", "--recursive"],
+                cwd=path,
+                check=True,
+            )
+    checkBuild(path)
+    # compiled once here, replay workers only load the build
+    subprocess.run(["brownie", "compile"], cwd=path, check=True)
+    return path
+
+
+def replayBuilds(workloadPath, builds, shards, buildDir):
+    """Replay every shard against every build, one process (and chain) each.
+    Returns {build: {call index: result}}."""
+    processes = []
+    for name, path in builds.items():
+        for i, indices in enumerate(shards):
+            shardPath = os.path.join(buildDir, f"{name}-{i}.json")
+            output = os.path.join(buildDir, f"{name}-{i}.results.json")
+            with open(shardPath, "w") as f:
+                json.dump(indices, f)
+            port = BASE_PORT + len(processes)
+            command = [
+                sys.executable,
+                "-m",
+                "scripts.workload",
+                "replay",
+                path,
+                workloadPath,
+                shardPath,
+                str(port),
+                output,
+            ]
+            processes.append((name, output, subprocess.Popen(command)))
+
+    results = {name: {} for name in builds}
+    for name, output, process in processes:
+        if process.wait() != 0:
+            raise RuntimeError(f"Replay of {output} failed")
+        with open(output) as f:
+            results[name].update((r["index"], r) for r in json.load(f))
+    return results
+
+
+def compareBuilds(calls, base, head, gasPrice):
+    """Per function gas of both builds, calls reverting differently and
+    total cost at gasPrice (wei)."""
+    functions = {}
+    reverts = []
+    total = {"base": 0, "head": 0}
+    for i, call in enumerate(calls):
+        before, after = base[i], head[i]
+        if (before["status"], before["revert"]) != (after["status"], after["revert"]):
+            reverts.append(
+                {
+                    "index": i,
+                    "label": call["label"],
+                    "base": before["revert"],
+                    "head": after["revert"],
+                }
+            )
+        function = functions.setdefault(
+            call["label"], {"function": call["label"], "calls": 0, "base": 0, "head": 0}
+        )
+        function["calls"] += 1
+        function["base"] += before["gasUsed"]
+        function["head"] += after["gasUsed"]
+        total["base"] += before["gasUsed"]
+        total["head"] += after["gasUsed"]
+
+    rows = []
+    for function in sorted(functions.values(), key=lambda f: f["function"]):
+        n = function["calls"]
+        rows.append(
+            {
+                **function,
+                "baseMean": function["base"] // n,
+                "headMean": function["head"] // n,
+                "delta": (function["head"] - function["base"]) // n,
+                "change": round(
+                    (function["head"] - function["base"]) * 100 / function["base"], 2
+                )
+                if function["base"]
+                else None,
+            }
+        )
+
+    for build in ("base", "head"):
+        total[f"{build}Cost"] = total[build] * gasPrice / 1e18
+    return rows, reverts, total
+
+
+def main(
+    workload,
+    base="HEAD",
+    head=".",
+    workers="4",
+    gasPrice="30",
+    output="workload-report.json",
+    buildDir="build/workload",
+):
+    """Run with python -m scripts.workload <workload> [base] [head] [workers]
+    [gasPrice gwei] [output], base and head being git refs ("." the working
+    tree). Each build is deployed by its own deploy_testnet, builds without a
+    compatible one are rejected before compiling."""
+    start = time.time()
+    os.makedirs(buildDir, exist_ok=True)
+    calls = loadWorkload(workload)["calls"]
+
+    builds = {
+        "base": prepareBuild(base, buildDir),
+        "head": prepareBuild(head, buildDir),
+    }
+    shards = shard(calls, int(workers))
+    results = replayBuilds(os.path.abspath(workload), builds, shards, buildDir)
+
+    gasPrice = int(float(gasPrice) * 10**9)
+    rows, reverts, total = compareBuilds(
+        calls, results["base"], results["head"], gasPrice
+    )
+
+    report = {
+        "workload": workload,
+        "base": revParse(base),
+        "head": revParse(head),
+        "gasPrice": gasPrice,
+        "shards": len(shards),
+        "functions": rows,
+        "reverts": reverts,
+        "total": total,
+    }
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    click.echo(f"        ---- Gas {report['base']} -> {report['head']} ----")
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.2f}%"
+        click.echo(
+            f"    {row['function']} x{row['calls']}: "
+            f"{row['baseMean']} -> {row['headMean']} ({change})"
+        )
+    for revert in reverts:
+        click.echo(
+            f"    #{revert['index']} {revert['label']}: "
+            f"{revert['base'] or 'ok'} -> {revert['head'] or 'ok'}"
+        )
+
+    click.echo(
+        f"""
+            -------- Stats --------
+                 Calls: {len(calls)}
+                Shards: {len(shards)}
+       Revert Changes: {len(reverts)}
+              Base Gas: {total["base"]} ({total["baseCost"]} ETH)
+              Head Gas: {total["head"]} ({total["headCost"]} ETH)
+             Gas Price: {gasPrice / 1e9} gwei
+                Report: {output}
+          Elapsed Time: {time.time() - start:.1f} s
+            -----------------------
+         """
+    )
+
+
+def fromIndex(dbPath="rentable-index.sqlite", output="workload.json"):
+    """Build a workload from an indexer database, e.g.
+    brownie run workload fromIndex rentable-index.sqlite --network mainnet"""
+    workload = buildFromIndex(dbPath)
+    saveWorkload(output, workload)
+    click.echo(
+        f"{len(workload['calls'])} calls from {len(workload['accounts'])} senders: {output}"
+    )
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == "replay":
+        replay(*sys.argv[2:])
+    else:
+        main(*sys.argv[1:])
@@ -0,0 +1,36 @@
+import pytest
+
+from brownie import TestNFT
+
+from scripts.deploy_testnet import deploy
+from scripts.tx_engine import TxEngine
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+def test_engine_deploy_on_automine(accounts):
+    engine = TxEngine(accounts[0], pollInterval=0.1)
+
+    tx = engine.deploy(TestNFT)
+
+    assert not engine.wait()
+    assert tx.contractAddress is not None
+    assert TestNFT.at(tx.contractAddress).symbol() == "TNFT"
+
+
+def test_deploy(accounts):
+    keeper = accounts[0]
+    engine = TxEngine(keeper, pollInterval=0.1)
+
+    stack = deploy(engine, keeper, keeper, keeper)
+
+    r = stack["Rentable"]
+    assert r.getGovernance() == keeper
+    assert r.getORentable(stack["TestNFT"]) == stack["ORentable"]
+    assert r.getWRentable(stack["TestNFT"]) == stack["WRentable"]
+    assert r.getWalletFactory() == stack["WalletFactory"]
+    assert stack["ORentable"].getRentable() == r
+    assert not [tx for tx in engine.txs if tx.error is not None]
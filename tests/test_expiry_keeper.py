@@ -0,0 +1,84 @@
+import pytest
+
+from brownie import RevertOnExpireCollectionLibrary, chain
+
+from scripts.deploy_testnet import deploy
+from scripts.expiry_keeper import EXPIRY_BUCKET_SIZE, ExpiryKeeper, QueueExpiryKeeper
+from scripts.fill_marketplace import encodeRentalConditions
+from scripts.tx_engine import TxEngine
+
+eth = "0x0000000000000000000000000000000000000000"
+
+# settlement of this token always reverts
+FAILING_TOKEN = 13
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture
+def stack(accounts):
+    keeper = accounts[0]
+    stack = deploy(TxEngine(keeper, pollInterval=0.1), keeper, keeper, keeper)
+    library = RevertOnExpireCollectionLibrary.deploy(FAILING_TOKEN, {"from": keeper})
+    stack["Rentable"].setLibrary(stack["TestNFT"], library, {"from": keeper})
+    return stack
+
+
+def rent(stack, tokenId, duration, rentee, renter):
+    nft, r = stack["TestNFT"], stack["Rentable"]
+    nft.mint(rentee, tokenId, {"from": rentee})
+    conditions = encodeRentalConditions(0, 10 * 86400, 1, 0, eth, eth)
+    nft.safeTransferFrom(rentee, r, tokenId, conditions, {"from": rentee})
+    r.rent(nft, tokenId, duration, {"from": renter, "value": duration})
+    return r.expiresAt(nft, tokenId)
+
+
+def test_queue_keeper_stalled_head(stack, accounts):
+    r = stack["Rentable"]
+    keeper = QueueExpiryKeeper(r, accounts[0])
+
+    # both rentals in the next bucket, the failing one due first but queued last
+    chain.sleep(EXPIRY_BUCKET_SIZE - chain.time() % EXPIRY_BUCKET_SIZE + 10)
+    later = rent(stack, 1, EXPIRY_BUCKET_SIZE + 1800, accounts[1], accounts[2])
+    failing = rent(
+        stack, FAILING_TOKEN, EXPIRY_BUCKET_SIZE + 600, accounts[1], accounts[2]
+    )
+    assert failing // EXPIRY_BUCKET_SIZE == later // EXPIRY_BUCKET_SIZE
+
+    chain.sleep(failing + 60 - chain.time())
+    chain.mine()
+
+    # one attempt, not one per block until the other one is due
+    assert keeper.step() == 0
+    assert keeper.txs == 1
+
+    chain.sleep(later + 60 - chain.time())
+    chain.mine()
+
+    assert keeper.step() == 1
+    assert keeper.txs == 2
+    # left to expireRental
+    assert stack["WRentable"].exists(FAILING_TOKEN)
+
+
+@pytest.mark.parametrize("tokenIds", [[1, FAILING_TOKEN, 2], [FAILING_TOKEN, 1, 2]])
+def test_keeper_drops_failing_rental(stack, accounts, tokenIds):
+    r, w = stack["Rentable"], stack["WRentable"]
+    keeper = ExpiryKeeper(r, accounts[0])
+
+    # failing rental inside the batch, or first in the schedule
+    for tokenId in tokenIds:
+        expiresAt = rent(stack, tokenId, 3600, accounts[1], accounts[2])
+    chain.sleep(expiresAt + 60 - chain.time())
+    chain.mine()
+
+    assert keeper.step() == 2
+    assert keeper.dropped == 1
+    assert not w.exists(1) and not w.exists(2)
+    assert w.exists(FAILING_TOKEN)
+
+    # not retried on the next step
+    assert keeper.step() == 0
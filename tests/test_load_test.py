@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+from scripts.load_test import DEFAULT_MIX, main
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+def test_smoke(tmp_path):
+    output = tmp_path / "load-test.json"
+
+    # 1 rentee, 1 renter, 1 token, 1 round
+    main("1", "1", "1", "1", DEFAULT_MIX, "1", str(output))
+
+    with open(output) as f:
+        results = json.load(f)
+    assert results["submitted"] + results["skipped"] == 2
+    assert results["confirmed"] == results["submitted"]
+    assert not results["reverts"]
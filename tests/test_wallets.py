@@ -0,0 +1,29 @@
+import sqlite3
+
+from scripts.indexer import schema
+from scripts.wallets import WalletPredictor, loadKnownWallets
+
+factory = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+rentable = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+user = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+other = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+oldWallet = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+
+
+def test_known_wallets(tmp_path):
+    dbPath = str(tmp_path / "index.sqlite")
+    db = sqlite3.connect(dbPath)
+    db.executescript(schema)
+    db.execute("INSERT INTO wallets VALUES (?, ?, ?)", (user, oldWallet, 1))
+    db.commit()
+    db.close()
+
+    predictor = WalletPredictor(
+        factory, rentable, knownWallets=loadKnownWallets(dbPath)
+    )
+    wallets = predictor.predictMany([user, other.lower()])
+
+    # wallet of the previous factory kept, CREATE2 address for the others
+    assert wallets[user] == oldWallet
+    assert wallets[other] == predictor.predict(other)
+    assert wallets[other] != oldWallet
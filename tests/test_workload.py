@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from scripts.workload import checkBuild
+
+
+def test_check_current_build():
+    checkBuild(os.getcwd())
+
+
+def test_check_incompatible_build(tmp_path):
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    (scripts / "deploy_testnet.py").write_text("def deploy(governance):\n    pass\n")
+
+    with pytest.raises(ValueError):
+        checkBuild(str(tmp_path))
+
+    (scripts / "deploy_testnet.py").write_text(
+        "def deploy(engine, governance, operator, feeCollector):\n    pass\n"
+    )
+    # no TxEngine
+    with pytest.raises(ValueError):
+        checkBuild(str(tmp_path))
+
+    (scripts / "tx_engine.py").write_text("")
+    checkBuild(str(tmp_path))